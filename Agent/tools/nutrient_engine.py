@@ -0,0 +1,146 @@
+from db.nutrition_matrix import NutritionMatrix, get_nutrition_matrix, DEFAULT_REFERENCE_G
+from model.domain.meal_plan import NutrientData, WeeklyMealPlan
+from model.domain.quantity import parse_quantity, GRAM_FACTORS
+from typing import Any, Dict, List, Tuple
+import functools
+import numpy as np
+
+
+"""
+nutrient engine:
+    WeeklyMealPlan(일 -> 식사 -> FoodItem)의 영양소 합계를 배열 연산으로 계산
+        1. 식단의 모든 음식 이름을 영양 행렬 행 번호로 한 번에 변환
+        2. 음식별 양을 기준량 대비 배율로 환산
+        3. 식사별 -> 일별 -> 주간 합계를 np.add.at으로 누적
+"""
+
+# NutrientData(9가지 영양소) 필드 순서
+NUTRIENT_FIELDS = list(NutrientData.model_fields)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_amount(food_amount: str) -> Tuple[float, bool]:
+    """
+    음식 양을 (수치, 인분 여부)로 해석
+    무게/부피 단위는 g으로 환산하고, 그 외 단위(인분, 개, 공기 등)나 단위 없음은 인분으로 본다.
+    해석할 수 없으면 1인분으로 간주한다.
+    """
+    amount, unit = parse_quantity(food_amount)
+    if amount is None:
+        return 1.0, True
+    if unit in GRAM_FACTORS:
+        return amount * GRAM_FACTORS[unit], False
+    return amount, True
+
+
+class PlanNutrientTotals:
+    """식단 영양소 합계, 각 배열의 열 순서는 columns를 따른다"""
+
+    def __init__(
+            self,
+            plan: WeeklyMealPlan,
+            columns: List[str],
+            meal_totals: np.ndarray,
+            day_totals: np.ndarray,
+            week_total: np.ndarray,
+            missing_foods: List[str]):
+        self.plan = plan
+        self.columns = columns
+        self.meal_totals = meal_totals
+        self.day_totals = day_totals
+        self.week_total = week_total
+        self.missing_foods = missing_foods
+
+    def _to_nutrient_data(self, row: np.ndarray) -> NutrientData:
+        values = dict(zip(self.columns, row.tolist()))
+        return NutrientData(**{field: values[field] for field in NUTRIENT_FIELDS})
+
+    def day(self, index: int) -> NutrientData:
+        """index번째 날의 9가지 영양소 합계"""
+        return self._to_nutrient_data(self.day_totals[index])
+
+    def week(self) -> NutrientData:
+        """주간 9가지 영양소 합계"""
+        return self._to_nutrient_data(self.week_total)
+
+    def to_dict(self) -> Dict[str, Any]:
+        days = []
+        meal_index = 0
+        for day_index, daily_plan in enumerate(self.plan.days):
+            meals = []
+            for meal in daily_plan.meals:
+                meals.append({
+                    "time_slot": meal.time_slot.isoformat(timespec="minutes"),
+                    "nutrients": self._to_nutrient_data(self.meal_totals[meal_index]).model_dump(),
+                })
+                meal_index += 1
+            days.append({
+                "day": daily_plan.day.isoformat(),
+                "nutrients": self.day(day_index).model_dump(),
+                "meals": meals,
+            })
+        return {
+            "days": days,
+            "week": self.week().model_dump(),
+            "missing_foods": self.missing_foods,
+        }
+
+
+class NutrientAggregator:
+    """영양 행렬 기반 식단 영양소 합계 계산기"""
+
+    def __init__(self, matrix: NutritionMatrix | None = None):
+        self.matrix = matrix if matrix is not None else get_nutrition_matrix()
+
+    def aggregate(self, plan: WeeklyMealPlan) -> PlanNutrientTotals:
+        """식사별, 일별, 주간 영양소 합계 계산 (24가지 영양소 전체)"""
+        matrix = self.matrix
+
+        names = []
+        amounts = []
+        is_serving = []
+        item_meal = []
+        meal_day = []
+        for day_index, daily_plan in enumerate(plan.days):
+            for meal in daily_plan.meals:
+                meal_index = len(meal_day)
+                meal_day.append(day_index)
+                for item in meal.food_list:
+                    amount, serving = _parse_amount(item.food_amount)
+                    names.append(item.food_name)
+                    amounts.append(amount)
+                    is_serving.append(serving)
+                    item_meal.append(meal_index)
+
+        n_columns = len(matrix.columns)
+        rows = matrix.rows_by_names(names)
+        found = rows >= 0
+        # 행렬에 있는 음식만 계산 (없는 음식은 0으로 합산, 행렬이 비어 있어도 인덱싱하지 않음)
+        matched = np.flatnonzero(found)
+        matched_rows = rows[matched]
+
+        # 기준량 대비 배율: g 단위는 양/기준량, 인분 단위는 인분 수 * 1회 섭취량/기준량
+        reference_g = matrix.reference_g[matched_rows]
+        reference_g = np.where(np.isnan(reference_g), DEFAULT_REFERENCE_G, reference_g)
+        serving_g = matrix.serving_g[matched_rows]
+        serving_g = np.where(np.isnan(serving_g), reference_g, serving_g)
+        amounts = np.asarray(amounts, dtype=np.float32)[matched]
+        grams = np.where(np.asarray(is_serving, dtype=bool)[matched], amounts * serving_g, amounts)
+        scale = grams / reference_g
+
+        # 합산은 float64로 해서 float32 저장값의 반올림 오차가 누적되지 않게 함
+        item_values = np.where(matrix.missing[matched_rows], 0.0, matrix.values[matched_rows].astype(np.float64)) * scale[:, None]
+
+        meal_totals = np.zeros((len(meal_day), n_columns), dtype=np.float64)
+        np.add.at(meal_totals, np.asarray(item_meal, dtype=np.int64)[matched], item_values)
+        day_totals = np.zeros((len(plan.days), n_columns), dtype=np.float64)
+        np.add.at(day_totals, np.asarray(meal_day, dtype=np.int64), meal_totals)
+
+        return PlanNutrientTotals(
+            plan=plan,
+            columns=matrix.columns,
+            meal_totals=meal_totals,
+            day_totals=day_totals,
+            week_total=day_totals.sum(axis=0),
+            missing_foods=list(dict.fromkeys(name for name, ok in zip(names, found) if not ok)),
+        )
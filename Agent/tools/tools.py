@@ -6,7 +6,10 @@ from pydantic import BaseModel, Field
 from datetime import time, date
 
 from db.db_manager import DBManager
+from model.domain.meal_plan import NutrientData, FoodItem, Meal, DailyPlan, WeeklyMealPlan
+from Agent.tools.nutrient_engine import NutrientAggregator
 from qdrant_manager import qdrant_manager
+import numpy as np
 
 
 # @tool
@@ -183,19 +186,6 @@ def get_food_nutrient(food_name: str) -> Dict[str, float | None] | str:
         return f"'{food_name}'에 대한 영양 정보를 찾는 데 실패했습니다. {e}"
 
 
-class NutrientData(BaseModel):
-    """사용자의 일일 권장 영양소 섭취량 데이터."""
-    energy_kcal: float = Field(..., description="권장 일일 에너지 섭취량 (kcal).")
-    protein_g: float = Field(..., description="권장 일일 단백질 섭취량 (g).")
-    fat_g: float = Field(..., description="권장 일일 지방 섭취량 (g).")
-    carbohydrate_g: float = Field(..., description="권장 일일 탄수화물 섭취량 (g).")
-    sugars_g: float = Field(..., description="권장 일일 당류 섭취량 (g).")
-    sodium_mg: float = Field(..., description="권장 일일 나트륨 섭취량 (mg).")
-    cholesterol_mg: float = Field(..., description="권장 일일 콜레스테롤 섭취량 (mg).")
-    saturated_fat_g: float = Field(..., description="권장 일일 포화지방 섭취량 (g).")
-    trans_fat_g: float = Field(..., description="권장 일일 트랜스지방 섭취량 (g).")
-
-
 @tool
 def format_nutrient_json(nutrient_data: NutrientData) -> Dict:
     """
@@ -207,47 +197,33 @@ def format_nutrient_json(nutrient_data: NutrientData) -> Dict:
     return nutrient_data.model_dump()
 
 @tool
-def calculate_nutrient_sum(nutrient_data: List[NutrientData]) -> NutrientData:
+def calculate_nutrient_sum(nutrient_data: List[NutrientData]) -> Dict:
     """
     일일 권장 영양소 섭취량 데이터를 합산하여 일일 영양 정보를 계산합니다.
     """
-    total_nutrient_data = NutrientData()
-    for nutrient in nutrient_data:
-        total_nutrient_data.energy_kcal += nutrient.energy_kcal if nutrient.energy_kcal is not None else 0
-        total_nutrient_data.protein_g += nutrient.protein_g if nutrient.protein_g is not None else 0
-        total_nutrient_data.fat_g += nutrient.fat_g if nutrient.fat_g is not None else 0
-        total_nutrient_data.carbohydrate_g += nutrient.carbohydrate_g if nutrient.carbohydrate_g is not None else 0
-        total_nutrient_data.sugars_g += nutrient.sugars_g if nutrient.sugars_g is not None else 0
-        total_nutrient_data.sodium_mg += nutrient.sodium_mg if nutrient.sodium_mg is not None else 0
-        total_nutrient_data.cholesterol_mg += nutrient.cholesterol_mg if nutrient.cholesterol_mg is not None else 0
-        total_nutrient_data.saturated_fat_g += nutrient.saturated_fat_g if nutrient.saturated_fat_g is not None else 0
-        total_nutrient_data.trans_fat_g += nutrient.trans_fat_g if nutrient.trans_fat_g is not None else 0
-    return total_nutrient_data.model_dump()
-
-# 음식 이름과 영양 정보를 함께 담을 Pydantic 모델
-class FoodItem(BaseModel):
-    """식단 내의 단일 음식 항목입니다. 이름과 함께 9가지 영양 정보를 포함합니다."""
-    food_name: str = Field(..., description="음식의 이름입니다.")
-    food_amount: str = Field(..., description="섭취할 음식의 양입니다.")
-
-# 각 식사를 나타내는 Pydantic 모델 (food_list 타입 변경)
-class Meal(BaseModel):
-    """단일 식사에 대한 상세 정보입니다."""
-    time_slot: time = Field(..., description="식사 시간입니다. 'HH:MM' 형식의 분 단위 시간으로 표시됩니다 (예: '13:00').")
-    food_list: List[FoodItem] = Field(..., description="해당 식사에 포함되는 음식 목록입니다.")
-
-# 하루의 식단 계획을 나타내는 Pydantic 모델
-class DailyPlan(BaseModel):
-    """하루의 식단 계획 정보입니다."""
-    day: date = Field(..., description="해당 식단 계획의 날짜입니다. 'YYYY-MM-DD' 형식의 일단위 날짜로 표시됩니다 (예: '2025-06-23').")
-    meals: List[Meal] = Field(..., description="해당 요일의 식사 목록입니다.")
-    nutrients: NutrientData = Field(..., description="해당 날짜의 9가지 영양 정보입니다.")
-
-# 주간 식단 계획 전체를 나타내는 Pydantic 모델
-class WeeklyMealPlan(BaseModel):
-    """7일간의 주간 식단 계획 전체입니다."""
-    days: List[DailyPlan] = Field(..., description="각 요일의 식단 계획 목록입니다. 총 7개의 DailyPlan 객체를 포함해야 합니다.")
+    fields = list(NutrientData.model_fields)
+    values = np.array(
+        [[getattr(nutrient, field) for field in fields] for nutrient in nutrient_data],
+        dtype=np.float64,
+    ).reshape(-1, len(fields))
+    totals = np.nansum(values, axis=0)
+    return NutrientData(**dict(zip(fields, totals.tolist()))).model_dump()
+
+
+@tool
+def calculate_meal_plan_nutrients(meal_plan: WeeklyMealPlan) -> Dict[str, Any]:
+    """
+    주간 식단 계획의 식사별, 일별, 주간 9가지 영양 정보 합계를 계산합니다.
+    각 음식의 양(예: '300g', '1인분')을 영양성분 기준량에 맞춰 환산해 합산합니다.
+
+    Args:
+        meal_plan: 합계를 계산할 WeeklyMealPlan 객체입니다.
 
+    Returns:
+        {"days": [{"day": ..., "nutrients": {...}, "meals": [...]}], "week": {...}, "missing_foods": [...]}
+        missing_foods는 영양 정보를 찾지 못해 합계에서 제외된 음식 이름 목록입니다.
+    """
+    return NutrientAggregator().aggregate(meal_plan).to_dict()
 
 @tool
 def generate_weekly_meal_plan(meal_plan: WeeklyMealPlan) -> Dict[str, Any]:
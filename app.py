@@ -4,16 +4,43 @@ import sys
 # 프로젝트 루트 경로를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from fastapi import FastAPI, Request
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 import uvicorn
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+from db.metrics import DBMetricsMiddleware
+from service.admission import AdmissionControlMiddleware, RateLimit
+from service.password_service import password_service
+from service.oauth_client import google_oauth_client
+from service.email_sender import email_worker, EMAIL_WORKER_ENABLED
+from service.login_log_writer import login_event_writer
+from db.tag_bitmap_index import refresh_tag_bitmap_index
 from router.user.user_router import user_router
 from router.food.food_router import food_router
 from router.agent.agent_router import agent_router
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 서버 성능에 맞춰 bcrypt cost 조정 (벤치마크는 스레드 풀에서)
+    await password_service.autotune()
+    await google_oauth_client.start()
+    await login_event_writer.start()
+    # 태그 비트맵 인덱스는 백그라운드 스레드에서 미리 생성
+    refresh_tag_bitmap_index()
+    if EMAIL_WORKER_ENABLED:
+        await email_worker.start()
+    yield
+    await email_worker.stop()
+    # 버퍼에 남은 로그인 기록 저장
+    await login_event_writer.stop()
+    await google_oauth_client.aclose()
+    password_service.shutdown()
+
 app = FastAPI(
+    lifespan=lifespan,
     title="AI Agent API",
     description="AI Agent API",
     version="0.1.0",
@@ -22,6 +49,22 @@ app = FastAPI(
     openapi_url="/openapi.json",
 )
 
+# DB 쿼리를 요청한 라우트별로 집계
+app.add_middleware(DBMetricsMiddleware)
+
+# 라우트별 rate limit (rate: 초당 허용 요청, burst: 연속 허용 요청) 및 과부하 시 요청 차단
+# 나중에 추가한 미들웨어가 바깥쪽이므로 거절된 요청은 DB 계측까지 가지 않음
+app.add_middleware(AdmissionControlMiddleware, rules={
+    "/user/login": [RateLimit("ip", rate=1, burst=20), RateLimit("account", rate=5 / 60, burst=5)],
+    "/user/register": [RateLimit("ip", rate=0.2, burst=5)],
+    "/user/verify/email": [RateLimit("ip", rate=0.1, burst=5), RateLimit("account", rate=1 / 60, burst=3)],
+    "/user/verify/confirm": [RateLimit("ip", rate=0.5, burst=10), RateLimit("account", rate=5 / 60, burst=5)],
+    "/user/auth/google": [RateLimit("ip", rate=1, burst=20)],
+    "/user/auth/google/callback": [RateLimit("ip", rate=1, burst=20)],
+    "/user/oauth/login": [RateLimit("ip", rate=1, burst=10)],
+    "/user/oauth/register": [RateLimit("ip", rate=0.2, burst=5)],
+})
+
 # 정적 파일 설정
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -50,5 +93,10 @@ async def register_page(request: Request):
 async def dashboard_page(request: Request):
     return templates.TemplateResponse("dashboard.html", {"request": request})
 
+# Prometheus 수집용 (커넥션 풀, 쿼리 지표)
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
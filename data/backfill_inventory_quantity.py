@@ -0,0 +1,95 @@
+import sys
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from db.database import engine
+from db.tables.user_table import UserFoodInventory
+from model.domain.quantity import parse_quantity_columns
+from sqlalchemy import and_, bindparam, inspect, or_, select, text, update
+import math
+
+"""
+user_food_inventory 수량 컬럼 채우기 (1회성 작업, 다시 실행해도 안전)
+    amount / unit / amount_g 컬럼과 (uuid, expired) 인덱스가 없으면 추가하고
+    기존 행의 quantity 원문을 해석해 채운다. 기본 키 순서로 batch_size개씩 나눠 커밋한다.
+"""
+
+
+def _same_amount(stored: float | None, parsed: float | None) -> bool:
+    """FLOAT 컬럼은 단정밀도로 저장되므로 읽어온 값과 해석한 값을 근사 비교"""
+    if stored is None or parsed is None:
+        return stored is None and parsed is None
+    return math.isclose(stored, parsed, rel_tol=1e-6, abs_tol=1e-6)
+
+
+def ensure_inventory_columns(connection) -> None:
+    """수량 컬럼과 (uuid, expired) 인덱스가 없으면 추가"""
+    inspector = inspect(connection)
+
+    columns = {column["name"] for column in inspector.get_columns("user_food_inventory")}
+    additions = [
+        f"ADD COLUMN {name} {ddl}"
+        for name, ddl in (("amount", "FLOAT NULL"), ("unit", "VARCHAR(20) NULL"), ("amount_g", "FLOAT NULL"))
+        if name not in columns
+    ]
+    if additions:
+        connection.execute(text(f"ALTER TABLE user_food_inventory {', '.join(additions)}"))
+        print(f"user_food_inventory 컬럼 추가: {len(additions)}개")
+
+    indexes = inspector.get_indexes("user_food_inventory")
+    if not any(index["column_names"] == ["uuid", "expired"] for index in indexes):
+        connection.execute(text("CREATE INDEX ix_user_food_inventory_uuid_expired ON user_food_inventory (uuid, expired)"))
+        print("user_food_inventory (uuid, expired) 인덱스 추가")
+
+
+def backfill_inventory_quantity(batch_size: int = 1000) -> int:
+    """quantity를 해석해 amount / unit / amount_g 채우기, 갱신한 행 수 반환"""
+    # DDL은 MySQL에서 암묵적으로 커밋되므로 따로 실행
+    with engine.begin() as connection:
+        ensure_inventory_columns(connection)
+
+    table = UserFoodInventory.__table__
+    update_stmt = (
+        update(table)
+        .where(table.c.uuid == bindparam("b_uuid"), table.c.food_id == bindparam("b_food_id"))
+        .values(amount=bindparam("amount"), unit=bindparam("unit"), amount_g=bindparam("amount_g"))
+    )
+
+    updated = 0
+    last = None
+    while True:
+        query = select(
+            table.c.uuid, table.c.food_id, table.c.quantity, table.c.amount, table.c.unit, table.c.amount_g,
+        ).order_by(table.c.uuid, table.c.food_id).limit(batch_size)
+        if last is not None:
+            query = query.where(or_(table.c.uuid > last[0], and_(table.c.uuid == last[0], table.c.food_id > last[1])))
+
+        with engine.begin() as connection:
+            rows = connection.execute(query).all()
+            if not rows:
+                break
+            changes = []
+            for row in rows:
+                parsed = parse_quantity_columns(row.quantity)
+                if not (
+                    row.unit == parsed["unit"]
+                    and _same_amount(row.amount, parsed["amount"])
+                    and _same_amount(row.amount_g, parsed["amount_g"])
+                ):
+                    changes.append({"b_uuid": row.uuid, "b_food_id": row.food_id, **parsed})
+            if changes:
+                connection.execute(update_stmt, changes)
+        updated += len(changes)
+        last = (rows[-1].uuid, rows[-1].food_id)
+        print(f"{last[0]}까지 처리 (갱신 {updated}행)")
+
+    return updated
+
+
+if __name__ == "__main__":
+    print("user_food_inventory 수량 컬럼 채우기 시작...")
+    count = backfill_inventory_quantity()
+    print(f"user_food_inventory 수량 컬럼 채우기 완료! ({count}행 갱신)")
@@ -0,0 +1,91 @@
+import sys
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from db.database import engine
+from db.tables.food_table import *
+from db.tag_dictionary import tag_dictionary
+from db.db_mixin.food_mixin import food_cache
+from sqlalchemy import inspect, text
+
+"""
+food_tag 중복 병합 (1회성 작업)
+    이전 update_food_tags는 (음식, 태그) 쌍마다 food_tag 행을 새로 만들었으므로
+    같은 tag_name의 행들을 가장 작은 tag_id 하나로 합치고 연결을 옮긴 뒤
+    tag_name unique 인덱스와 food_info_tag.tag_id 인덱스를 추가한다.
+"""
+
+# tag_name별 남길 tag_id
+KEEP_TAGS = """
+    SELECT tag_name, MIN(tag_id) AS keep_id
+    FROM food_tag
+    GROUP BY tag_name
+"""
+
+
+def merge_duplicate_tags(connection) -> tuple[int, int]:
+    """중복 태그의 연결을 대표 태그로 옮기고 중복 행 삭제, (옮긴 연결 수, 삭제한 태그 수) 반환"""
+    connection.execute(text(f"CREATE TEMPORARY TABLE tag_merge_map AS {KEEP_TAGS}"))
+    connection.execute(text("ALTER TABLE tag_merge_map ADD PRIMARY KEY (keep_id), ADD INDEX (tag_name(191))"))
+
+    moved = connection.execute(text("""
+        INSERT IGNORE INTO food_info_tag (food_id, tag_id)
+        SELECT fit.food_id, m.keep_id
+        FROM food_info_tag fit
+        JOIN food_tag t ON t.tag_id = fit.tag_id
+        JOIN tag_merge_map m ON m.tag_name = t.tag_name
+        WHERE fit.tag_id <> m.keep_id
+    """)).rowcount
+    connection.execute(text("""
+        DELETE fit FROM food_info_tag fit
+        JOIN food_tag t ON t.tag_id = fit.tag_id
+        JOIN tag_merge_map m ON m.tag_name = t.tag_name
+        WHERE fit.tag_id <> m.keep_id
+    """))
+    deleted = connection.execute(text("""
+        DELETE t FROM food_tag t
+        JOIN tag_merge_map m ON m.tag_name = t.tag_name
+        WHERE t.tag_id <> m.keep_id
+    """)).rowcount
+    connection.execute(text("DROP TEMPORARY TABLE tag_merge_map"))
+    return moved, deleted
+
+
+def ensure_tag_indexes(connection) -> None:
+    """병합 후 tag_name unique 인덱스와 tag_id 인덱스가 없으면 추가"""
+    inspector = inspect(connection)
+
+    food_tag_indexes = inspector.get_indexes("food_tag")
+    if not any(index["unique"] and index["column_names"] == ["tag_name"] for index in food_tag_indexes):
+        connection.execute(text("ALTER TABLE food_tag ADD UNIQUE INDEX tag_name (tag_name)"))
+        print("food_tag.tag_name unique 인덱스 추가")
+
+    food_info_tag_indexes = inspector.get_indexes("food_info_tag")
+    if not any(index["column_names"][:1] == ["tag_id"] for index in food_info_tag_indexes):
+        connection.execute(text("CREATE INDEX ix_food_info_tag_tag_id ON food_info_tag (tag_id)"))
+        print("food_info_tag.tag_id 인덱스 추가")
+
+
+def compact_food_tags() -> None:
+    print("food_tag 중복 병합 시작...")
+
+    with engine.begin() as connection:
+        before = connection.execute(text("SELECT COUNT(*) FROM food_tag")).scalar()
+        moved, deleted = merge_duplicate_tags(connection)
+        after = connection.execute(text("SELECT COUNT(*) FROM food_tag")).scalar()
+    print(f"태그 {before}개 -> {after}개 (중복 {deleted}개 삭제, 연결 {moved}개 이동)")
+
+    # DDL은 MySQL에서 암묵적으로 커밋되므로 병합 트랜잭션이 끝난 뒤 실행
+    with engine.begin() as connection:
+        ensure_tag_indexes(connection)
+
+    tag_dictionary.clear()
+    food_cache.clear()
+    print("food_tag 중복 병합 완료!")
+
+
+if __name__ == "__main__":
+    compact_food_tags()
@@ -2,7 +2,6 @@ import sys
 from pathlib import Path
 import pandas as pd
 import numpy as np
-import re
 import json
 
 project_root = str(Path(__file__).parent.parent)
@@ -10,13 +9,31 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from db.database import engine, Base, root_engine, MYSQL_DATABASE, MYSQL_USER
-from sqlalchemy import text
+from sqlalchemy import text, select, insert
 from db.tables.user_table import *
 from db.tables.food_table import *
-from sqlalchemy.exc import IntegrityError
+from db.tables.migration_table import *
+from db.tables.email_table import *
 from db.db_manager import DBManager
+from db.nutrition_matrix import rebuild_nutrition_matrix
+from db.login_log_partitions import partition_login_log
 
-def create_all_tables(food_data_path, food_tag_data_path, replace_db=False):
+
+def prepare_food_records(chunk: pd.DataFrame, food_tag_data: dict) -> list[dict]:
+    """CSV 청크를 create_foods_bulk 입력 레코드로 변환 (컬럼 단위 변환)"""
+    chunk = chunk.copy()
+    chunk['reference_date'] = pd.to_datetime(chunk['reference_date'], errors='coerce').dt.date
+    # 지수 표기(2.01304E+12)로 저장된 품목제조보고번호를 정수로 변환
+    chunk['mfg_report_no'] = pd.to_numeric(chunk['mfg_report_no'], errors='coerce').round().astype('Int64')
+    chunk = chunk.astype(object).where(chunk.notna(), None)
+
+    records = chunk.to_dict('records')
+    for record in records:
+        record['tags'] = food_tag_data.get(record['food_id'], [])
+    return records
+
+
+def create_all_tables(food_data_path, food_tag_data_path, replace_db=False, chunk_size=1000):
     db = DBManager()
 
     with open(food_tag_data_path, 'r', encoding='utf-8') as f:
@@ -39,124 +56,80 @@ def create_all_tables(food_data_path, food_tag_data_path, replace_db=False):
     Base.metadata.create_all(engine)
     print("모든 데이터베이스 테이블 생성 완료!")
 
+    # login_log 월 단위 파티션 (이후 유지 보수는 data/login_log_maintenance.py)
+    with engine.begin() as connection:
+        if partition_login_log(connection):
+            print("login_log 월 단위 파티션 생성 완료!")
+
     if food_data_path is None:
         return
 
     print("음식 데이터 입력 시작...")
-    
-    # 데이터를 청크 단위로 읽기
-    chunk_size = 1000
+
+    # 청크 번호는 chunk_size에 따라 다른 행을 가리키므로 작업 이름에 포함
+    job_prefix = f"food_import:{Path(food_data_path).name}"
+    job_name = f"{job_prefix}:chunk_size={chunk_size}"
+    with db as manager:
+        completed_chunks = set(manager.session.scalars(
+            select(MigrationCheckpoint.chunk_index).where(MigrationCheckpoint.job_name == job_name)
+        ))
+        other_jobs = manager.session.scalars(
+            select(MigrationCheckpoint.job_name).distinct()
+            .where(MigrationCheckpoint.job_name.startswith(job_prefix), MigrationCheckpoint.job_name != job_name)
+        ).all()
+    if completed_chunks:
+        print(f"이전 실행에서 완료된 청크 {len(completed_chunks)}개를 건너뜁니다.")
+    elif other_jobs:
+        # 이미 들어간 음식은 중복으로 걸러지므로 처음부터 다시 진행해도 안전
+        print(f"[경고] 다른 청크 크기로 진행된 기록이 있어 처음부터 진행합니다: {', '.join(other_jobs)}")
+
     total_rows = 0
-    
-    for chunk in pd.read_csv(food_data_path, encoding="utf-8", chunksize=chunk_size):
-        chunk = chunk.copy()
-        chunk = chunk.replace({pd.NA: None})
-        
-        # 현재 청크 내에서의 중복 제거 (이전에도 했지만 유지)
-        food_info_df_for_unique_check = chunk.loc[:, ['food_id', 'food_name', 'data_type_code']]
-        food_info_df_unique_in_chunk = food_info_df_for_unique_check.drop_duplicates(subset=['food_name'], keep='first')
-        
-        # 현재 청크에서 유니크한 food_id 리스트
-        unique_food_ids_in_chunk = food_info_df_unique_in_chunk['food_id'].tolist()
-        filtered_chunk_for_all_tables = chunk[chunk['food_id'].isin(unique_food_ids_in_chunk)].copy()
-
-        inserted_food_ids = []
-        with db as manager:
-            for index, row in food_info_df_unique_in_chunk.iterrows():
-                try:
-                    # FoodInfo 테이블에 한 행씩 데이터 삽입하여 중복 시 건너뛰기
-                    row_df = pd.DataFrame([row])
-                    row_df.to_sql('food_info', engine, if_exists='append', index=False)
-                    inserted_food_ids.append(row['food_id'])
-                except IntegrityError as e:
-                    if "Duplicate entry" in str(e) and "for key 'food_info.food_name'" in str(e):
-                        duplicate_food_name_match = re.search(r"Duplicate entry '(.*?)' for key 'food_info.food_name'", str(e))
-                        duplicate_food_name = duplicate_food_name_match.group(1) if duplicate_food_name_match else "알 수 없음"
-
-                        # 데이터베이스에서 이미 존재하는 food_id 조회
-                        existing_food_id = None
-                        
-                        food = manager.get_food_by_name(duplicate_food_name)
-                        if food:
-                            existing_food_id = food.food_id
-
-                        print(f"[경고] 중복된 food_name 발견, 건너뜀: '{duplicate_food_name}'")
-                        print(f"  현재 데이터의 food_id: {row['food_id']}")
-                        print(f"  이미 데이터베이스에 있는 food_id: {existing_food_id}")
-                    else:
-                        print(f"[오류] 데이터 삽입 중 IntegrityError 발생: {e}")
-                        return # 심각한 오류이므로 중단
-                except Exception as e:
-                    print(f"[오류] FoodInfo 삽입 중 알 수 없는 오류 발생: {e}")
-                    return # 심각한 오류이므로 중단
-
-        # 실제로 삽입된 food_id를 기준으로 다른 테이블 데이터 필터링
-        final_filtered_chunk = filtered_chunk_for_all_tables[filtered_chunk_for_all_tables['food_id'].isin(inserted_food_ids)].copy()
-        # tags_dict = food_tag_data[list(food_tag_data.keys()).isin(final_filtered_chunk['food_id'])]
-        tags_dict = {}
-        for food_id in final_filtered_chunk['food_id']:
-            tags_dict[food_id] = food_tag_data[food_id]
-
-        if final_filtered_chunk.empty:
-            print("현재 청크에서 삽입할 유니크한 food_info 데이터가 없어 다음 청크로 이동합니다.")
-            continue
-
-        try:
-            # FoodCategory 테이블에 데이터 삽입
-            category_df = final_filtered_chunk.loc[:, ['food_id', 'major_category_name', 
-                               'medium_category_name', 'minor_category_name',
-                               'detail_category_name', 'representative_food_name']]
-            category_df.to_sql('food_categories', engine, if_exists='append', index=False)
-
-            # FoodSourceInfo 테이블에 데이터 삽입
-            source_info_df = final_filtered_chunk.loc[:, ['food_id', 'origin_name', 
-                                  'source_name', 'generation_method_name',
-                                  'reference_date']]
-            source_info_df.loc[:, 'reference_date'] = pd.to_datetime(source_info_df['reference_date']).dt.date
-            source_info_df.to_sql('food_source_info', engine, if_exists='append', index=False)
-
-            # FoodCompany 테이블에 데이터 삽입
-            company_df = final_filtered_chunk.loc[:, ['food_id', 'company_name', 'manufacturer_name', 
-                                 'origin_country_name', 'importer_name', 
-                                 'distributor_name', 'mfg_report_no']]
-            # Convert scientific notation to integer for mfg_report_no
-            company_df.loc[:, 'mfg_report_no'] = pd.to_numeric(company_df['mfg_report_no'], errors='coerce')
-            company_df = company_df.replace({np.nan: None})
-            
-            # food_id를 제외한 모든 컬럼이 None인 행 제외
-            columns_to_check = [col for col in company_df.columns if col != 'food_id']
-            company_df = company_df[~company_df[columns_to_check].isna().all(axis=1)]
-            
-            if not company_df.empty:
-                company_df.to_sql('food_companies', engine, if_exists='append', index=False)
-
-            # FoodNutrition 테이블에 데이터 삽입
-            nutrition_df = final_filtered_chunk.loc[:, ['food_id', 'weight', 'serving_size_g', 'nutrient_reference_amount_g',
-                               'energy_kcal', 'moisture_g', 'protein_g', 'fat_g', 'ash_g',
-                               'carbohydrate_g', 'sugars_g', 'dietary_fiber_g', 'calcium_mg',
-                               'iron_mg', 'phosphorus_mg', 'potassium_mg', 'sodium_mg',
-                               'vitamin_a_ug_rae', 'retinol_ug', 'beta_carotene_ug',
-                               'thiamin_mg', 'riboflavin_mg', 'niacin_mg', 'vitamin_c_mg',
-                               'vitamin_d_ug', 'cholesterol_mg', 'saturated_fat_g', 'trans_fat_g']]
-            nutrition_df.to_sql('food_nutrition', engine, if_exists='append', index=False)
-
-            # FoodTag 테이블에 데이터 삽입
-            with db as manager:
-                for food_id, tag_names in tags_dict.items():
-                    manager.update_food_tags(food_id, tag_names)
+    total_created = 0
 
-        except Exception as e:
-            print(f"[오류] 관련 테이블 데이터 입력 중 오류 발생: {e}")
-            print(f"오류 발생 chunk의 head:\n{final_filtered_chunk.head()}")
-            return
+    with pd.read_csv(food_data_path, encoding="utf-8", chunksize=chunk_size) as reader:
+        for chunk_index, chunk in enumerate(reader):
+            total_rows += len(chunk)
+            if chunk_index in completed_chunks:
+                continue
 
-        total_rows += len(chunk)
-        print(f"{total_rows}개 데이터 처리 완료")
+            records = prepare_food_records(chunk, food_tag_data)
+
+            with db as manager:
+                # 기존 food_name/food_id와의 중복은 청크당 한 번의 조회로 걸러지고 INSERT IGNORE로 저장됨
+                results = manager.create_foods_bulk(records, chunk_size=chunk_size)
+                errors = [result for result in results if result.status in ("error", "invalid")]
+                if errors:
+                    print(f"[오류] {chunk_index}번 청크 입력 중 오류 발생: {errors[0].food_id} {errors[0].detail}")
+                    print("문제를 해결한 뒤 다시 실행하면 이 청크부터 이어서 진행합니다.")
+                    return
+
+                created = sum(result.status == "created" for result in results)
+                conflicts = [result for result in results if result.status == "conflict"]
+                for result in conflicts[:5]:
+                    print(f"[경고] 중복된 음식 건너뜀: {result.food_id} '{result.food_name}'")
+                if len(conflicts) > 5:
+                    print(f"[경고] 그 외 중복 {len(conflicts) - 5}건 건너뜀")
+
+                manager.session.execute(insert(MigrationCheckpoint).values(
+                    job_name=job_name,
+                    chunk_index=chunk_index,
+                    row_count=len(chunk),
+                    created_count=created,
+                ))
+                manager.session.commit()
+
+            total_created += created
+            print(f"{total_rows}개 데이터 처리 완료 (이번 실행에서 생성 {total_created}개)")
 
     print("음식 데이터 입력 완료!")
 
+    # 영양 분석용 열 지향 스냅샷 재생성
+    matrix = rebuild_nutrition_matrix()
+    print(f"영양 행렬 생성 완료: {len(matrix)}개 음식")
+
 
 if __name__ == "__main__":
     food_data_path = "data/foods/combine_data_cleaned.csv"
     food_tag_data_path = "data/foods/food_tags.json"
-    create_all_tables(food_data_path, food_tag_data_path, replace_db=True)
\ No newline at end of file
+    # 처음부터 다시 적재하려면 --replace-db, 기본은 중단된 지점부터 이어서 진행
+    create_all_tables(food_data_path, food_tag_data_path, replace_db="--replace-db" in sys.argv)
\ No newline at end of file
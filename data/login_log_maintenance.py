@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from db.database import engine
+from db.login_log_partitions import maintain_login_log, backfill_login_rollups
+
+"""
+login_log 보관 작업 (cron 등으로 매일 실행)
+    처음 실행하면 login_log를 월 단위 파티션 테이블로 변환
+    앞으로의 월 파티션 추가, 보관 기간(LOGIN_LOG_RETENTION_MONTHS)이 지난 파티션 삭제,
+    보관 기간(LOGIN_ROLLUP_RETENTION_MONTHS)이 지난 시간별 집계 삭제
+    --backfill-rollups: login_log 전체로 시간별 집계를 다시 계산 (집계 테이블을 처음 도입할 때 한 번)
+"""
+
+
+def main() -> None:
+    if "--backfill-rollups" in sys.argv:
+        with engine.begin() as connection:
+            rows = backfill_login_rollups(connection)
+        print(f"시간별 로그인 집계 재계산 완료 ({rows}행)")
+
+    added, dropped, purged = maintain_login_log(engine)
+    print(f"login_log 파티션 추가: {added or '없음'}")
+    print(f"login_log 파티션 삭제: {dropped or '없음'}")
+    print(f"만료된 시간별 집계 {purged}행 삭제")
+
+
+if __name__ == "__main__":
+    main()
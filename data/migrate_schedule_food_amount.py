@@ -0,0 +1,39 @@
+import sys
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from db.database import engine
+from sqlalchemy import inspect, text
+
+"""
+schedule_food 양 컬럼 추가 (1회성 작업, 다시 실행해도 안전)
+    unit / amount_text 컬럼을 추가하고 quantity를 NULL 허용으로 바꾼다.
+    (해석할 수 없는 양이나 단위가 섞여 합칠 수 없는 양은 수치 없이 원문만 저장)
+    기존 행은 수치만 있으므로 그대로 둔다.
+"""
+
+
+def migrate_schedule_food_amount(connection) -> int:
+    """빠진 컬럼 추가, 변경한 항목 수 반환"""
+    columns = {column["name"]: column for column in inspect(connection).get_columns("schedule_food")}
+    changes = [
+        f"ADD COLUMN {name} {ddl}"
+        for name, ddl in (("unit", "VARCHAR(20) NULL"), ("amount_text", "VARCHAR(255) NULL"))
+        if name not in columns
+    ]
+    if not columns["quantity"]["nullable"]:
+        changes.append("MODIFY quantity FLOAT NULL")
+    if changes:
+        connection.execute(text(f"ALTER TABLE schedule_food {', '.join(changes)}"))
+    return len(changes)
+
+
+if __name__ == "__main__":
+    print("schedule_food 양 컬럼 추가 시작...")
+    # DDL은 MySQL에서 암묵적으로 커밋됨
+    with engine.begin() as connection:
+        count = migrate_schedule_food_amount(connection)
+    print(f"schedule_food 양 컬럼 추가 완료! ({count}개 변경)")
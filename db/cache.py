@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+import threading
+import time
+
+"""
+cache:
+    TTLCache
+        크기 제한 LRU + TTL 캐시, 스레드 안전
+        hit / miss / eviction / expiration 카운터 제공
+"""
+
+_MISSING = object()
+
+
+class TTLCache:
+    """크기 제한 LRU + TTL 인메모리 캐시"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        """
+        Args:
+            maxsize: 최대 항목 수, 초과 시 가장 오래 사용하지 않은 항목부터 제거
+            ttl: 항목 유효 시간(초), None이면 만료 없음
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize는 1 이상이어야 합니다.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """항목 조회, 없거나 만료되었으면 default"""
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """항목 저장, ttl을 주면 캐시 기본값 대신 사용"""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """항목 제거 후 반환"""
+        with self._lock:
+            item = self._data.pop(key, _MISSING)
+        return default if item is _MISSING else item[1]
+
+    def clear(self) -> None:
+        """전체 항목 제거 (카운터는 유지)"""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계"""
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+        return item is not _MISSING and (item[0] is None or item[0] > time.monotonic())
@@ -1,5 +1,8 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from db.routing import ReplicaRouter, RoutingSession
+from db.metrics import InstrumentedQueuePool, InstrumentedAsyncQueuePool, instrument_engine
 from dotenv import load_dotenv
 import os
 
@@ -17,6 +20,24 @@ DATABASE_URL_ROOT = f'mysql+mysqlconnector://root:{MYSQL_ROOT_PASSWORD}@{MYSQL_H
 
 DATABASE_URL = f'mysql+mysqlconnector://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}'
 
+ASYNC_DATABASE_URL = f'mysql+aiomysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}'
+
+# 읽기 전용 복제본 목록: "host1:3306,host2:3306" (비어 있으면 모든 쿼리를 primary로)
+MYSQL_REPLICA_HOSTS = [host.strip() for host in os.getenv("MYSQL_REPLICA_HOSTS", "").split(",") if host.strip()]
+MYSQL_REPLICA_USER = os.getenv("MYSQL_REPLICA_USER", MYSQL_USER)
+MYSQL_REPLICA_PASSWORD = os.getenv("MYSQL_REPLICA_PASSWORD", MYSQL_PASSWORD)
+# 연결 오류로 제외된 복제본을 다시 확인하기까지의 시간(초)
+MYSQL_REPLICA_RETRY_INTERVAL = float(os.getenv("MYSQL_REPLICA_RETRY_INTERVAL", "30"))
+
+REPLICA_DATABASE_URLS = [
+    f'mysql+mysqlconnector://{MYSQL_REPLICA_USER}:{MYSQL_REPLICA_PASSWORD}@{host}/{MYSQL_DATABASE}'
+    for host in MYSQL_REPLICA_HOSTS
+]
+ASYNC_REPLICA_DATABASE_URLS = [
+    f'mysql+aiomysql://{MYSQL_REPLICA_USER}:{MYSQL_REPLICA_PASSWORD}@{host}/{MYSQL_DATABASE}'
+    for host in MYSQL_REPLICA_HOSTS
+]
+
 class Base(DeclarativeBase):
     pass
 
@@ -32,6 +53,7 @@ root_engine = create_engine(
 
 engine = create_engine(
     DATABASE_URL,
+    poolclass=InstrumentedQueuePool,  # checkout 대기 시간 계측 (db/metrics.py)
     pool_pre_ping=True,      # 연결 사용 전에 유효성 검사
     pool_size=10,            # 풀에 최소 10개의 연결 유지
     max_overflow=20,         # 최대 20개까지 추가 연결 허용
@@ -40,4 +62,80 @@ engine = create_engine(
 )
 
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+replica_engines = [
+    create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=3600,
+        pool_timeout=30,
+        connect_args={"connection_timeout": 5},
+    )
+    for url in REPLICA_DATABASE_URLS
+]
+
+instrument_engine(engine, "primary")
+for host, replica in zip(MYSQL_REPLICA_HOSTS, replica_engines):
+    instrument_engine(replica, f"replica:{host}")
+
+replica_router = ReplicaRouter(engine, replica_engines, retry_interval=MYSQL_REPLICA_RETRY_INTERVAL)
+
+
+# 복제본이 있으면 읽기는 복제본, 쓰기는 primary로 보내는 세션 사용
+if replica_engines:
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=RoutingSession, router=replica_router)
+else:
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+# FastAPI 라우트용 비동기 엔진 (이벤트 루프를 막지 않음)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_pre_ping=True,
+    pool_size=10,
+    max_overflow=20,
+    pool_recycle=3600,
+    pool_timeout=30,
+)
+
+
+async_replica_engines = [
+    create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=3600,
+        pool_timeout=30,
+        connect_args={"connect_timeout": 5},
+    )
+    for url in ASYNC_REPLICA_DATABASE_URLS
+]
+
+instrument_engine(async_engine.sync_engine, "async-primary")
+for host, replica in zip(MYSQL_REPLICA_HOSTS, async_replica_engines):
+    instrument_engine(replica.sync_engine, f"async-replica:{host}")
+
+# AsyncSession 내부의 동기 세션이 라우팅하므로 동기 엔진(sync_engine)을 넘김
+async_replica_router = ReplicaRouter(
+    async_engine.sync_engine,
+    [replica.sync_engine for replica in async_replica_engines],
+    retry_interval=MYSQL_REPLICA_RETRY_INTERVAL,
+)
+
+
+# 비동기 세션에서는 commit 후 지연 로딩이 불가능하므로 만료시키지 않음
+if async_replica_engines:
+    AsyncSessionLocal = async_sessionmaker(
+        autoflush=False,
+        expire_on_commit=False,
+        bind=async_engine,
+        sync_session_class=RoutingSession,
+        router=async_replica_router,
+    )
+else:
+    AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False, bind=async_engine)
@@ -4,7 +4,8 @@ import pandas as pd
 import numpy as np
 import os
 from dotenv import load_dotenv
-from contextlib import contextmanager
+from contextlib import contextmanager, asynccontextmanager
+import functools
 
 load_dotenv()
 
@@ -12,13 +13,18 @@ project_root = os.getenv("PROJECT_ROOT")
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from db.database import SessionLocal
+from db.database import SessionLocal, AsyncSessionLocal
+from db.routing import use_primary
+from db.db_mixin.session_mixin import begin_unit_of_work, end_unit_of_work
+from db.metrics import instrument_methods
 from db.tables.user_table import *
 from db.tables.food_table import *
 from db.db_mixin.user_mixin import UserMixin
 from db.db_mixin.food_mixin import FoodMixin
+from db.db_mixin.email_mixin import EmailMixin
 
-class DBManager(UserMixin, FoodMixin):
+@instrument_methods
+class DBManager(UserMixin, FoodMixin, EmailMixin):
     """
     데이터베이스 관리 클래스
     세션을 효율적으로 관리하며 음식 및 태그 정보를 다룹니다.
@@ -47,20 +53,120 @@ class DBManager(UserMixin, FoodMixin):
 
     @contextmanager
     def transaction(self):
-        """트랜잭션 컨텍스트 매니저"""
+        """
+        트랜잭션 컨텍스트 매니저 (unit of work)
+        안의 쓰기 메서드는 flush만 하고 블록 끝에서 한 번 커밋, 예외가 나면 블록 전체 롤백
+        안의 읽기도 primary에서 실행 (read-your-writes), 중첩되면 바깥 블록에 합류
+        """
         if self.session is None:
             self.session = SessionLocal()
+        use_primary(self.session)
+        if not begin_unit_of_work(self.session):
+            yield self
+            return
         try:
             yield self
             self.session.commit()
         except Exception as e:
             self.session.rollback()
             raise e
+        finally:
+            end_unit_of_work(self.session)
         
 def get_db_manager():
     with DBManager() as db_manager:
         yield db_manager
 
+
+class AsyncDBManager:
+    """
+    비동기 데이터베이스 관리 클래스
+    AsyncSession 위에서 DBManager(UserMixin, FoodMixin, EmailMixin)의 기능을 awaitable로 제공합니다.
+    각 메서드는 세션의 그린렛 안에서 동기 구현을 그대로 실행하므로 이벤트 루프를 막지 않습니다.
+    """
+
+    # awaitable로 노출하지 않는 DBManager 속성
+    _sync_only = {"check_session", "check_user_exists", "transaction", "savepoint"}
+
+    def __init__(self):
+        """AsyncDBManager 초기화"""
+        self.session = None
+
+    async def __aenter__(self):
+        """컨텍스트 매니저 진입 시 세션 시작"""
+        if self.session is None:
+            self.session = AsyncSessionLocal()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료 시 세션 종료"""
+        if exc_type is not None:
+            # 예외 발생 시 롤백
+            if self.session:
+                await self.session.rollback()
+
+        if self.session:
+            await self.session.close()
+            self.session = None
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        트랜잭션 컨텍스트 매니저 (unit of work)
+        안의 쓰기 메서드는 flush만 하고 블록 끝에서 한 번 커밋, 예외가 나면 블록 전체 롤백
+        안의 읽기도 primary에서 실행 (read-your-writes), 중첩되면 바깥 블록에 합류
+        """
+        if self.session is None:
+            self.session = AsyncSessionLocal()
+        use_primary(self.session)
+        if not begin_unit_of_work(self.session.sync_session):
+            yield self
+            return
+        try:
+            yield self
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        finally:
+            end_unit_of_work(self.session.sync_session)
+
+    @asynccontextmanager
+    async def savepoint(self):
+        """SAVEPOINT 구간, 안에서 예외가 나면 이 구간만 롤백하고 예외를 다시 던짐"""
+        if self.session is None:
+            raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 async with문 또는 transaction 컨텍스트 내에서 사용하세요.")
+        async with self.session.begin_nested():
+            yield self
+
+    async def run_sync(self, func, *args, **kwargs):
+        """동기 DBManager 함수를 AsyncSession의 동기 세션에 바인딩해 실행"""
+        if self.session is None:
+            raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 async with문 또는 transaction 컨텍스트 내에서 사용하세요.")
+
+        def call(sync_session):
+            manager = DBManager()
+            manager.session = sync_session
+            return func(manager, *args, **kwargs)
+
+        return await self.session.run_sync(call)
+
+    def __getattr__(self, name):
+        """DBManager의 공개 메서드를 같은 이름의 코루틴으로 노출"""
+        func = getattr(DBManager, name, None)
+        if name.startswith("_") or name in self._sync_only or not callable(func):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        @functools.wraps(func)
+        async def method(*args, **kwargs):
+            return await self.run_sync(func, *args, **kwargs)
+        return method
+
+
+async def get_async_db_manager():
+    async with AsyncDBManager() as db_manager:
+        yield db_manager
+
 class DBManagerTest:
     def __init__(self):
         self.db_manager = DBManager()
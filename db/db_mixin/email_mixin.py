@@ -0,0 +1,159 @@
+from db.tables.email_table import OutboundEmail, EmailVerification
+from db.db_mixin.session_mixin import SessionMixin, check_session
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Literal
+
+"""
+email:
+    enqueue         발송 대기열(outbound_email)에 추가
+    claim           발송할 이메일을 점유 (FOR UPDATE SKIP LOCKED, 여러 워커가 같은 행을 가져가지 않음)
+                    점유 시간(lease)이 지나도록 결과가 없으면(워커 중단) 다시 발송 대상이 됨
+    mark sent / mark failed (재시도 시각 또는 최종 실패)
+    count pending
+
+verification:
+    save            이메일 인증 코드 저장 (이메일당 하나, 다시 요청하면 덮어씀)
+    consume         코드가 일치하고 만료 전이면 삭제 (DELETE ... WHERE code = ?, 한 워커만 성공)
+    purge expired
+"""
+
+VerificationResult = Literal["ok", "missing", "expired", "mismatch"]
+
+
+class EmailMixin(SessionMixin):
+    """이메일 발송 대기열 DB입출력 기능 모음, 상속해서 사용"""
+
+    @check_session
+    def enqueue_email(self, recipient: str, subject: str, body_html: str) -> int:
+        """발송 대기열에 이메일 추가, id 반환"""
+        email = OutboundEmail(
+            recipient=recipient,
+            subject=subject,
+            body_html=body_html,
+            status="pending",
+            attempts=0,
+            next_attempt_at=datetime.now(),
+        )
+        self.session.add(email)
+        self.session.flush()
+        return email.id
+
+    @check_session
+    def claim_outbound_emails(self, batch_size: int = 50, lease_seconds: int = 60) -> List[Dict[str, Any]]:
+        """
+        발송할 이메일을 최대 batch_size개 점유
+        점유한 행은 status='sending', next_attempt_at=점유 만료 시각, attempts+1
+        """
+        now = datetime.now()
+        ids = list(self.session.scalars(
+            select(OutboundEmail.id)
+            .where(OutboundEmail.status.in_(("pending", "sending")), OutboundEmail.next_attempt_at <= now)
+            .order_by(OutboundEmail.next_attempt_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ))
+        if not ids:
+            return []
+
+        self.session.execute(
+            update(OutboundEmail)
+            .where(OutboundEmail.id.in_(ids))
+            .values(
+                status="sending",
+                next_attempt_at=now + timedelta(seconds=lease_seconds),
+                attempts=OutboundEmail.attempts + 1,
+            )
+        )
+        rows = self.session.execute(
+            select(
+                OutboundEmail.id,
+                OutboundEmail.recipient,
+                OutboundEmail.subject,
+                OutboundEmail.body_html,
+                OutboundEmail.attempts,
+            ).where(OutboundEmail.id.in_(ids))
+        ).mappings()
+        return [dict(row) for row in rows]
+
+    @check_session
+    def mark_emails_sent(self, ids: List[int]) -> int:
+        """발송 완료 처리"""
+        if not ids:
+            return 0
+        result = self.session.execute(
+            update(OutboundEmail)
+            .where(OutboundEmail.id.in_(ids))
+            .values(status="sent", sent_at=datetime.now(), last_error=None)
+        )
+        return result.rowcount
+
+    @check_session
+    def mark_email_failed(self, id: int, error: str, retry_at: datetime | None = None) -> bool:
+        """발송 실패 처리, retry_at이 없으면 더 이상 재시도하지 않음"""
+        values = {"last_error": error[:500]}
+        if retry_at is None:
+            values["status"] = "failed"
+        else:
+            values["status"] = "pending"
+            values["next_attempt_at"] = retry_at
+        result = self.session.execute(
+            update(OutboundEmail).where(OutboundEmail.id == id).values(**values)
+        )
+        return result.rowcount > 0
+
+    def count_pending_emails(self) -> Dict[str, int]:
+        """상태별 미발송 이메일 수 (pending, sending)"""
+        rows = self.session.execute(
+            select(OutboundEmail.status, func.count())
+            .where(OutboundEmail.status.in_(("pending", "sending")))
+            .group_by(OutboundEmail.status)
+        )
+        counts = {"pending": 0, "sending": 0}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    @check_session
+    def save_verification_code(self, email: str, code: str, expires_at: datetime) -> bool:
+        """이메일 인증 코드 저장, 이미 있으면 새 코드로 교체"""
+        stmt = mysql_insert(EmailVerification).values(email=email, code=code, expires_at=expires_at)
+        self.session.execute(stmt.on_duplicate_key_update(code=stmt.inserted.code, expires_at=stmt.inserted.expires_at))
+        return True
+
+    @check_session
+    def consume_verification_code(self, email: str, code: str) -> VerificationResult:
+        """
+        인증 코드 확인, 성공하면 삭제
+        비교와 삭제를 DELETE 한 번으로 처리하므로 같은 코드로 동시에 확인해도 한 번만 ok
+        """
+        now = datetime.now()
+        result = self.session.execute(
+            delete(EmailVerification).where(
+                EmailVerification.email == email,
+                EmailVerification.code == code,
+                EmailVerification.expires_at > now,
+            )
+        )
+        if result.rowcount == 1:
+            return "ok"
+
+        expires_at = self.session.scalar(
+            select(EmailVerification.expires_at).where(EmailVerification.email == email)
+        )
+        if expires_at is None:
+            return "missing"
+        if expires_at <= now:
+            self.session.execute(
+                delete(EmailVerification).where(EmailVerification.email == email, EmailVerification.expires_at <= now)
+            )
+            return "expired"
+        return "mismatch"
+
+    @check_session
+    def purge_expired_verification_codes(self) -> int:
+        """만료된 인증 코드 삭제, 삭제한 수 반환"""
+        result = self.session.execute(
+            delete(EmailVerification).where(EmailVerification.expires_at <= datetime.now())
+        )
+        return result.rowcount
@@ -1,64 +1,285 @@
 from db.tables.food_table import FoodTag, FoodInfo, FoodInfoTag, FoodCategory, FoodSourceInfo, FoodCompany, FoodNutrition
 import model.domain.food as food_domain
-from typing import List, Optional
-import functools
+from db.cache import TTLCache
+from db.db_mixin.session_mixin import SessionMixin, check_session, has_pending_writes
+from db.routing import use_primary
+from db.tag_dictionary import tag_dictionary
+from db.tag_bitmap_index import get_tag_bitmap_index, schedule_food_tags
+from sqlalchemy import event, insert, select, or_
+from sqlalchemy.orm import Session, joinedload, selectinload, noload
+from typing import Any, Dict, Iterable, List, Optional, Literal
 import logging
+import os
 
 """
 food:
     create
         name only not id
+        bulk (multi-row insert, chunked)
     search by id
     search by name
     search by tag
+    search by tag expression (bitmap index, AND / OR / NOT)
+    search by ids / names (batch)
     update
-        add tags
+        add tags (tag dictionary)
         remove tags
     delete by id
 """
 
 logger = logging.getLogger(__name__)
 
-class FoodMixin:
+# 조회 프로필별 관계 로딩 전략
+# 1:1 관계는 joinedload로 같은 쿼리에서, 태그(다:다)는 selectinload로 한 번에 가져오고
+# 프로필에 없는 관계는 noload로 막아 Food.from_db_model에서 지연 로딩이 일어나지 않게 한다.
+FoodLoadProfile = Literal["card", "full", "nutrition-only"]
+
+FOOD_LOAD_PROFILES = {
+    # 목록/카드 표시용: 분류와 태그
+    "card": (
+        joinedload(FoodInfo.category),
+        selectinload(FoodInfo.tags),
+        noload(FoodInfo.nutrition),
+    ),
+    # 상세 조회용: 영양성분, 분류, 태그 모두
+    "full": (
+        joinedload(FoodInfo.nutrition),
+        joinedload(FoodInfo.category),
+        selectinload(FoodInfo.tags),
+    ),
+    # 영양 계산용: 영양성분만
+    "nutrition-only": (
+        joinedload(FoodInfo.nutrition),
+        noload(FoodInfo.category),
+        noload(FoodInfo.tags),
+    ),
+}
+
+
+class FoodCache:
+    """
+    음식 카탈로그 읽기 캐시
+    food_id와 정규화된 food_name 두 키로 "full" 프로필 Food 객체를 보관한다.
+    넣을 때와 꺼낼 때 깊은 복사를 하므로 호출한 쪽이 받은 객체를 고쳐도 캐시에는 영향이 없다.
+    쓰기 메서드는 invalidate_food_on_commit으로 커밋 전후에 무효화하고, 커밋 전 쓰기가 있는 세션은 캐시를 쓰지 않는다.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float | None = 3600):
+        # 음식 하나가 id, name 두 항목을 차지함
+        self._cache = TTLCache(maxsize=maxsize * 2, ttl=ttl)
+
+    def get_by_id(self, food_id: str) -> food_domain.Food | None:
+        return self._copy(self._cache.get(("id", food_id)))
+
+    def get_by_name(self, food_name: str) -> food_domain.Food | None:
+        return self._copy(self._cache.get(("name", food_domain.normalize_food_name(food_name))))
+
+    def put(self, food: food_domain.Food) -> None:
+        food = food.model_copy(deep=True)
+        self._cache.set(("id", food.food_id), food)
+        self._cache.set(("name", food_domain.normalize_food_name(food.food_name)), food)
+
+    def invalidate(self, food_id: str, food_name: str | None = None) -> None:
+        """음식 하나의 캐시 항목 제거"""
+        cached = self._cache.pop(("id", food_id))
+        for name in {food_name, cached.food_name if cached else None}:
+            if name:
+                self._cache.pop(("name", food_domain.normalize_food_name(name)))
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    @staticmethod
+    def _copy(food: food_domain.Food | None) -> food_domain.Food | None:
+        return None if food is None else food.model_copy(deep=True)
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
+
+
+food_cache = FoodCache(
+    maxsize=int(os.getenv("FOOD_CACHE_MAXSIZE", "10000")),
+    ttl=float(os.getenv("FOOD_CACHE_TTL", "3600")),
+)
+
+_PENDING_KEY = "food_cache_pending"
+
+
+def invalidate_food_on_commit(session: Session, food_id: str, food_name: str | None = None) -> None:
+    """
+    음식 캐시 무효화, 지금 한 번 하고 트랜잭션 커밋 후 한 번 더 한다.
+    (커밋 전에 다른 요청이 옛 값을 다시 캐시에 넣는 경우 방지)
+    """
+    food_cache.invalidate(food_id, food_name)
+    session.info.setdefault(_PENDING_KEY, set()).add((food_id, food_name))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_pending_foods(session: Session) -> None:
+    for food_id, food_name in session.info.pop(_PENDING_KEY, ()):
+        food_cache.invalidate(food_id, food_name)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_foods(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# 일괄 생성 시 하위 테이블별 컬럼 (food_id 제외)
+def _child_columns(table) -> List[str]:
+    return [column.key for column in table.__table__.columns if column.key != "food_id"]
+
+FOOD_CHILD_TABLES = (
+    (FoodCategory, _child_columns(FoodCategory)),
+    (FoodSourceInfo, _child_columns(FoodSourceInfo)),
+    (FoodCompany, _child_columns(FoodCompany)),
+    (FoodNutrition, _child_columns(FoodNutrition)),
+)
+
+
+class FoodMixin(SessionMixin):
     """음식 관련 DB입출력 기능 모음, 상속해서 사용"""
 
-    def check_session(func):
-        """세션 체크 및 트랜잭션 관리 데코레이터"""
-        @functools.wraps(func)
-        def wrapper(self, *args, **kwargs):
-            if self.session is None:
-                raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
-            try:
-                result = func(self, *args, **kwargs)
-                self.session.commit()
-                return result
-            except Exception as e:
-                self.session.rollback()
-                raise e
-        return wrapper
-    
-    def get_food_by_id(self, food_id: str) -> food_domain.Food:
+    # 일괄 조회 시 IN (...) 절 하나에 넣을 최대 키 개수
+    batch_chunk_size = 500
+
+    def _food_query(self, profile: FoodLoadProfile):
+        """조회 프로필이 적용된 FoodInfo 쿼리"""
+        if profile not in FOOD_LOAD_PROFILES:
+            raise ValueError(f"알 수 없는 조회 프로필입니다: {profile}")
+        return self.session.query(FoodInfo).options(*FOOD_LOAD_PROFILES[profile])
+
+    def _use_cache(self, profile: FoodLoadProfile) -> bool:
+        """
+        캐시는 "full" 프로필만 보관하므로 다른 프로필은 항상 DB에서 조회
+        커밋 전 쓰기가 있는 세션도 캐시를 건너뜀
+        (자기 쓰기를 DB에서 읽고, 롤백될 수 있는 값을 캐시에 넣지 않음)
+        """
+        if profile != "full":
+            return False
+        return not (has_pending_writes(self.session) or self.session.info.get(_PENDING_KEY))
+
+    def _to_domain(self, food_info: FoodInfo, profile: FoodLoadProfile) -> food_domain.Food:
+        """ORM 객체를 도메인 객체로 변환, "full" 프로필이면 캐시에 저장"""
+        food = food_domain.Food.from_db_model(food_info)
+        if self._use_cache(profile):
+            food_cache.put(food)
+        return food
+
+    def get_food_by_id(self, food_id: str, profile: FoodLoadProfile = "full") -> food_domain.Food | None:
         """음식 조회"""
         if self.session is None:
             raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
-        food_info = self.session.query(FoodInfo).filter(FoodInfo.food_id == food_id).first()
-        return food_domain.Food.from_db_model(food_info)
+        if self._use_cache(profile) and (food := food_cache.get_by_id(food_id)) is not None:
+            return food
+        food_info = self._food_query(profile).filter(FoodInfo.food_id == food_id).first()
+        return self._to_domain(food_info, profile) if food_info else None
     
-    def get_food_by_name(self, food_name: str) -> food_domain.Food:
+    def get_food_by_name(self, food_name: str, profile: FoodLoadProfile = "full") -> food_domain.Food | None:
         """음식 조회"""
         if self.session is None:
             raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
-        food_info = self.session.query(FoodInfo).filter(FoodInfo.food_name == food_name).first()
-        return food_domain.Food.from_db_model(food_info)
+        if self._use_cache(profile) and (food := food_cache.get_by_name(food_name)) is not None:
+            return food
+        food_info = self._food_query(profile).filter(FoodInfo.food_name == food_name.strip()).first()
+        return self._to_domain(food_info, profile) if food_info else None
     
-    def get_food_by_tag(self, tag_name: str) -> List[food_domain.Food]:
+    def get_food_by_tag(self, tag_name: str, profile: FoodLoadProfile = "full") -> List[food_domain.Food]:
         """음식 태그 조회"""
         if self.session is None:
             raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
-        food_infos = self.session.query(FoodInfo).filter(FoodInfo.tags.any(FoodTag.tag_name == tag_name)).all()
-        return [food_domain.Food.from_db_model(food_info) for food_info in food_infos]
+        tag_id = tag_dictionary.get_id(self.session, tag_name)
+        if tag_id is None:
+            return []
+        # food_info_tag.tag_id 인덱스를 타는 조인
+        food_infos = (
+            self._food_query(profile)
+            .join(FoodInfoTag, FoodInfoTag.food_id == FoodInfo.food_id)
+            .filter(FoodInfoTag.tag_id == tag_id)
+            .all()
+        )
+        return [self._to_domain(food_info, profile) for food_info in food_infos]
     
 
+    def count_foods_by_tags(self, expression: str) -> int:
+        """
+        태그 식에 맞는 음식 수 (비트맵 인덱스, DB 조회 없음)
+        예시: "고단백 AND 저염 AND NOT 유제품"
+        """
+        return get_tag_bitmap_index().count(expression)
+
+    def get_food_ids_by_tags(self, expression: str, limit: int | None = None, offset: int = 0) -> List[str]:
+        """태그 식에 맞는 food_id 목록 (food_id 순, 비트맵 인덱스)"""
+        return get_tag_bitmap_index().query(expression, limit=limit, offset=offset)
+
+    def get_foods_by_tags(
+            self,
+            expression: str,
+            limit: int = 100,
+            offset: int = 0,
+            profile: FoodLoadProfile = "card") -> List[food_domain.Food]:
+        """태그 식에 맞는 음식 목록, 후보는 비트맵 인덱스로 고르고 상세 정보만 DB에서 가져옴"""
+        if self.session is None:
+            raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
+        food_ids = self.get_food_ids_by_tags(expression, limit=limit, offset=offset)
+        batch = self.get_foods_by_ids(food_ids, profile=profile)
+        return list(batch.foods.values())
+
+    def get_tag_facets(self, expression: str | None = None) -> Dict[str, int]:
+        """태그 식에 맞는 음식 안에서 태그별 음식 수, 식이 없으면 전체 카탈로그 기준"""
+        return get_tag_bitmap_index().facets(expression)
+
+    def get_foods_by_ids(self, food_ids: List[str], profile: FoodLoadProfile = "full") -> food_domain.FoodBatch:
+        """음식 일괄 조회 (food_id), 캐시에 없는 것만 DB에서 가져옴"""
+        if self.session is None:
+            raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
+        keys = list(dict.fromkeys(food_ids))
+        use_cache = self._use_cache(profile)
+        found = {}
+        misses = []
+        for key in keys:
+            if use_cache and (food := food_cache.get_by_id(key)) is not None:
+                found[key] = food
+            else:
+                misses.append(key)
+        for start in range(0, len(misses), self.batch_chunk_size):
+            chunk = misses[start:start + self.batch_chunk_size]
+            for food_info in self._food_query(profile).filter(FoodInfo.food_id.in_(chunk)).all():
+                found[food_info.food_id] = self._to_domain(food_info, profile)
+        return food_domain.FoodBatch(
+            foods={key: found[key] for key in keys if key in found},
+            missing=[key for key in keys if key not in found],
+        )
+
+    def get_foods_by_names(self, food_names: List[str], profile: FoodLoadProfile = "full") -> food_domain.FoodBatch:
+        """음식 일괄 조회 (food_name), 결과 키는 요청한 이름 그대로"""
+        if self.session is None:
+            raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
+        keys = list(dict.fromkeys(food_names))
+        # DB 콜레이션과 같은 기준으로 맞추기 위해 정규화된 이름으로 대응시킴
+        use_cache = self._use_cache(profile)
+        found = {}
+        misses = []
+        for key in keys:
+            if use_cache and (food := food_cache.get_by_name(key)) is not None:
+                found[food_domain.normalize_food_name(key)] = food
+            else:
+                misses.append(key.strip())
+        misses = list(dict.fromkeys(misses))
+        for start in range(0, len(misses), self.batch_chunk_size):
+            chunk = misses[start:start + self.batch_chunk_size]
+            for food_info in self._food_query(profile).filter(FoodInfo.food_name.in_(chunk)).all():
+                found[food_domain.normalize_food_name(food_info.food_name)] = self._to_domain(food_info, profile)
+        foods = {}
+        missing = []
+        for key in keys:
+            food = found.get(food_domain.normalize_food_name(key))
+            if food is None:
+                missing.append(key)
+            else:
+                foods[key] = food
+        return food_domain.FoodBatch(foods=foods, missing=missing)
+
     @check_session
     def create_food(
         self, 
@@ -165,32 +386,166 @@ class FoodMixin:
                     saturated_fat_g=saturated_fat_g,
                     trans_fat_g=trans_fat_g,
                 ),
-                tags=[FoodTag(tag_name=tag) for tag in tags],
             )
-            self.session.add(food)
-            self.session.commit()
-            return True
+            # 실패해도 같은 트랜잭션의 다른 작업은 유지되도록 이 음식만 SAVEPOINT로 감쌈
+            with self.savepoint():
+                self.session.add(food)
+                self.session.flush()
+                tag_dictionary.link(self.session, ((food_id, tag) for tag in tags or []))
         except Exception as e:
-            self.session.rollback()
             logger.error(f"음식 생성 실패: {e}")
             return False
+        schedule_food_tags(self.session, food_id, None)
+        invalidate_food_on_commit(self.session, food_id, name)
+        return True
     
 
+    def _insert_food_chunk(self, records: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        레코드 한 청크를 multi-row INSERT로 저장하고 food_id별 상태 반환
+        이미 있는 food_id/food_name은 한 번의 조회로 걸러내고, 동시에 들어온 중복은
+        INSERT IGNORE 후 실제로 들어간 행을 다시 확인해 conflict로 처리한다.
+        """
+        ids = [record["food_id"] for record in records]
+        names = [record["name"] for record in records]
+        existing_ids = set()
+        existing_names = set()
+        for food_id, food_name in self.session.execute(
+                select(FoodInfo.food_id, FoodInfo.food_name)
+                .where(or_(FoodInfo.food_id.in_(ids), FoodInfo.food_name.in_(names)))):
+            existing_ids.add(food_id)
+            existing_names.add(food_domain.normalize_food_name(food_name))
+
+        statuses = {}
+        candidates = []
+        for record in records:
+            if record["food_id"] in existing_ids or food_domain.normalize_food_name(record["name"]) in existing_names:
+                statuses[record["food_id"]] = "conflict"
+            else:
+                candidates.append(record)
+        if not candidates:
+            return statuses
+
+        self.session.execute(
+            insert(FoodInfo).prefix_with("IGNORE"),
+            [{"food_id": r["food_id"], "food_name": r["name"], "data_type_code": r.get("data_type_code")} for r in candidates],
+        )
+        inserted = {
+            food_id: food_name
+            for food_id, food_name in self.session.execute(
+                select(FoodInfo.food_id, FoodInfo.food_name)
+                .where(FoodInfo.food_id.in_([r["food_id"] for r in candidates])))
+        }
+        created = []
+        for record in candidates:
+            if inserted.get(record["food_id"]) == record["name"]:
+                statuses[record["food_id"]] = "created"
+                created.append(record)
+            else:
+                statuses[record["food_id"]] = "conflict"
+        if not created:
+            return statuses
+
+        for table, columns in FOOD_CHILD_TABLES:
+            rows = [
+                {"food_id": r["food_id"], **{column: r.get(column) for column in columns}}
+                for r in created
+                # 회사 정보처럼 모든 값이 비어 있는 행은 만들지 않음
+                if table is not FoodCompany or any(r.get(column) is not None for column in columns)
+            ]
+            if rows:
+                self.session.execute(insert(table), rows)
+
+        tag_dictionary.link(self.session, ((r["food_id"], tag) for r in created for tag in (r.get("tags") or [])))
+        schedule_food_tags(self.session, created[0]["food_id"], None)
+        return statuses
+
+    def create_foods_bulk(self, records: Iterable[Dict[str, Any]], chunk_size: int = 1000) -> List[food_domain.FoodCreateStatus]:
+        """
+        음식 일괄 생성
+        레코드 키는 create_food 인자와 같고(food_name도 name으로 인정), 청크마다 한 번 커밋한다.
+        transaction() 안에서는 청크마다 SAVEPOINT를 두고 블록 끝에서 한 번 커밋한다.
+        food_info와 하위 테이블, 태그 연결을 청크 단위 multi-row INSERT로 저장하며 기존 태그는 재사용한다.
+
+        Returns:
+            입력 순서대로 레코드별 결과 (created / conflict / invalid / error)
+        """
+        if self.session is None:
+            raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
+        # 기존 food_id/food_name 확인을 복제본이 아닌 primary에서
+        use_primary(self.session)
+
+        results: List[food_domain.FoodCreateStatus] = []
+
+        def flush(chunk: List[Dict[str, Any]], chunk_results: List[food_domain.FoodCreateStatus]):
+            try:
+                if self.in_unit_of_work:
+                    # transaction() 안에서는 청크별 SAVEPOINT, 커밋은 블록 끝에서
+                    with self.savepoint():
+                        statuses = self._insert_food_chunk(chunk)
+                else:
+                    statuses = self._insert_food_chunk(chunk)
+                    self.session.commit()
+            except Exception as e:
+                if not self.in_unit_of_work:
+                    self.session.rollback()
+                logger.error(f"음식 일괄 생성 실패: {e}")
+                for result in chunk_results:
+                    result.status, result.detail = "error", str(e)
+            else:
+                for result in chunk_results:
+                    result.status = statuses[result.food_id]
+
+        chunk, chunk_results, seen_ids, seen_names = [], [], set(), set()
+        for record in records:
+            record = dict(record)
+            if "name" not in record and "food_name" in record:
+                record["name"] = record.pop("food_name")
+            food_id, name = record.get("food_id"), record.get("name")
+            result = food_domain.FoodCreateStatus(food_id=food_id, food_name=name, status="created")
+            results.append(result)
+            if not food_id or not name:
+                result.status, result.detail = "invalid", "food_id와 name은 필수입니다."
+                continue
+            # 입력 안에서의 중복은 먼저 나온 레코드만 생성
+            if food_id in seen_ids or food_domain.normalize_food_name(name) in seen_names:
+                result.status = "conflict"
+                continue
+            seen_ids.add(food_id)
+            seen_names.add(food_domain.normalize_food_name(name))
+            chunk.append(record)
+            chunk_results.append(result)
+            if len(chunk) >= chunk_size:
+                flush(chunk, chunk_results)
+                chunk, chunk_results = [], []
+        if chunk:
+            flush(chunk, chunk_results)
+        return results
+
     @check_session
     def update_food_tags(self, food_id: str, tags: list[str]) -> bool:
         """음식 태그 업데이트"""
-        food = self.get_food_by_id(food_id)
-        if food is None:
+        food_name = self.session.scalar(select(FoodInfo.food_name).where(FoodInfo.food_id == food_id))
+        if food_name is None:
             return False
-        food.food_tags = [FoodTag(tag_name=tag) for tag in tags]
+        # 태그는 사전에서 재사용하고 연결만 교체
+        tag_dictionary.replace(self.session, food_id, tags)
+        schedule_food_tags(self.session, food_id, tags)
+        invalidate_food_on_commit(self.session, food_id, food_name)
         return True
     
 
     @check_session
     def delete_food_tags(self, food_id: str) -> bool:
         """음식 태그 삭제"""
-        food = self.get_food_by_id(food_id)
-        if food is None:
+        food_name = self.session.scalar(select(FoodInfo.food_name).where(FoodInfo.food_id == food_id))
+        if food_name is None:
             return False
-        food.tags = []
-        return True
\ No newline at end of file
+        tag_dictionary.replace(self.session, food_id, [])
+        schedule_food_tags(self.session, food_id, [])
+        invalidate_food_on_commit(self.session, food_id, food_name)
+        return True
+
+    def get_food_cache_stats(self) -> Dict[str, int]:
+        """음식 캐시 통계 (hit / miss / eviction)"""
+        return food_cache.stats()
@@ -0,0 +1,108 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from contextlib import contextmanager
+import functools
+
+from db.routing import use_primary
+
+"""
+session:
+    mixin 공통 세션 / 트랜잭션 관리
+        check_session   쓰기 메서드 데코레이터
+            복제본 라우팅 시 메서드 시작부터 세션을 primary로 고정 (쓰기 전 확인용 SELECT도 primary에서)
+            transaction() 밖: 실제로 쓴 내용이 있을 때만 커밋 (읽기만 했으면 커밋 생략)
+            transaction() 안(unit of work): flush만 하고 커밋은 블록 끝에서 한 번
+        savepoint       부분 롤백이 필요한 구간 (SAVEPOINT)
+"""
+
+# session.info 키
+UNIT_OF_WORK = "unit_of_work"  # transaction() 블록 안이면 True
+HAS_WRITES = "has_writes"  # 이번 트랜잭션에서 INSERT/UPDATE/DELETE를 직접 실행했으면 True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_writes(orm_execute_state) -> None:
+    # session.execute(insert(...)) 같은 직접 실행은 session.new/dirty에 나타나지 않으므로 따로 기록
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[HAS_WRITES] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session: Session, flush_context) -> None:
+    # 메서드 안에서 직접 flush하면 session.new/dirty가 비므로 여기서 기록
+    session.info[HAS_WRITES] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _reset_writes(session: Session, transaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(HAS_WRITES, None)
+
+
+def has_pending_writes(session: Session) -> bool:
+    """커밋할 변경이 있는지 여부"""
+    return bool(session.new or session.dirty or session.deleted or session.info.get(HAS_WRITES))
+
+
+def begin_unit_of_work(session: Session) -> bool:
+    """unit of work 시작, 이미 안에 있으면 False (바깥 블록에 합류)"""
+    if session.info.get(UNIT_OF_WORK):
+        return False
+    session.info[UNIT_OF_WORK] = True
+    return True
+
+
+def end_unit_of_work(session: Session) -> None:
+    session.info.pop(UNIT_OF_WORK, None)
+
+
+def check_session(func):
+    """세션 체크 및 트랜잭션 관리 데코레이터"""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self.session is None:
+            raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
+        # 쓰기 메서드 안의 조회가 복제 지연된 값을 보지 않도록
+        use_primary(self.session)
+        in_unit_of_work = self.session.info.get(UNIT_OF_WORK, False)
+        try:
+            result = func(self, *args, **kwargs)
+            if in_unit_of_work:
+                # 같은 블록의 다음 읽기가 변경을 볼 수 있도록 flush만 함
+                if self.session.new or self.session.dirty or self.session.deleted:
+                    self.session.flush()
+            elif has_pending_writes(self.session):
+                self.session.commit()
+            return result
+        except Exception as e:
+            # unit of work 안에서는 transaction()이 블록 전체를 롤백
+            if not in_unit_of_work:
+                self.session.rollback()
+            raise e
+    return wrapper
+
+
+class SessionMixin:
+    """세션 공통 기능, 상속해서 사용"""
+
+    @property
+    def in_unit_of_work(self) -> bool:
+        return self.session is not None and self.session.info.get(UNIT_OF_WORK, False)
+
+    @contextmanager
+    def savepoint(self):
+        """
+        SAVEPOINT 구간, 안에서 예외가 나면 이 구간만 롤백하고 예외를 다시 던짐
+        예시:
+            with manager.transaction():
+                manager.create_user(...)
+                try:
+                    with manager.savepoint():
+                        manager.update_user_inventory(...)
+                except Exception:
+                    pass  # 유저 생성은 유지
+        """
+        if self.session is None:
+            raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
+        with self.session.begin_nested():
+            yield self
@@ -1,70 +1,136 @@
 from db.tables.user_table import *
+from db.tables.food_table import FoodInfo
+from db.db_mixin.session_mixin import SessionMixin, check_session
+from db.user_cache import invalidate_user_on_commit
 import model.domain.user as user_domain
-from datetime import datetime
-from typing import Dict, Any, Union, Literal
+from model.domain.food import Food, normalize_food_name
+from model.domain.meal_plan import WeeklyMealPlan, PlanSaveResult
+from model.domain.quantity import parse_quantity, parse_quantity_columns, sum_quantities
+from sqlalchemy import insert, select, delete, func, and_, or_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import joinedload, noload, selectinload
+from datetime import datetime, timedelta
+from collections import Counter
+from typing import Dict, Any, List, Tuple, Union, Literal
 import uuid
+import base64
 import functools
 import logging
 
 """
 user:
-    search by uuid
+    search by uuid (profile: auth-only / profile / full)
     create
             nickname, email, (password or social_code), 
             body(age, tall, weight, sleep_pattern, activity_level, 
                 gender, diseases, favorite_foods, disliked_foods)
     update
         body, schedule, inventory, subscription, social_login, password
+    save weekly plan (WeeklyMealPlan의 날짜들을 한 트랜잭션에서 교체, 식사 수와 관계없이 쿼리 수 일정)
+
+schedule:
+    get by uuid + 기간 (keyset 페이지네이션, 음식과 영양성분까지 쿼리 3번)
+
+inventory:
+    expiring in N days / expired ((uuid, expired) 인덱스), 식품별 보유량(g) (SQL 집계)
     delete by uuid
 
 log:
-    record login
+    record login, record logins (여러 건을 multi-row INSERT 한 번으로)
+        같은 트랜잭션에서 시간별 집계(login_log_hourly)도 누적
+    count logins / failed logins by ip, top failed ips (집계 테이블 조회, 시간 단위)
 """
 
 # logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# 조회 프로필별 관계 로딩 전략
+# 1:1 관계는 joinedload로 한 번의 쿼리에서 가져오고, 프로필에 없는 관계는 noload로
+# 막아 User.from_db_model에서 지연 로딩 쿼리가 추가로 나가지 않게 한다.
+UserLoadProfile = Literal["auth-only", "profile", "full"]
 
-class UserMixin:
-    """유저 관련 DB입출력 기능 모음, 상속해서 사용"""
+USER_LOAD_PROFILES = {
+    # 인증 확인용 (get_current_user, /user/me): 이메일, 전화번호
+    "auth-only": (
+        joinedload(UserInfo.user_auth),
+        noload(UserInfo.user_body),
+        noload(UserInfo.password),
+        noload(UserInfo.social_login),
+        noload(UserInfo.subscription),
+    ),
+    # 식단 계획용: 신체 정보, 소셜 로그인, 구독 (비밀번호 제외)
+    "profile": (
+        joinedload(UserInfo.user_auth),
+        joinedload(UserInfo.user_body),
+        joinedload(UserInfo.social_login),
+        joinedload(UserInfo.subscription),
+        noload(UserInfo.password),
+    ),
+    # 로그인 검증 등 전체
+    "full": (
+        joinedload(UserInfo.user_auth),
+        joinedload(UserInfo.user_body),
+        joinedload(UserInfo.password),
+        joinedload(UserInfo.social_login),
+        joinedload(UserInfo.subscription),
+    ),
+}
+
+# 식사 일정 조회: 음식은 selectinload, 음식 정보는 영양성분만 함께 로딩
+SCHEDULE_LOAD_OPTIONS = (
+    selectinload(UserSchedule.foods).selectinload(ScheduleFood.food).options(
+        joinedload(FoodInfo.nutrition),
+        noload(FoodInfo.category),
+        noload(FoodInfo.tags),
+    ),
+)
+
+
+def _encode_schedule_cursor(meal_datetime: datetime, meal_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{meal_datetime.isoformat()}|{meal_id}".encode()).decode().rstrip("=")
 
-    def check_session(func):
-        """세션 체크 및 트랜잭션 관리 데코레이터"""
-        @functools.wraps(func)
-        def wrapper(self, *args, **kwargs):
-            if self.session is None:
-                raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
-            try:
-                result = func(self, *args, **kwargs)
-                self.session.commit()
-                return result
-            except Exception as e:
-                self.session.rollback()
-                raise e
-        return wrapper
+
+def _decode_schedule_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        meal_datetime, meal_id = raw.split("|")
+        return datetime.fromisoformat(meal_datetime), int(meal_id)
+    except ValueError as e:
+        raise ValueError("잘못된 cursor입니다.") from e
+
+
+class UserMixin(SessionMixin):
+    """유저 관련 DB입출력 기능 모음, 상속해서 사용"""
 
     def check_user_exists(func):
         """사용자 존재 확인 데코레이터"""
         @functools.wraps(func)
         def wrapper(self, uuid, *args, **kwargs):
-            user_info = self.get_user_by_uuid(uuid=uuid)
+            user_info = self.get_user_by_uuid(uuid=uuid, profile="auth-only")
             if user_info is None:
                 return False
             return func(self, uuid, *args, user_info=user_info, **kwargs)
         return wrapper
 
-    def get_user_by_uuid(self, uuid: str) -> user_domain.User | None:
+    def _user_query(self, profile: UserLoadProfile):
+        """조회 프로필이 적용된 UserInfo 쿼리"""
+        if profile not in USER_LOAD_PROFILES:
+            raise ValueError(f"알 수 없는 조회 프로필입니다: {profile}")
+        return self.session.query(UserInfo).options(*USER_LOAD_PROFILES[profile])
+
+    def get_user_by_uuid(self, uuid: str, profile: UserLoadProfile = "full") -> user_domain.User | None:
         """UUID로 사용자 정보 조회"""
         if self.session is None:
             raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
-        user_info = self.session.query(UserInfo).filter(UserInfo.uuid == uuid).first()
+        user_info = self._user_query(profile).filter(UserInfo.uuid == uuid).first()
         return user_domain.User.from_db_model(user_info) if user_info else None
     
-    def get_user_by_email(self, email: str) -> user_domain.User | None:
+    def get_user_by_email(self, email: str, profile: UserLoadProfile = "full") -> user_domain.User | None:
         """이메일로 사용자 정보 조회"""
         if self.session is None:
             raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
-        user_info = self.session.query(UserInfo).join(UserAuth).filter(UserAuth.email == email).first()
+        # user_auth 조인은 필터용, 프로필의 joinedload와 별개로 한 쿼리에 들어감
+        user_info = self._user_query(profile).join(UserAuth).filter(UserAuth.email == email).first()
         return user_domain.User.from_db_model(user_info) if user_info else None
 
     @check_session
@@ -88,7 +154,7 @@ class UserMixin:
         """유저 생성"""
         while True:
             user_uuid = str(uuid.uuid4())
-            if self.get_user_by_uuid(uuid=user_uuid) is None:
+            if self.get_user_by_uuid(uuid=user_uuid, profile="auth-only") is None:
                 break
         logger.debug(f"유저 uuid 생성: {user_uuid}")
         user_info = UserInfo(
@@ -155,6 +221,7 @@ class UserMixin:
             favorite_foods=favorite_foods,
             disliked_foods=disliked_foods
         )
+        invalidate_user_on_commit(self.session, uuid)
         return True
 
     @check_session
@@ -180,6 +247,8 @@ class UserMixin:
             datetime=datetime
         )
         self.session.add(schedule)
+        # meal_id를 받아오기 위해 flush
+        self.session.flush()
         
         # 음식 추가
         for food in foods:
@@ -187,16 +256,163 @@ class UserMixin:
                 meal_id=schedule.meal_id,
                 food_id=food.get('food_id'),
                 food_name=food.get('food_name'),
-                quantity=food.get('quantity')
+                quantity=food.get('quantity'),
+                unit=food.get('unit'),
+                amount_text=food.get('amount_text'),
             )
             self.session.add(food_item)
         
         return True
     
+    @check_session
+    @check_user_exists
+    def save_weekly_plan(self, uuid: str, plan: WeeklyMealPlan, user_info=None) -> PlanSaveResult:
+        """
+        주간 식단 저장, 식단에 있는 날짜의 기존 일정은 모두 교체
+        식사 수와 관계없이 쿼리 6번: 기존 음식/일정 삭제, food_id 일괄 조회, 일정 multi-row INSERT, meal_id 조회, 음식 multi-row INSERT
+        같은 시각의 식사는 하나로, 한 식사 안의 같은 음식은 하나로 저장 (schedule_food 기본 키가 (meal_id, food_name))
+        음식 양은 원문(amount_text)과 수치/단위를 함께 저장 ("300g" -> 300, "g"), 해석할 수 없으면 수치는 NULL
+        같은 음식의 양은 단위가 같거나 무게/부피끼리일 때만 합치고 ("300g" + "0.2kg" -> 500, "g"),
+        단위가 섞이면 수치 없이 원문만 저장하고 unmerged_foods에 기록 ("300g" + "2인분")
+        """
+        days = sorted({daily_plan.day for daily_plan in plan.days})
+        day_ranges = or_(*(
+            and_(UserSchedule.datetime >= datetime.combine(day, datetime.min.time()),
+                 UserSchedule.datetime < datetime.combine(day + timedelta(days=1), datetime.min.time()))
+            for day in days
+        ))
+        result = PlanSaveResult(days=days)
+        if not days:
+            return result
+
+        # 식사 시각 -> 정규화한 음식 이름 -> (음식 이름, [양 원문])
+        meals: Dict[datetime, Dict[str, Tuple[str, List[str]]]] = {}
+        for daily_plan in plan.days:
+            for meal in daily_plan.meals:
+                foods = meals.setdefault(datetime.combine(daily_plan.day, meal.time_slot), {})
+                for item in meal.food_list:
+                    foods.setdefault(normalize_food_name(item.food_name), (item.food_name.strip(), []))[1].append(item.food_amount.strip())
+
+        # 기존 일정 삭제 (음식 먼저)
+        self.session.execute(
+            delete(ScheduleFood)
+            .where(ScheduleFood.meal_id.in_(select(UserSchedule.meal_id).where(UserSchedule.uuid == uuid, day_ranges)))
+            .execution_options(synchronize_session=False)
+        )
+        result.deleted_meals = self.session.execute(
+            delete(UserSchedule)
+            .where(UserSchedule.uuid == uuid, day_ranges)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+        if not meals:
+            return result
+
+        # food_id 일괄 조회 (이름 비교는 DB 콜레이션처럼 대소문자/공백 무시)
+        names = list({name for foods in meals.values() for name, _ in foods.values()})
+        food_ids = {
+            normalize_food_name(food_name): food_id
+            for food_id, food_name in self.session.execute(
+                select(FoodInfo.food_id, FoodInfo.food_name).where(FoodInfo.food_name.in_(names))
+            )
+        }
+        result.unresolved_foods = sorted({key: name for name in names if (key := normalize_food_name(name)) not in food_ids}.values())
+
+        self.session.execute(insert(UserSchedule).values([{"uuid": uuid, "datetime": meal_time} for meal_time in meals]))
+        result.created_meals = len(meals)
+        # 방금 넣은 일정의 meal_id (교체한 날짜에는 새 일정만 있음)
+        meal_ids = dict(self.session.execute(
+            select(UserSchedule.datetime, UserSchedule.meal_id).where(UserSchedule.uuid == uuid, day_ranges)
+        ).all())
+
+        rows = []
+        unmerged = set()
+        for meal_time, foods in meals.items():
+            for key, (name, amounts) in foods.items():
+                merged = sum_quantities(parse_quantity(amount) for amount in amounts)
+                if merged is None and len(amounts) > 1:
+                    unmerged.add(name)
+                quantity, unit = merged if merged is not None else (None, None)
+                rows.append({
+                    "meal_id": meal_ids[meal_time],
+                    "food_id": food_ids.get(key),
+                    "food_name": name,
+                    "quantity": quantity,
+                    "unit": unit[:20] if unit else None,
+                    "amount_text": " + ".join(amounts)[:255],
+                })
+        result.unmerged_foods = sorted(unmerged)
+        if rows:
+            self.session.execute(insert(ScheduleFood).values(rows))
+        result.created_foods = len(rows)
+        return result
+
+    def get_user_schedule(
+            self,
+            uuid: str,
+            start: datetime,
+            end: datetime,
+            cursor: str | None = None,
+            limit: int = 100) -> user_domain.SchedulePage:
+        """
+        기간 [start, end)의 식사 일정, (datetime, meal_id) 순서로 limit개씩
+        다음 페이지는 반환된 next_cursor를 cursor로 넘겨 조회 (OFFSET 없이 인덱스에서 이어서 읽음)
+
+        Raises:
+            ValueError: 잘못된 cursor
+        """
+        if self.session is None:
+            raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
+        query = (
+            select(UserSchedule)
+            .options(*SCHEDULE_LOAD_OPTIONS)
+            .where(UserSchedule.uuid == uuid, UserSchedule.datetime >= start, UserSchedule.datetime < end)
+        )
+        if cursor is not None:
+            after_datetime, after_meal_id = _decode_schedule_cursor(cursor)
+            query = query.where(or_(
+                UserSchedule.datetime > after_datetime,
+                and_(UserSchedule.datetime == after_datetime, UserSchedule.meal_id > after_meal_id),
+            ))
+        schedules = list(self.session.scalars(
+            query.order_by(UserSchedule.datetime, UserSchedule.meal_id).limit(limit + 1)
+        ))
+
+        next_cursor = None
+        if len(schedules) > limit:
+            schedules = schedules[:limit]
+            next_cursor = _encode_schedule_cursor(schedules[-1].datetime, schedules[-1].meal_id)
+
+        meals = [
+            user_domain.ScheduleMeal(
+                meal_id=schedule.meal_id,
+                datetime=schedule.datetime,
+                foods=[
+                    user_domain.ScheduleFoodItem(
+                        food_id=food.food_id,
+                        food_name=food.food_name,
+                        quantity=food.quantity,
+                        unit=food.unit,
+                        amount_text=food.amount_text,
+                        food_nutrition=Food.from_db_model(food.food).food_nutrition if food.food is not None else None,
+                    )
+                    for food in schedule.foods
+                ],
+            )
+            for schedule in schedules
+        ]
+        return user_domain.SchedulePage(meals=meals, next_cursor=next_cursor)
+
     @check_session
     @check_user_exists
     def update_user_inventory(self, uuid: str, food_id: str, quantity: str, expired: datetime = None, user_info=None) -> bool:
-        """유저 식품 인벤토리 업데이트"""
+        """
+        유저 식품 인벤토리 업데이트
+        quantity 원문과 함께 해석한 수치/단위/g 환산값을 저장, 수량이 비었거나 0이면 삭제
+        """
+        parsed = parse_quantity_columns(quantity)
+        is_empty = quantity is None or str(quantity).strip() == "" or parsed["amount"] == 0
+
         # 기존 인벤토리 항목 검색
         inventory_item = self.session.query(UserFoodInventory).filter(
             UserFoodInventory.uuid == uuid,
@@ -205,25 +421,86 @@ class UserMixin:
         
         if inventory_item:
             # 수량이 0이면 삭제
-            if quantity in [None, '', '0g', '0ml', '0', '0.0']:
+            if is_empty:
                 self.session.delete(inventory_item)
             else:
                 # 기존 항목 업데이트
                 inventory_item.quantity = quantity
+                inventory_item.amount = parsed["amount"]
+                inventory_item.unit = parsed["unit"]
+                inventory_item.amount_g = parsed["amount_g"]
                 inventory_item.expired = expired
         else:
             # 새 항목 추가 (수량이 0보다 클 때만)
-            if quantity not in [None, '', '0g', '0ml', '0', '0.0']:
+            if not is_empty:
                 inventory_item = UserFoodInventory(
                     uuid=uuid,
                     food_id=food_id,
                     quantity=quantity,
-                    expired=expired
+                    expired=expired,
+                    **parsed,
                 )
                 self.session.add(inventory_item)
         
         return True
-    
+
+    @staticmethod
+    def _to_inventory_item(item: UserFoodInventory) -> user_domain.InventoryItem:
+        return user_domain.InventoryItem(
+            food_id=item.food_id,
+            quantity=item.quantity,
+            amount=item.amount,
+            unit=item.unit,
+            amount_g=item.amount_g,
+            expired=item.expired,
+        )
+
+    def get_expiring_inventory(self, uuid: str, days: int, now: datetime | None = None) -> List[user_domain.InventoryItem]:
+        """
+        days일 안에 유통기한이 끝나는 식품 (이미 지난 것 제외), 유통기한 순
+        (uuid, expired) 인덱스 범위 조회
+        """
+        if self.session is None:
+            raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
+        now = now or datetime.now()
+        items = self.session.scalars(
+            select(UserFoodInventory)
+            .where(
+                UserFoodInventory.uuid == uuid,
+                UserFoodInventory.expired >= now,
+                UserFoodInventory.expired < now + timedelta(days=days),
+            )
+            .order_by(UserFoodInventory.expired)
+        )
+        return [self._to_inventory_item(item) for item in items]
+
+    def get_expired_inventory(self, uuid: str, now: datetime | None = None) -> List[user_domain.InventoryItem]:
+        """이미 유통기한이 지난 식품, 유통기한 순"""
+        if self.session is None:
+            raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
+        items = self.session.scalars(
+            select(UserFoodInventory)
+            .where(UserFoodInventory.uuid == uuid, UserFoodInventory.expired < (now or datetime.now()))
+            .order_by(UserFoodInventory.expired)
+        )
+        return [self._to_inventory_item(item) for item in items]
+
+    def get_inventory_grams(self, uuid: str, include_expired: bool = False, now: datetime | None = None) -> Dict[str, float]:
+        """
+        식품별 보유량(g) {food_id: g}, g으로 환산할 수 없는 항목(인분, 개 등)은 제외
+        include_expired가 False면 유통기한이 지난 항목 제외 (유통기한 없음은 포함)
+        """
+        if self.session is None:
+            raise RuntimeError("세션이 활성화되지 않았습니다. 반드시 with문 또는 transaction 컨텍스트 내에서 사용하세요.")
+        query = (
+            select(UserFoodInventory.food_id, func.sum(UserFoodInventory.amount_g))
+            .where(UserFoodInventory.uuid == uuid, UserFoodInventory.amount_g.is_not(None))
+            .group_by(UserFoodInventory.food_id)
+        )
+        if not include_expired:
+            query = query.where(or_(UserFoodInventory.expired.is_(None), UserFoodInventory.expired >= (now or datetime.now())))
+        return {food_id: float(grams) for food_id, grams in self.session.execute(query)}
+
     @check_session
     @check_user_exists
     def update_user_subscription(self, uuid: str, plan: str, purchase: datetime, expired: datetime, user_info=None) -> bool:
@@ -272,6 +549,7 @@ class UserMixin:
             )
             self.session.add(social_login)
         
+        invalidate_user_on_commit(self.session, uuid)
         return True
     
     @check_session
@@ -294,6 +572,7 @@ class UserMixin:
             )
             self.session.add(password_info)
         
+        invalidate_user_on_commit(self.session, uuid)
         return True
     
     @check_session
@@ -316,6 +595,7 @@ class UserMixin:
         self.session.delete(user_info.user_auth)
         self.session.delete(user_info)
         
+        invalidate_user_on_commit(self.session, uuid)
         return True
     
     @check_session
@@ -328,6 +608,77 @@ class UserMixin:
             datetime=datetime.now()
         )
         self.session.add(login_log)
+        self._add_login_rollups([{"uuid": uuid, "status_code": status_code, "ip": ip, "datetime": login_log.datetime}])
         return True
 
+    @check_session
+    def record_logins(self, events: List[Dict[str, Any]]) -> int:
+        """
+        로그인 기록 여러 건 저장 (INSERT ... VALUES (...), (...) 한 문장)
+        events: [{"uuid", "status_code", "ip", "datetime"}]
+        """
+        if not events:
+            return 0
+        self.session.execute(insert(LoginLog).values(events))
+        self._add_login_rollups(events)
+        return len(events)
+
+    def _add_login_rollups(self, events: List[Dict[str, Any]]) -> None:
+        """로그인 기록을 (시간, uuid, ip, 상태 코드)별로 묶어 집계 테이블에 더함"""
+        counts = Counter(
+            (event["datetime"].replace(minute=0, second=0, microsecond=0), event["uuid"] or "", event["ip"] or "", event["status_code"])
+            for event in events
+        )
+        stmt = mysql_insert(LoginLogHourly).values([
+            {"hour": hour, "uuid": uuid, "ip": ip, "status_code": status_code, "count": count}
+            for (hour, uuid, ip, status_code), count in counts.items()
+        ])
+        self.session.execute(stmt.on_duplicate_key_update(count=LoginLogHourly.count + stmt.inserted.count))
+
+    @staticmethod
+    def _floor_hour(since: datetime) -> datetime:
+        return since.replace(minute=0, second=0, microsecond=0)
 
+    def count_logins(self, uuid: str, since: datetime, status_code: int | None = None) -> int:
+        """
+        since가 속한 시각(정시)부터의 사용자 로그인 수 (집계 테이블 조회)
+        status_code를 주면 해당 결과만 (200: 성공, 401: 실패)
+        """
+        if self.session is None:
+            logger.warning("세션이 활성화되지 않아 로그인 집계를 조회하지 않습니다.")
+            return 0
+        query = select(func.coalesce(func.sum(LoginLogHourly.count), 0)).where(
+            LoginLogHourly.uuid == uuid,
+            LoginLogHourly.hour >= self._floor_hour(since),
+        )
+        if status_code is not None:
+            query = query.where(LoginLogHourly.status_code == status_code)
+        return int(self.session.scalar(query))
+
+    def count_failed_logins_by_ip(self, ip: str, since: datetime) -> int:
+        """since가 속한 시각(정시)부터 해당 IP의 로그인 실패 수 (집계 테이블 조회)"""
+        if self.session is None:
+            logger.warning("세션이 활성화되지 않아 로그인 집계를 조회하지 않습니다.")
+            return 0
+        return int(self.session.scalar(
+            select(func.coalesce(func.sum(LoginLogHourly.count), 0)).where(
+                LoginLogHourly.ip == ip,
+                LoginLogHourly.hour >= self._floor_hour(since),
+                LoginLogHourly.status_code != 200,
+            )
+        ))
+
+    def get_top_failed_login_ips(self, since: datetime, limit: int = 20) -> List[Tuple[str, int]]:
+        """since가 속한 시각(정시)부터 로그인 실패가 많은 IP 목록 [(ip, 실패 수)]"""
+        if self.session is None:
+            logger.warning("세션이 활성화되지 않아 로그인 집계를 조회하지 않습니다.")
+            return []
+        total = func.sum(LoginLogHourly.count).label("failures")
+        rows = self.session.execute(
+            select(LoginLogHourly.ip, total)
+            .where(LoginLogHourly.hour >= self._floor_hour(since), LoginLogHourly.status_code != 200)
+            .group_by(LoginLogHourly.ip)
+            .order_by(total.desc())
+            .limit(limit)
+        )
+        return [(ip, int(failures)) for ip, failures in rows]
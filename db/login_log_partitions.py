@@ -0,0 +1,163 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+from datetime import datetime
+from typing import List, Tuple
+import logging
+import os
+
+"""
+login log partitions:
+    login_log 월 단위 RANGE COLUMNS(datetime) 파티션 관리 (MySQL)
+        partition       기존 테이블을 파티션 테이블로 변환 (외래 키 제거, 기본 키를 (log_id, datetime)으로)
+        ensure future   앞으로 LOGIN_LOG_PARTITION_MONTHS_AHEAD개월 파티션을 미리 만듦 (p_future를 나눔)
+        drop expired    보관 기간이 지난 월 파티션을 DROP PARTITION으로 삭제 (행 수와 관계없이 O(1))
+    집계 테이블(login_log_hourly)
+        backfill        login_log에서 시간별 집계를 다시 계산 (처음 도입할 때)
+        purge           보관 기간이 지난 집계 삭제
+    주기 실행: data/login_log_maintenance.py
+"""
+
+logger = logging.getLogger(__name__)
+
+LOGIN_LOG_PARTITION_MONTHS_AHEAD = int(os.getenv("LOGIN_LOG_PARTITION_MONTHS_AHEAD", "3"))
+LOGIN_LOG_RETENTION_MONTHS = int(os.getenv("LOGIN_LOG_RETENTION_MONTHS", "12"))
+LOGIN_ROLLUP_RETENTION_MONTHS = int(os.getenv("LOGIN_ROLLUP_RETENTION_MONTHS", "24"))
+
+FUTURE_PARTITION = "p_future"
+
+
+def month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"p{month:%Y%m}"
+
+
+def _partition_month(name: str) -> datetime | None:
+    try:
+        return datetime.strptime(name[1:], "%Y%m")
+    except ValueError:
+        return None
+
+
+def _partition_definition(month: datetime) -> str:
+    return f"PARTITION {partition_name(month)} VALUES LESS THAN ('{add_months(month, 1):%Y-%m-%d %H:%M:%S}')"
+
+
+def get_partitions(connection: Connection) -> List[str]:
+    """login_log 파티션 이름 목록 (순서대로), 파티션 테이블이 아니면 빈 목록"""
+    return list(connection.execute(text("""
+        SELECT PARTITION_NAME FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'login_log' AND PARTITION_NAME IS NOT NULL
+        ORDER BY PARTITION_ORDINAL_POSITION
+    """)).scalars())
+
+
+def partition_login_log(connection: Connection, months_ahead: int = LOGIN_LOG_PARTITION_MONTHS_AHEAD) -> bool:
+    """
+    login_log를 월 단위 파티션 테이블로 변환, 이미 파티션 테이블이면 False
+    테이블 전체를 다시 쓰므로 트래픽이 적을 때 한 번 실행
+    """
+    if get_partitions(connection):
+        return False
+
+    inspector = inspect(connection)
+    for foreign_key in inspector.get_foreign_keys("login_log"):
+        connection.execute(text(f"ALTER TABLE login_log DROP FOREIGN KEY {foreign_key['name']}"))
+
+    primary_key = inspector.get_pk_constraint("login_log")["constrained_columns"]
+    if primary_key != ["log_id", "datetime"]:
+        connection.execute(text("UPDATE login_log SET datetime = NOW() WHERE datetime IS NULL"))
+        connection.execute(text("""
+            ALTER TABLE login_log
+                MODIFY log_id BIGINT NOT NULL AUTO_INCREMENT,
+                MODIFY datetime DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                DROP PRIMARY KEY,
+                ADD PRIMARY KEY (log_id, datetime)
+        """))
+
+    oldest = connection.execute(text("SELECT MIN(datetime) FROM login_log")).scalar() or datetime.now()
+    month = month_start(oldest)
+    last = add_months(month_start(datetime.now()), months_ahead)
+    definitions = []
+    while month <= last:
+        definitions.append(_partition_definition(month))
+        month = add_months(month, 1)
+    definitions.append(f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE)")
+
+    connection.execute(text(f"ALTER TABLE login_log PARTITION BY RANGE COLUMNS(datetime) ({', '.join(definitions)})"))
+    logger.info(f"login_log 파티션 {len(definitions)}개 생성")
+    return True
+
+
+def ensure_future_partitions(connection: Connection, months_ahead: int = LOGIN_LOG_PARTITION_MONTHS_AHEAD) -> List[str]:
+    """앞으로 months_ahead개월까지의 월 파티션이 없으면 p_future를 나눠 추가, 추가한 이름 반환"""
+    partitions = get_partitions(connection)
+    months = [month for month in map(_partition_month, partitions) if month is not None]
+    if not months:
+        return []
+
+    month = add_months(max(months), 1)
+    last = add_months(month_start(datetime.now()), months_ahead)
+    added = []
+    definitions = []
+    while month <= last:
+        added.append(partition_name(month))
+        definitions.append(_partition_definition(month))
+        month = add_months(month, 1)
+    if definitions:
+        definitions.append(f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE)")
+        connection.execute(text(
+            f"ALTER TABLE login_log REORGANIZE PARTITION {FUTURE_PARTITION} INTO ({', '.join(definitions)})"
+        ))
+    return added
+
+
+def drop_expired_partitions(connection: Connection, retention_months: int = LOGIN_LOG_RETENTION_MONTHS) -> List[str]:
+    """보관 기간(이번 달 포함 retention_months개월)보다 오래된 월 파티션 삭제, 삭제한 이름 반환"""
+    cutoff = add_months(month_start(datetime.now()), -(retention_months - 1))
+    expired = [
+        name for name in get_partitions(connection)
+        if (month := _partition_month(name)) is not None and month < cutoff
+    ]
+    if expired:
+        connection.execute(text(f"ALTER TABLE login_log DROP PARTITION {', '.join(expired)}"))
+    return expired
+
+
+def backfill_login_rollups(connection: Connection, since: datetime | None = None) -> int:
+    """login_log에서 시간별 집계를 다시 계산해 덮어씀 (since 이후, 없으면 전체)"""
+    return connection.execute(text("""
+        INSERT INTO login_log_hourly (hour, uuid, ip, status_code, count)
+        SELECT DATE_FORMAT(datetime, '%Y-%m-%d %H:00:00'), COALESCE(uuid, ''), COALESCE(ip, ''), status_code, COUNT(*)
+        FROM login_log
+        WHERE datetime >= :since AND status_code IS NOT NULL
+        GROUP BY 1, 2, 3, 4
+        ON DUPLICATE KEY UPDATE count = VALUES(count)
+    """), {"since": since or datetime(1970, 1, 1)}).rowcount
+
+
+def purge_expired_rollups(connection: Connection, retention_months: int = LOGIN_ROLLUP_RETENTION_MONTHS) -> int:
+    """보관 기간이 지난 시간별 집계 삭제 (기본 키 선두 컬럼 hour 범위 삭제)"""
+    cutoff = add_months(month_start(datetime.now()), -(retention_months - 1))
+    return connection.execute(text("DELETE FROM login_log_hourly WHERE hour < :cutoff"), {"cutoff": cutoff}).rowcount
+
+
+def maintain_login_log(engine: Engine) -> Tuple[List[str], List[str], int]:
+    """파티션 추가 / 만료 파티션 삭제 / 만료 집계 삭제, (추가, 삭제한 파티션, 삭제한 집계 행 수) 반환"""
+    # 파티션 DDL은 MySQL에서 암묵적으로 커밋되므로 작업마다 따로 실행
+    with engine.begin() as connection:
+        partition_login_log(connection)
+    with engine.begin() as connection:
+        added = ensure_future_partitions(connection)
+    with engine.begin() as connection:
+        dropped = drop_expired_partitions(connection)
+    with engine.begin() as connection:
+        purged = purge_expired_rollups(connection)
+    return added, dropped, purged
@@ -0,0 +1,257 @@
+from prometheus_client import Counter, Histogram, REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from contextvars import ContextVar
+from typing import Dict
+import functools
+import logging
+import time
+import os
+
+"""
+metrics:
+    SQLAlchemy 커넥션 풀 / 쿼리 계측 (Prometheus)
+        풀      checkout 대기 시간, 사용 중/유휴/overflow 연결 수, timeout, invalidation
+        쿼리    문장별 실행 시간, 반환 행 수, 오류 수, 느린 쿼리 로그
+    각 쿼리는 호출한 DBManager 메서드와 FastAPI 라우트로 구분 (contextvars)
+    app.py의 /metrics에서 노출
+"""
+
+logger = logging.getLogger(__name__)
+
+# 이 시간(ms)을 넘는 쿼리는 경고 로그로 남김
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+
+current_db_method: ContextVar[str | None] = ContextVar("current_db_method", default=None)
+current_request_scope: ContextVar[dict | None] = ContextVar("current_request_scope", default=None)
+
+_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "커넥션 풀에서 연결을 얻기까지 기다린 시간",
+    ["pool"],
+    buckets=_LATENCY_BUCKETS,
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "pool_timeout 안에 연결을 얻지 못한 횟수",
+    ["pool"],
+)
+POOL_CONNECTIONS_CREATED = Counter(
+    "db_pool_connections_created_total",
+    "새로 만든 DB 연결 수",
+    ["pool"],
+)
+POOL_INVALIDATIONS = Counter(
+    "db_pool_invalidations_total",
+    "무효화된 연결 수 (soft는 반납 시 교체)",
+    ["pool", "soft"],
+)
+QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "SQL 문장 실행 시간",
+    ["pool", "operation", "method", "route"],
+    buckets=_LATENCY_BUCKETS,
+)
+QUERY_ROWS = Histogram(
+    "db_query_rows",
+    "SQL 문장이 반환하거나 변경한 행 수",
+    ["pool", "operation", "method", "route"],
+    buckets=(0, 1, 5, 10, 50, 100, 500, 1000, 5000, 10000),
+)
+QUERY_ERRORS = Counter(
+    "db_query_errors_total",
+    "실패한 SQL 문장 수",
+    ["pool", "operation", "method", "route"],
+)
+SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "DB_SLOW_QUERY_MS를 넘은 SQL 문장 수",
+    ["pool", "operation", "method", "route"],
+)
+
+
+# 최근 checkout 대기 시간의 지수 이동 평균 (모든 풀), 과부하 판단용 (service/admission.py)
+# checkout이 없는 동안은 반감기마다 절반으로 줄어 부하를 차단한 뒤에도 값이 남아 있지 않게 함
+_CHECKOUT_WAIT_ALPHA = 0.2
+_CHECKOUT_WAIT_HALF_LIFE = 5.0
+_recent_checkout_wait = (0.0, time.monotonic())
+
+
+def _decayed_checkout_wait(now: float) -> float:
+    value, updated = _recent_checkout_wait
+    return value * 0.5 ** ((now - updated) / _CHECKOUT_WAIT_HALF_LIFE)
+
+
+def _record_checkout_wait(wait: float) -> None:
+    global _recent_checkout_wait
+    now = time.monotonic()
+    value = _decayed_checkout_wait(now)
+    _recent_checkout_wait = (value + _CHECKOUT_WAIT_ALPHA * (wait - value), now)
+
+
+def recent_checkout_wait() -> float:
+    """최근 커넥션 풀 checkout 대기 시간(초), 지수 이동 평균"""
+    return _decayed_checkout_wait(time.monotonic())
+
+
+class _InstrumentedPoolMixin:
+    """checkout 대기 시간과 timeout을 기록하는 풀"""
+
+    metrics_name = "default"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.labels(self.metrics_name).inc()
+            _record_checkout_wait(time.perf_counter() - start)
+            raise
+        wait = time.perf_counter() - start
+        POOL_CHECKOUT_WAIT.labels(self.metrics_name).observe(wait)
+        _record_checkout_wait(wait)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() 등으로 풀을 다시 만들어도 이름 유지
+        pool = super().recreate()
+        pool.metrics_name = self.metrics_name
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+_engines: Dict[str, Engine] = {}
+
+
+class _PoolCollector:
+    """스크레이프 시점의 풀 상태 (사용 중, 유휴, overflow, 크기)"""
+
+    def collect(self):
+        checked_out = GaugeMetricFamily("db_pool_checked_out", "사용 중인 연결 수", labels=["pool"])
+        checked_in = GaugeMetricFamily("db_pool_checked_in", "풀에 반납된 유휴 연결 수", labels=["pool"])
+        overflow = GaugeMetricFamily("db_pool_overflow", "pool_size를 넘어 만든 연결 수 (음수면 아직 만들지 않은 기본 연결 수)", labels=["pool"])
+        size = GaugeMetricFamily("db_pool_size", "설정된 pool_size", labels=["pool"])
+        for name, engine in list(_engines.items()):
+            pool = engine.pool
+            if not isinstance(pool, QueuePool):
+                continue
+            checked_out.add_metric([name], pool.checkedout())
+            checked_in.add_metric([name], pool.checkedin())
+            overflow.add_metric([name], pool.overflow())
+            size.add_metric([name], pool.size())
+        yield from (checked_out, checked_in, overflow, size)
+
+
+REGISTRY.register(_PoolCollector())
+
+
+def current_route() -> str:
+    """현재 요청의 라우트 경로 템플릿 (/user/{uuid} 형태), 요청 밖이면 "-" """
+    scope = current_request_scope.get()
+    if scope is None:
+        return "-"
+    # 라우팅이 끝나면 FastAPI가 같은 scope에 route를 채워 넣음
+    return getattr(scope.get("route"), "path", None) or "unmatched"
+
+
+def _labels(name: str, statement: str) -> tuple:
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "UNKNOWN"
+    return name, operation, current_db_method.get() or "-", current_route()
+
+
+def instrument_engine(engine: Engine, name: str) -> Engine:
+    """엔진의 풀과 쿼리 이벤트에 계측 연결 (AsyncEngine이면 sync_engine을 넘김)"""
+    _engines[name] = engine
+    if isinstance(engine.pool, _InstrumentedPoolMixin):
+        engine.pool.metrics_name = name
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        labels = _labels(name, statement)
+        QUERY_DURATION.labels(*labels).observe(elapsed)
+        if cursor.rowcount is not None and cursor.rowcount >= 0:
+            QUERY_ROWS.labels(*labels).observe(cursor.rowcount)
+        if elapsed * 1000 >= SLOW_QUERY_MS:
+            SLOW_QUERIES.labels(*labels).inc()
+            logger.warning(
+                f"느린 쿼리 {elapsed * 1000:.1f}ms [{name}] method={labels[2]} route={labels[3]}: {' '.join(statement.split())[:1000]}"
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        if context.connection is not None and context.connection.info.get("query_start"):
+            context.connection.info["query_start"].pop()
+        QUERY_ERRORS.labels(*_labels(name, context.statement or "")).inc()
+
+    @event.listens_for(engine, "connect")
+    def connect(dbapi_connection, connection_record):
+        POOL_CONNECTIONS_CREATED.labels(name).inc()
+
+    @event.listens_for(engine, "invalidate")
+    def invalidate(dbapi_connection, connection_record, exception):
+        POOL_INVALIDATIONS.labels(name, "false").inc()
+
+    @event.listens_for(engine, "soft_invalidate")
+    def soft_invalidate(dbapi_connection, connection_record, exception):
+        POOL_INVALIDATIONS.labels(name, "true").inc()
+
+    return engine
+
+
+def instrument_methods(cls):
+    """
+    클래스 데코레이터, 공개 메서드 실행 중의 쿼리를 메서드 이름으로 구분
+    메서드가 다른 메서드를 부르면 바깥 메서드 이름으로 기록
+    """
+    for name in dir(cls):
+        func = getattr(cls, name)
+        if name.startswith("_") or name.startswith("check_") or name in ("transaction", "savepoint") or not callable(func) or isinstance(func, type):
+            continue
+
+        def wrap(func, name=name):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if current_db_method.get() is not None:
+                    return func(*args, **kwargs)
+                token = current_db_method.set(name)
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    current_db_method.reset(token)
+            return wrapper
+
+        setattr(cls, name, wrap(func))
+    return cls
+
+
+class DBMetricsMiddleware:
+    """요청 중 실행된 쿼리를 FastAPI 라우트로 구분하기 위해 요청 scope를 contextvar에 두는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        token = current_request_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            current_request_scope.reset(token)
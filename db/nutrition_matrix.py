@@ -0,0 +1,287 @@
+from db.database import engine
+from db.tables.food_table import FoodInfo, FoodNutrition
+from model.domain.food import normalize_food_name
+from model.domain.quantity import parse_grams
+from sqlalchemy import select
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+import numpy as np
+import pandas as pd
+import threading
+import logging
+import json
+import time
+import uuid
+import os
+
+"""
+nutrition matrix:
+    food_nutrition 전체를 열 지향 float32 행렬 스냅샷으로 보관
+        values      (음식 수, 영양소 수) float32, 값이 없으면 NaN
+        missing     values와 같은 모양의 결측 마스크
+        reference_g 영양성분함량기준량(g), 해석 불가면 NaN
+        serving_g   1회 섭취참고량(g), 해석 불가면 NaN
+    .npy 파일로 저장하고 mmap으로 읽어 여러 워커 프로세스가 페이지 캐시를 공유
+    data/db_migration.py 실행 후 rebuild_nutrition_matrix()로 다시 만든다
+"""
+
+logger = logging.getLogger(__name__)
+
+NUTRIENT_COLUMNS = [
+    "energy_kcal",
+    "moisture_g",
+    "protein_g",
+    "fat_g",
+    "ash_g",
+    "carbohydrate_g",
+    "sugars_g",
+    "dietary_fiber_g",
+    "calcium_mg",
+    "iron_mg",
+    "phosphorus_mg",
+    "potassium_mg",
+    "sodium_mg",
+    "vitamin_a_ug_rae",
+    "retinol_ug",
+    "beta_carotene_ug",
+    "thiamin_mg",
+    "riboflavin_mg",
+    "niacin_mg",
+    "vitamin_c_mg",
+    "vitamin_d_ug",
+    "cholesterol_mg",
+    "saturated_fat_g",
+    "trans_fat_g",
+]
+
+_ARRAY_NAMES = ("values", "missing", "reference_g", "serving_g")
+
+# 기준량을 해석할 수 없는 음식은 100g 기준으로 간주 (식품영양성분 DB 기본값)
+DEFAULT_REFERENCE_G = 100.0
+
+MATRIX_DIR = Path(os.getenv(
+    "NUTRITION_MATRIX_DIR",
+    Path(__file__).resolve().parent.parent / "data" / "cache" / "nutrition_matrix",
+))
+
+
+class NutritionMatrix:
+    """음식 x 영양소 열 지향 스냅샷"""
+
+    def __init__(
+            self,
+            food_ids: Sequence[str],
+            food_names: Sequence[str],
+            values: np.ndarray,
+            missing: np.ndarray,
+            reference_g: np.ndarray,
+            serving_g: np.ndarray,
+            version: str | None = None):
+        self.food_ids = list(food_ids)
+        self.food_names = list(food_names)
+        self.values = values
+        self.missing = missing
+        self.reference_g = reference_g
+        self.serving_g = serving_g
+        self.version = version
+        self.columns = list(NUTRIENT_COLUMNS)
+        self.column_index = {column: i for i, column in enumerate(self.columns)}
+        self.index = {food_id: i for i, food_id in enumerate(self.food_ids)}
+        self.name_index = {normalize_food_name(name): i for i, name in enumerate(self.food_names)}
+
+    def __len__(self) -> int:
+        return len(self.food_ids)
+
+    @classmethod
+    def from_database(cls, bind=engine) -> 'NutritionMatrix':
+        """food_nutrition 테이블 전체를 한 번에 읽어 스냅샷 생성"""
+        query = (
+            select(
+                FoodInfo.food_id,
+                FoodInfo.food_name,
+                FoodNutrition.nutrient_reference_amount_g,
+                FoodNutrition.serving_size_g,
+                *[getattr(FoodNutrition, column) for column in NUTRIENT_COLUMNS],
+            )
+            .join(FoodNutrition, FoodNutrition.food_id == FoodInfo.food_id)
+            .order_by(FoodInfo.food_id)
+        )
+        df = pd.read_sql(query, bind, coerce_float=True)
+        values = np.ascontiguousarray(df[NUTRIENT_COLUMNS].astype(np.float64).to_numpy(dtype=np.float32))
+        return cls(
+            food_ids=df["food_id"].tolist(),
+            food_names=df["food_name"].tolist(),
+            values=values,
+            missing=np.isnan(values),
+            reference_g=np.array([parse_grams(v) or np.nan for v in df["nutrient_reference_amount_g"]], dtype=np.float32),
+            serving_g=np.array([parse_grams(v) or np.nan for v in df["serving_size_g"]], dtype=np.float32),
+        )
+
+    def save(self, directory: Path | str = MATRIX_DIR) -> str:
+        """
+        스냅샷을 디렉토리에 저장, 새 버전 파일을 모두 쓴 뒤 meta.json을 교체하므로
+        읽는 쪽은 항상 완전한 한 버전만 보게 된다.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        previous = _stored_version(directory)
+        version = time.strftime("%Y%m%d%H%M%S") + "-" + uuid.uuid4().hex[:8]
+
+        for name in _ARRAY_NAMES:
+            np.save(directory / f"{name}-{version}.npy", getattr(self, name))
+        with open(directory / f"foods-{version}.json", "w", encoding="utf-8") as f:
+            json.dump({"food_ids": self.food_ids, "food_names": self.food_names}, f, ensure_ascii=False)
+
+        meta_tmp = directory / f"meta-{version}.json.tmp"
+        with open(meta_tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": version, "columns": self.columns, "rows": len(self)}, f)
+        os.replace(meta_tmp, directory / "meta.json")
+        self.version = version
+
+        # 직전 버전은 meta.json을 막 읽은 프로세스가 열 수 있도록 남기고 그보다 오래된 버전만 정리
+        # (이미 mmap 중인 프로세스는 열린 inode를 계속 사용)
+        keep = {version, previous} - {None}
+        for path in directory.iterdir():
+            if path.name != "meta.json" and not any(v in path.name for v in keep):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        return version
+
+    @classmethod
+    def load(cls, directory: Path | str = MATRIX_DIR, mmap: bool = True) -> 'NutritionMatrix':
+        """
+        저장된 스냅샷 로드, mmap이면 배열을 읽기 전용 메모리 매핑으로 연다
+        meta.json을 읽은 직후 다른 프로세스가 두 번 저장해 파일이 지워졌으면 meta.json을 다시 읽어 한 번 더 시도
+        """
+        directory = Path(directory)
+        try:
+            return cls._load_version(directory, mmap)
+        except FileNotFoundError:
+            logger.warning("영양 행렬 파일이 교체되어 meta.json을 다시 읽습니다.")
+            return cls._load_version(directory, mmap)
+
+    @classmethod
+    def _load_version(cls, directory: Path, mmap: bool) -> 'NutritionMatrix':
+        with open(directory / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        version = meta["version"]
+        if meta["columns"] != NUTRIENT_COLUMNS:
+            raise ValueError("영양 행렬의 컬럼 구성이 현재 코드와 다릅니다. rebuild_nutrition_matrix()로 다시 생성하세요.")
+
+        arrays = {
+            name: np.load(directory / f"{name}-{version}.npy", mmap_mode="r" if mmap else None)
+            for name in _ARRAY_NAMES
+        }
+        with open(directory / f"foods-{version}.json", "r", encoding="utf-8") as f:
+            foods = json.load(f)
+        return cls(food_ids=foods["food_ids"], food_names=foods["food_names"], version=version, **arrays)
+
+    def rows(self, food_ids: Sequence[str]) -> np.ndarray:
+        """food_id 목록을 행 번호로 변환, 없는 음식은 -1"""
+        return np.fromiter((self.index.get(food_id, -1) for food_id in food_ids), dtype=np.int64, count=len(food_ids))
+
+    def rows_by_names(self, food_names: Sequence[str]) -> np.ndarray:
+        """음식 이름 목록을 행 번호로 변환, 없는 음식은 -1"""
+        return np.fromiter(
+            (self.name_index.get(normalize_food_name(name), -1) for name in food_names),
+            dtype=np.int64,
+            count=len(food_names),
+        )
+
+    def column(self, nutrient: str) -> np.ndarray:
+        """영양소 한 개의 전체 카탈로그 값 (복사 없는 view)"""
+        return self.values[:, self.column_index[nutrient]]
+
+    def total(self, food_ids: Sequence[str], amounts_g: Sequence[float] | None = None) -> np.ndarray:
+        """
+        음식들의 영양소 합계 (결측은 0으로 취급)
+
+        Args:
+            food_ids: 합산할 음식 ID 목록, 카탈로그에 없는 음식은 무시
+            amounts_g: 음식별 섭취량(g), 주면 영양성분함량기준량 대비 비율로 환산
+        """
+        rows = self.rows(food_ids)
+        found = rows >= 0
+        block = self.values[rows[found]]
+        if amounts_g is not None:
+            reference_g = self.reference_g[rows[found]]
+            reference_g = np.where(np.isnan(reference_g), DEFAULT_REFERENCE_G, reference_g)
+            scale = np.asarray(amounts_g, dtype=np.float32)[found] / reference_g
+            block = block * scale[:, None]
+        return np.nansum(block, axis=0)
+
+    def filter(self, nutrient: str, min_value: float | None = None, max_value: float | None = None) -> List[str]:
+        """영양소 값이 범위 안인 음식 ID 목록 (결측은 제외)"""
+        column = self.column(nutrient)
+        mask = ~self.missing[:, self.column_index[nutrient]]
+        if min_value is not None:
+            mask &= column >= min_value
+        if max_value is not None:
+            mask &= column <= max_value
+        return [self.food_ids[i] for i in np.flatnonzero(mask)]
+
+    def rank(self, nutrient: str, k: int = 10, ascending: bool = False) -> List[Tuple[str, float]]:
+        """영양소 값 기준 상위 k개 (food_id, 값), 결측은 제외"""
+        column = self.column(nutrient)
+        candidates = np.flatnonzero(~self.missing[:, self.column_index[nutrient]])
+        k = min(k, len(candidates))
+        if k == 0:
+            return []
+        keys = column[candidates] if ascending else -column[candidates]
+        top = candidates[np.argpartition(keys, k - 1)[:k]]
+        top = top[np.argsort(column[top] if ascending else -column[top], kind="stable")]
+        return [(self.food_ids[i], float(column[i])) for i in top]
+
+
+_matrix: NutritionMatrix | None = None
+_matrix_lock = threading.RLock()
+_matrix_checked_at = 0.0
+# meta.json 변경 확인 주기(초)
+MATRIX_RELOAD_INTERVAL = float(os.getenv("NUTRITION_MATRIX_RELOAD_INTERVAL", "5"))
+
+
+def _stored_version(directory: Path) -> str | None:
+    try:
+        with open(directory / "meta.json", "r", encoding="utf-8") as f:
+            return json.load(f)["version"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def get_nutrition_matrix(directory: Path | str = MATRIX_DIR) -> NutritionMatrix:
+    """
+    프로세스 공용 영양 행렬
+    저장된 스냅샷을 mmap으로 열고, 다른 프로세스가 다시 만들면 주기적으로 새 버전을 연다.
+    스냅샷이 없으면 DB에서 만들어 저장한다.
+    """
+    global _matrix, _matrix_checked_at
+    directory = Path(directory)
+    now = time.monotonic()
+    if _matrix is not None and now - _matrix_checked_at < MATRIX_RELOAD_INTERVAL:
+        return _matrix
+
+    with _matrix_lock:
+        _matrix_checked_at = now
+        version = _stored_version(directory)
+        if _matrix is not None and _matrix.version == version:
+            return _matrix
+        if version is None:
+            _matrix = rebuild_nutrition_matrix(directory=directory)
+        else:
+            _matrix = NutritionMatrix.load(directory)
+        return _matrix
+
+
+def rebuild_nutrition_matrix(bind=engine, directory: Path | str = MATRIX_DIR) -> NutritionMatrix:
+    """DB에서 영양 행렬을 다시 만들어 저장하고, 저장된 파일을 mmap으로 다시 연다"""
+    global _matrix, _matrix_checked_at
+    matrix = NutritionMatrix.from_database(bind)
+    matrix.save(directory)
+    logger.info(f"영양 행렬 생성 완료: {len(matrix)}개 음식, 버전 {matrix.version}")
+    loaded = NutritionMatrix.load(directory)
+    with _matrix_lock:
+        _matrix = loaded
+        _matrix_checked_at = time.monotonic()
+    return loaded
@@ -0,0 +1,115 @@
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from typing import List, Sequence
+import threading
+import logging
+import time
+
+"""
+routing:
+    읽기 전용 복제본(replica) 라우팅
+        ReplicaRouter   복제본 엔진 라운드 로빈 선택, 연결 오류 시 제외 후 일정 시간 뒤 재확인
+        RoutingSession  SELECT는 복제본으로, 쓰기와 FOR UPDATE, 원시 SQL은 primary로 보냄
+    쓰기 메서드(check_session)가 시작된 세션, 한 번 쓰기가 일어난 세션, transaction() 안의 세션은 이후 읽기도 primary로 고정
+    (복제 지연 때문에 방금 쓴 값을 못 읽는 문제 방지, 데코레이터가 없는 조회 메서드만 복제본에서 읽음)
+"""
+
+logger = logging.getLogger(__name__)
+
+# session.info 키: True면 이 세션의 모든 쿼리를 primary로 보냄
+STICKY_PRIMARY = "sticky_primary"
+
+
+class ReplicaRouter:
+    """복제본 엔진 선택기"""
+
+    def __init__(self, primary: Engine, replicas: Sequence[Engine], retry_interval: float = 30.0):
+        """
+        Args:
+            primary: 쓰기용 엔진, 사용 가능한 복제본이 없으면 읽기도 여기로 보냄
+            replicas: 읽기용 엔진 목록
+            retry_interval: 오류로 제외된 복제본을 다시 확인하기까지의 시간(초)
+        """
+        self.primary = primary
+        self.replicas: List[Engine] = list(replicas)
+        self.retry_interval = retry_interval
+        self._down_until = {id(replica): 0.0 for replica in self.replicas}
+        self._next = 0
+        self._lock = threading.Lock()
+        for replica in self.replicas:
+            event.listen(replica, "handle_error", self._on_error)
+
+    def _on_error(self, context) -> None:
+        # 연결이 끊긴 경우에만 복제본을 제외 (SQL 오류는 복제본 상태와 무관)
+        if context.is_disconnect and context.engine is not None:
+            self.mark_down(context.engine)
+
+    def mark_down(self, replica: Engine) -> None:
+        if id(replica) in self._down_until:
+            logger.warning(f"복제본 연결 오류, {self.retry_interval}초 동안 제외: {replica.url.host}")
+            self._down_until[id(replica)] = time.monotonic() + self.retry_interval
+
+    def check(self, replica: Engine) -> bool:
+        """복제본에 SELECT 1을 보내 상태 확인, 실패하면 다시 제외"""
+        try:
+            with replica.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            logger.warning(f"복제본 상태 확인 실패: {replica.url.host} {e}")
+            self.mark_down(replica)
+            return False
+        self._down_until[id(replica)] = 0.0
+        return True
+
+    def healthy(self) -> List[Engine]:
+        """현재 사용 중인 복제본 목록"""
+        now = time.monotonic()
+        return [replica for replica in self.replicas if self._down_until[id(replica)] <= now]
+
+    def choose(self) -> Engine:
+        """다음 복제본 (라운드 로빈), 모두 제외 상태면 primary"""
+        if not self.replicas:
+            return self.primary
+        with self._lock:
+            start = self._next
+            self._next = (self._next + 1) % len(self.replicas)
+        now = time.monotonic()
+        for offset in range(len(self.replicas)):
+            replica = self.replicas[(start + offset) % len(self.replicas)]
+            down_until = self._down_until[id(replica)]
+            if down_until == 0.0:
+                return replica
+            # 제외 시간이 지난 복제본은 확인 후 복귀
+            if down_until <= now and self.check(replica):
+                return replica
+        return self.primary
+
+
+class RoutingSession(Session):
+    """쿼리 종류에 따라 primary/복제본을 고르는 세션, sessionmaker(class_=..., router=...)로 사용"""
+
+    def __init__(self, *args, router: ReplicaRouter, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.router = router
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        router = self.router
+        if self.info.get(STICKY_PRIMARY):
+            return router.primary
+        is_read = (
+            not self._flushing
+            and clause is not None
+            and getattr(clause, "is_select", False)
+            and getattr(clause, "_for_update_arg", None) is None
+        )
+        if not is_read:
+            # 쓰기 이후 같은 세션의 읽기는 primary에서 (read-your-writes)
+            self.info[STICKY_PRIMARY] = True
+            return router.primary
+        return router.choose()
+
+
+def use_primary(session) -> None:
+    """세션의 이후 쿼리를 모두 primary로 고정 (AsyncSession이면 내부 동기 세션에 적용)"""
+    getattr(session, "sync_session", session).info[STICKY_PRIMARY] = True
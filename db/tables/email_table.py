@@ -0,0 +1,36 @@
+from sqlalchemy import Column, BigInteger, Integer, String, Text, DateTime, Index, func
+from ..database import Base
+
+__all__ = [
+    "OutboundEmail",
+    "EmailVerification",
+]
+
+# 발송 대기 이메일 (서버가 재시작되어도 잃지 않도록 DB에 저장, service/email_sender.py가 발송)
+class OutboundEmail(Base):
+    __tablename__ = "outbound_email"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    recipient = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body_html = Column(Text, nullable=False)
+    status = Column(String(10), nullable=False, default="pending")  # pending, sending, sent, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=func.now())  # pending: 다음 발송 시각, sending: 점유 만료 시각
+    last_error = Column(String(500))
+    created_at = Column(DateTime, default=func.now())
+    sent_at = Column(DateTime)
+
+    __table_args__ = (
+        # 발송 대상 조회: status = 'pending' AND next_attempt_at <= now
+        Index("ix_outbound_email_status_next", "status", "next_attempt_at"),
+    )
+
+
+# 이메일 인증 코드 (여러 워커가 공유, 이메일당 최신 코드 하나)
+class EmailVerification(Base):
+    __tablename__ = "email_verification"
+
+    email = Column(String(255), primary_key=True)
+    code = Column(String(20), nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)  # 만료 행 정리용 인덱스
@@ -105,13 +105,13 @@ class FoodInfoTag(Base):
     __tablename__ = "food_info_tag"
 
     food_id = Column(String(19), ForeignKey("food_info.food_id"), primary_key=True)
-    tag_id = Column(Integer, ForeignKey("food_tag.tag_id"), primary_key=True)
+    tag_id = Column(Integer, ForeignKey("food_tag.tag_id"), primary_key=True, index=True)  # 태그별 음식 조회용
 
 class FoodTag(Base):
     __tablename__ = "food_tag"
 
     tag_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    tag_name = Column(String(500), nullable=False)
+    tag_name = Column(String(500), unique=True, nullable=False)  # 태그명: 고단백 (태그당 한 행)
 
     # Relationship
     food_info = relationship("FoodInfo", back_populates="tags", secondary="food_info_tag")
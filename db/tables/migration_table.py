@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, DateTime, func
+from ..database import Base
+
+__all__ = [
+    "MigrationCheckpoint",
+]
+
+# 데이터 적재 작업의 완료된 청크 기록 (중단 후 재실행 시 이어서 진행)
+class MigrationCheckpoint(Base):
+    __tablename__ = "migration_checkpoint"
+
+    job_name = Column(String(255), primary_key=True)  # 작업 이름: food_import:combine_data_cleaned.csv:chunk_size=1000
+    chunk_index = Column(Integer, primary_key=True, autoincrement=False)  # 0부터 시작하는 청크 번호
+    row_count = Column(Integer, nullable=False)  # 청크의 입력 행 수
+    created_count = Column(Integer, nullable=False)  # 새로 생성된 음식 수
+    completed_at = Column(DateTime, default=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, func, PrimaryKeyConstraint
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, ForeignKey, Float, func, PrimaryKeyConstraint, Index
 from sqlalchemy.orm import relationship
 from db.database import Base
 
@@ -10,6 +10,7 @@ __all__ = [
     "Password",
     "Subscription",
     "LoginLog",
+    "LoginLogHourly",
     "UserBody",
     "UserSchedule",
     "ScheduleFood",
@@ -27,7 +28,7 @@ class UserInfo(Base):
     social_login = relationship("SocialLogin", uselist=False, back_populates="user_info")
     password = relationship("Password", uselist=False, back_populates="user_info")
     subscription = relationship("Subscription", uselist=False, back_populates="user_info")
-    login_logs = relationship("LoginLog", back_populates="user_info")
+    login_logs = relationship("LoginLog", primaryjoin="UserInfo.uuid == foreign(LoginLog.uuid)", back_populates="user_info")
     user_schedule = relationship("UserSchedule", back_populates="user_info")
     food_inventory = relationship("UserFoodInventory", back_populates="user_info")
 
@@ -72,16 +73,36 @@ class Subscription(Base):
 
     user_info = relationship("UserInfo", uselist=False, back_populates="subscription")
 
+# 월 단위 RANGE 파티션 테이블 (db/login_log_partitions.py)
+# MySQL 파티션 테이블은 외래 키를 가질 수 없고 파티션 컬럼(datetime)이 기본 키에 포함되어야 함
 class LoginLog(Base):
     __tablename__ = "login_log"
+    __table_args__ = (
+        PrimaryKeyConstraint("log_id", "datetime"),
+    )
 
-    log_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    uuid = Column(String(36), ForeignKey("user_info.uuid"), index=True)
+    log_id = Column(BigInteger, autoincrement=True)
+    uuid = Column(String(36), index=True)  # user_info.uuid (외래 키 없음)
     status_code = Column(Integer)
     ip = Column(String(45))
-    datetime = Column(DateTime, default=func.now())
+    datetime = Column(DateTime, nullable=False, default=func.now())
 
-    user_info = relationship("UserInfo", uselist=False, back_populates="login_logs")
+    user_info = relationship("UserInfo", uselist=False, primaryjoin="foreign(LoginLog.uuid) == UserInfo.uuid", back_populates="login_logs")
+
+# 시간별 로그인 집계, 로그인 기록을 저장할 때 같은 트랜잭션에서 누적 (대시보드, 실패 횟수 조회용)
+class LoginLogHourly(Base):
+    __tablename__ = "login_log_hourly"
+    __table_args__ = (
+        PrimaryKeyConstraint("hour", "uuid", "ip", "status_code"),
+        Index("ix_login_log_hourly_ip_hour", "ip", "hour"),
+        Index("ix_login_log_hourly_uuid_hour", "uuid", "hour"),
+    )
+
+    hour = Column(DateTime, nullable=False)  # 정시로 내림한 시각
+    uuid = Column(String(36), nullable=False, default="")
+    ip = Column(String(45), nullable=False, default="")
+    status_code = Column(Integer, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
 
 class UserBody(Base):
     __tablename__ = "user_body"
@@ -101,10 +122,14 @@ class UserBody(Base):
 
 class UserSchedule(Base):
     __tablename__ = "user_schedule"
+    __table_args__ = (
+        # 사용자별 기간 조회 / keyset 페이지네이션 (uuid 단독 조회도 이 인덱스 사용)
+        Index("ix_user_schedule_uuid_datetime", "uuid", "datetime"),
+    )
 
     # meal_id를 고유한 기본 키로 설정하여 참조될 수 있게 함
     meal_id = Column(Integer, primary_key=True, autoincrement=True)
-    uuid = Column(String(36), ForeignKey("user_info.uuid"), index=True)
+    uuid = Column(String(36), ForeignKey("user_info.uuid"))
     datetime = Column(DateTime, default=func.now())
 
     # ScheduleFood 객체 목록에 접근할 수 있는 'foods' 멤버
@@ -121,20 +146,30 @@ class ScheduleFood(Base):
     meal_id = Column(Integer, ForeignKey("user_schedule.meal_id"))
     food_id = Column(String(30), ForeignKey("food_info.food_id"))
     food_name = Column(String(255), nullable=False)
-    quantity = Column(Float, nullable=False)
+    quantity = Column(Float, nullable=True)  # 양의 수치, 해석할 수 없거나 단위가 섞여 합칠 수 없으면 NULL
+    unit = Column(String(20), nullable=True)  # quantity의 단위: g, ml, serving 등 (없으면 NULL)
+    amount_text = Column(String(255), nullable=True)  # 입력된 양 원문: "300g", 합친 경우 "300g + 2인분"
 
     # UserSchedule 객체에 접근할 수 있는 'user_schedule' 멤버
     user_schedule = relationship("UserSchedule", back_populates="foods")
+    # 음식 정보 (영양성분 조회용, 읽기 전용)
+    food = relationship("FoodInfo", uselist=False, viewonly=True)
 
 class UserFoodInventory(Base):
     __tablename__ = "user_food_inventory"
     __table_args__ = (
         PrimaryKeyConstraint('uuid', 'food_id'),
+        # 사용자별 유통기한 임박 조회
+        Index("ix_user_food_inventory_uuid_expired", "uuid", "expired"),
     )
 
     uuid = Column(String(36), ForeignKey("user_info.uuid"), index=True)
     food_id = Column(String(19), ForeignKey("food_info.food_id"), index=True)
-    quantity = Column(String(500), nullable=False)
+    quantity = Column(String(500), nullable=False)  # 입력 원문: 300g, 2인분
+    # quantity를 저장할 때 해석한 값 (model/domain/quantity.py), 해석할 수 없으면 NULL
+    amount = Column(Float)  # 수치: 300, 2
+    unit = Column(String(20))  # 정규화한 단위: g, ml, serving, 없으면 NULL
+    amount_g = Column(Float)  # g 환산값, 무게/부피 단위가 아니면 NULL
     expired = Column(DateTime)
 
     user_info = relationship("UserInfo", uselist=False, back_populates="food_inventory")
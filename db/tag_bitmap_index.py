@@ -0,0 +1,318 @@
+from db.database import engine
+from db.tables.food_table import FoodInfo, FoodInfoTag, FoodTag
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, List, Sequence
+import numpy as np
+import threading
+import asyncio
+import logging
+import re
+
+"""
+tag bitmap index:
+    태그별로 음식 집합을 비트맵(음식 순번 = 비트 위치)으로 메모리에 보관
+        food_info를 food_id 순으로 정렬한 순번을 비트 위치로 사용
+        "고단백 AND 저염 AND NOT 유제품" 같은 식을 비트 연산으로 계산
+    음식이 추가되면 백그라운드 스레드에서 다시 만들고 그동안은 기존 인덱스로 응답, 기존 음식의 태그 변경은 커밋 후 해당 비트만 갱신
+        비트맵은 압축하지 않은 파이썬 정수 (음식 수 / 8 바이트), 태그 변경은 새 dict를 만들어 교체하므로 조회는 잠금 없이 한 시점의 dict를 읽음
+    비동기 라우트는 load_tag_bitmap_index()로 먼저 불러둠 (처음 만들 때 전체 조회가 이벤트 루프를 막지 않도록)
+"""
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r'\s*(?:(\()|(\))|(&&?|\|\|?|!|-)|"([^"]*)"|([^\s()&|!"]+))')
+_KEYWORDS = {"and": "&", "or": "|", "not": "!"}
+_PENDING_KEY = "tag_bitmap_pending"
+
+
+def _to_bitmap(ordinals: np.ndarray, size: int) -> int:
+    """순번 배열 -> 비트맵 정수"""
+    mask = np.zeros(size, dtype=bool)
+    mask[ordinals] = True
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+def _to_ordinals(bitmap: int, size: int) -> np.ndarray:
+    """비트맵 정수 -> 순번 배열 (오름차순)"""
+    if bitmap == 0:
+        return np.empty(0, dtype=np.int64)
+    raw = np.frombuffer(bitmap.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder="little")[:size])
+
+
+class TagBitmapIndex:
+    """태그별 음식 비트맵 인덱스"""
+
+    def __init__(self, food_ids: Sequence[str], tag_ordinals: Dict[str, Iterable[int]]):
+        self.food_ids = list(food_ids)
+        self.ordinal = {food_id: i for i, food_id in enumerate(self.food_ids)}
+        self.size = len(self.food_ids)
+        self.universe = (1 << self.size) - 1
+        self.bitmaps: Dict[str, int] = {}
+        # 음식 순번 -> 태그 집합 (태그 변경 시 바뀌는 태그만 갱신하기 위한 역방향 맵)
+        self.food_tags: Dict[int, frozenset] = {}
+        for tag_name, ordinals in tag_ordinals.items():
+            ordinals = np.fromiter(ordinals, dtype=np.int64)
+            self.bitmaps[tag_name] = _to_bitmap(ordinals, self.size)
+            for ordinal in ordinals.tolist():
+                self.food_tags[ordinal] = self.food_tags.get(ordinal, frozenset()) | {tag_name}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.size
+
+    @classmethod
+    def from_database(cls, bind=engine) -> 'TagBitmapIndex':
+        """food_info, food_info_tag 전체를 읽어 인덱스 생성"""
+        with bind.connect() as connection:
+            food_ids = connection.scalars(select(FoodInfo.food_id).order_by(FoodInfo.food_id)).all()
+            ordinal = {food_id: i for i, food_id in enumerate(food_ids)}
+            tag_ordinals: Dict[str, List[int]] = {}
+            rows = connection.execute(
+                select(FoodTag.tag_name, FoodInfoTag.food_id).join(FoodTag, FoodTag.tag_id == FoodInfoTag.tag_id)
+            )
+            for tag_name, food_id in rows:
+                if food_id in ordinal:
+                    tag_ordinals.setdefault(tag_name, []).append(ordinal[food_id])
+        return cls(food_ids, tag_ordinals)
+
+    def tags(self) -> List[str]:
+        return sorted(self.bitmaps)
+
+    def set_food_tags(self, food_id: str, tag_names: Iterable[str]) -> bool:
+        """음식 하나의 태그를 교체, 인덱스에 없는 음식이면 False (다시 만들어야 함)"""
+        ordinal = self.ordinal.get(food_id)
+        if ordinal is None:
+            return False
+        bit = 1 << ordinal
+        tag_names = frozenset(tag_names)
+        with self._lock:
+            old_tag_names = self.food_tags.get(ordinal, frozenset())
+            if old_tag_names == tag_names:
+                return True
+            # 읽는 쪽이 순회 중인 dict는 건드리지 않고 복사본을 고쳐 교체
+            bitmaps = dict(self.bitmaps)
+            for tag_name in old_tag_names - tag_names:
+                bitmap = bitmaps.get(tag_name, 0) & ~bit
+                if bitmap:
+                    bitmaps[tag_name] = bitmap
+                else:
+                    bitmaps.pop(tag_name, None)
+            for tag_name in tag_names - old_tag_names:
+                bitmaps[tag_name] = bitmaps.get(tag_name, 0) | bit
+            if tag_names:
+                self.food_tags[ordinal] = tag_names
+            else:
+                self.food_tags.pop(ordinal, None)
+            self.bitmaps = bitmaps
+        return True
+
+    def evaluate(self, expression: str) -> int:
+        """
+        태그 식을 비트맵으로 계산
+
+        문법: AND(&) / OR(|) / NOT(!, -) / 괄호, 우선순위는 NOT > AND > OR
+              공백이나 연산자가 들어간 태그는 "..."로 감싼다, 연산자 없이 나열하면 AND
+        예시: 고단백 AND 저염 AND NOT 유제품, (한식 | 양식) & !"매운 음식"
+        없는 태그는 빈 집합으로 본다.
+
+        Raises:
+            ValueError: 식의 문법이 잘못된 경우
+        """
+        return self._evaluate(expression, self.bitmaps)
+
+    def _evaluate(self, expression: str, bitmaps: Dict[str, int]) -> int:
+        tokens = self._tokenize(expression)
+        if not tokens:
+            raise ValueError("태그 식이 비어 있습니다.")
+        position = 0
+
+        def peek():
+            return tokens[position] if position < len(tokens) else None
+
+        def take():
+            nonlocal position
+            position += 1
+            return tokens[position - 1]
+
+        def parse_or():
+            result = parse_and()
+            while peek() == ("op", "|"):
+                take()
+                result |= parse_and()
+            return result
+
+        def parse_and():
+            result = parse_not()
+            while peek() is not None and peek() not in (("op", "|"), ("op", ")")):
+                if peek() == ("op", "&"):
+                    take()
+                result &= parse_not()
+            return result
+
+        def parse_not():
+            if peek() == ("op", "!"):
+                take()
+                return self.universe & ~parse_not()
+            return parse_atom()
+
+        def parse_atom():
+            token = take() if peek() is not None else None
+            if token == ("op", "("):
+                result = parse_or()
+                if peek() != ("op", ")"):
+                    raise ValueError(f"괄호가 닫히지 않았습니다: {expression}")
+                take()
+                return result
+            if token is None or token[0] != "tag":
+                raise ValueError(f"태그가 와야 할 자리에 {token[1] if token else '식의 끝'}이(가) 있습니다: {expression}")
+            return bitmaps.get(token[1], 0)
+
+        result = parse_or()
+        if peek() is not None:
+            raise ValueError(f"해석할 수 없는 부분이 있습니다: {expression}")
+        return result
+
+    @staticmethod
+    def _tokenize(expression: str) -> List[tuple]:
+        tokens = []
+        position = 0
+        expression = expression.rstrip()
+        while position < len(expression):
+            match = _TOKEN_PATTERN.match(expression, position)
+            if match is None:
+                raise ValueError(f"해석할 수 없는 문자가 있습니다: {expression[position:]}")
+            position = match.end()
+            open_paren, close_paren, symbol, quoted, word = match.groups()
+            if open_paren or close_paren:
+                tokens.append(("op", open_paren or close_paren))
+            elif symbol:
+                tokens.append(("op", "!" if symbol == "-" else symbol[0]))
+            elif quoted is not None:
+                tokens.append(("tag", quoted.strip()))
+            elif word.lower() in _KEYWORDS:
+                tokens.append(("op", _KEYWORDS[word.lower()]))
+            else:
+                tokens.append(("tag", word))
+        return tokens
+
+    def query(self, expression: str, limit: int | None = None, offset: int = 0) -> List[str]:
+        """식에 맞는 food_id 목록 (food_id 순)"""
+        ordinals = _to_ordinals(self.evaluate(expression), self.size)
+        end = None if limit is None else offset + limit
+        return [self.food_ids[i] for i in ordinals[offset:end]]
+
+    def count(self, expression: str) -> int:
+        """식에 맞는 음식 수"""
+        return self.evaluate(expression).bit_count()
+
+    def facets(self, expression: str | None = None, tag_names: Iterable[str] | None = None) -> Dict[str, int]:
+        """식에 맞는 음식 안에서 태그별 음식 수 (필터 화면의 태그 옆 숫자), 0인 태그는 제외"""
+        bitmaps = self.bitmaps
+        base = self.universe if expression is None else self._evaluate(expression, bitmaps)
+        tag_names = bitmaps if tag_names is None else tag_names
+        counts = {}
+        for tag_name in tag_names:
+            count = (bitmaps.get(tag_name, 0) & base).bit_count()
+            if count:
+                counts[tag_name] = count
+        return counts
+
+
+_index: TagBitmapIndex | None = None
+_index_stale = False
+_build_lock = threading.Lock()
+_rebuild_lock = threading.Lock()
+_rebuild_thread: threading.Thread | None = None
+
+
+def _build(only_if_missing: bool) -> TagBitmapIndex | None:
+    """DB에서 인덱스를 만들어 교체 (동기, 이벤트 루프 밖에서 호출)"""
+    global _index, _index_stale
+    with _build_lock:
+        if only_if_missing and _index is not None:
+            return _index
+        # 만드는 동안 들어온 변경은 _index_stale로 다음 재생성에 반영
+        _index_stale = False
+        index = TagBitmapIndex.from_database()
+        _index = index
+    logger.info(f"태그 비트맵 인덱스 생성 완료: 음식 {len(index)}개, 태그 {len(index.bitmaps)}개")
+    return index
+
+
+def _rebuild() -> None:
+    try:
+        _build(only_if_missing=False)
+    except Exception as e:
+        logger.exception(f"태그 비트맵 인덱스 재생성 실패: {e}")
+
+
+def _rebuilding() -> bool:
+    return _rebuild_thread is not None and _rebuild_thread.is_alive()
+
+
+def refresh_tag_bitmap_index() -> None:
+    """백그라운드 스레드에서 인덱스를 다시 만듦, 이미 만드는 중이면 무시"""
+    global _rebuild_thread
+    with _rebuild_lock:
+        if _rebuilding():
+            return
+        _rebuild_thread = threading.Thread(target=_rebuild, name="tag-bitmap-index", daemon=True)
+        _rebuild_thread.start()
+
+
+def get_tag_bitmap_index() -> TagBitmapIndex:
+    """
+    프로세스 공용 태그 비트맵 인덱스
+    음식이 추가된 뒤에는 기존 인덱스를 돌려주고 새 인덱스는 백그라운드에서 만들어 교체한다.
+    아직 없으면 만들 때까지 기다리므로 비동기 라우트에서는 load_tag_bitmap_index()를 먼저 호출한다.
+    """
+    index = _index
+    if index is None:
+        return _build(only_if_missing=True)
+    if _index_stale:
+        refresh_tag_bitmap_index()
+    return index
+
+
+async def load_tag_bitmap_index() -> TagBitmapIndex:
+    """비동기 라우트용, 인덱스가 없으면 스레드 풀에서 만들어 이벤트 루프를 막지 않음"""
+    if _index is None:
+        return await asyncio.to_thread(get_tag_bitmap_index)
+    return get_tag_bitmap_index()
+
+
+def invalidate_tag_bitmap_index() -> None:
+    """인덱스를 다시 만들도록 표시, 다음 조회 때 백그라운드 재생성 시작"""
+    global _index_stale
+    _index_stale = True
+
+
+def schedule_food_tags(session: Session, food_id: str, tag_names: Iterable[str] | None) -> None:
+    """
+    세션 트랜잭션이 커밋되면 인덱스에 반영할 태그 변경을 기록
+    tag_names가 None이면 음식 추가처럼 순번이 바뀌는 변경이므로 인덱스를 다시 만든다.
+    """
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    pending[food_id] = None if tag_names is None else [tag_name.strip() for tag_name in tag_names]
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_tags(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending or _index is None:
+        return
+    if _rebuilding():
+        # 만드는 중인 인덱스가 이 변경을 읽었는지 알 수 없으므로 한 번 더 만듦
+        invalidate_tag_bitmap_index()
+        return
+    for food_id, tag_names in pending.items():
+        if tag_names is None or not _index.set_food_tags(food_id, tag_names):
+            invalidate_tag_bitmap_index()
+            return
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_tags(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,132 @@
+from db.tables.food_table import FoodTag, FoodInfoTag
+from sqlalchemy import delete, event, insert, select
+from sqlalchemy.orm import Session
+from typing import Dict, Iterable, List, Tuple
+import threading
+
+"""
+tag dictionary:
+    food_tag를 태그 이름당 한 행만 갖는 사전으로 관리
+        resolve     태그 이름 -> tag_id, 없는 이름은 INSERT IGNORE로 한 번에 추가
+        link        (food_id, 태그 이름) 연결을 food_info_tag에 multi-row INSERT
+        replace     음식 하나의 태그 연결 교체
+    이름 -> id 대응은 프로세스 메모리에 보관 (tag_id는 바뀌지 않으므로 무효화 불필요,
+    compact_food_tags 같은 병합 작업 후에만 clear)
+    새로 만든 태그는 트랜잭션이 커밋된 뒤에 공용 사전에 반영 (롤백된 id가 남지 않도록)
+"""
+
+_PENDING_KEY = "tag_dictionary_pending"
+
+
+class TagDictionary:
+    """태그 이름 -> tag_id 사전"""
+
+    # IN (...) 절 하나에 넣을 최대 이름 개수
+    chunk_size = 500
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @staticmethod
+    def normalize(tag_name: str) -> str:
+        return tag_name.strip()
+
+    def _load(self, session: Session, names: List[str], pending: bool = False) -> None:
+        """
+        DB에서 이름 -> id를 읽어 사전에 반영
+        pending이면 현재 트랜잭션에서 만든 태그이므로 세션에만 두고 커밋 후 반영
+        """
+        target = session.info.setdefault(_PENDING_KEY, {}) if pending else None
+        for start in range(0, len(names), self.chunk_size):
+            chunk = names[start:start + self.chunk_size]
+            rows = session.execute(
+                select(FoodTag.tag_name, FoodTag.tag_id).where(FoodTag.tag_name.in_(chunk)).order_by(FoodTag.tag_id)
+            ).all()
+            if target is not None:
+                for tag_name, tag_id in rows:
+                    target.setdefault(tag_name, tag_id)
+                continue
+            with self._lock:
+                for tag_name, tag_id in rows:
+                    # 병합 전 중복 행이 남아 있으면 가장 작은 tag_id를 사용
+                    self._ids.setdefault(tag_name, tag_id)
+
+    def _commit_pending(self, session: Session) -> None:
+        pending = session.info.pop(_PENDING_KEY, None)
+        if pending:
+            with self._lock:
+                for tag_name, tag_id in pending.items():
+                    self._ids.setdefault(tag_name, tag_id)
+
+    def get_id(self, session: Session, tag_name: str) -> int | None:
+        """태그 이름의 tag_id, 없는 태그면 None (새로 만들지 않음)"""
+        return self.resolve(session, [tag_name], create=False).get(self.normalize(tag_name))
+
+    def resolve(self, session: Session, tag_names: Iterable[str], create: bool = True) -> Dict[str, int]:
+        """
+        태그 이름들을 tag_id로 변환
+
+        Args:
+            tag_names: 태그 이름 목록, 앞뒤 공백은 제거하고 빈 이름은 무시
+            create: 없는 태그를 새로 만들지 여부, False면 결과에서 빠짐
+        """
+        names = list(dict.fromkeys(name for name in map(self.normalize, tag_names) if name))
+        pending = session.info.get(_PENDING_KEY, {})
+        misses = [name for name in names if name not in self._ids and name not in pending]
+        if misses:
+            self._load(session, misses)
+            misses = [name for name in misses if name not in self._ids]
+        if misses and create:
+            # 동시에 같은 이름을 넣는 다른 세션이 있어도 unique 인덱스로 한 행만 남음
+            session.execute(insert(FoodTag).prefix_with("IGNORE"), [{"tag_name": name} for name in misses])
+            self._load(session, misses, pending=True)
+            pending = session.info.get(_PENDING_KEY, {})
+        resolved = {}
+        for name in names:
+            tag_id = self._ids.get(name, pending.get(name))
+            if tag_id is not None:
+                resolved[name] = tag_id
+        return resolved
+
+    def link(self, session: Session, pairs: Iterable[Tuple[str, str]]) -> int:
+        """(food_id, 태그 이름) 연결을 일괄 저장, 이미 있는 연결은 무시하고 저장한 연결 수 반환"""
+        pairs = list(pairs)
+        tag_ids = self.resolve(session, (tag_name for _, tag_name in pairs))
+        links = list(dict.fromkeys(
+            (food_id, tag_ids[self.normalize(tag_name)])
+            for food_id, tag_name in pairs
+            if self.normalize(tag_name) in tag_ids
+        ))
+        if links:
+            session.execute(
+                insert(FoodInfoTag).prefix_with("IGNORE"),
+                [{"food_id": food_id, "tag_id": tag_id} for food_id, tag_id in links],
+            )
+        return len(links)
+
+    def replace(self, session: Session, food_id: str, tag_names: Iterable[str]) -> int:
+        """음식 하나의 태그 연결을 주어진 태그로 교체"""
+        session.execute(delete(FoodInfoTag).where(FoodInfoTag.food_id == food_id))
+        return self.link(session, ((food_id, tag_name) for tag_name in tag_names))
+
+    def clear(self) -> None:
+        """메모리 사전 비우기 (태그 병합 등으로 tag_id가 바뀐 뒤 호출)"""
+        with self._lock:
+            self._ids.clear()
+
+
+tag_dictionary = TagDictionary()
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_tags(session: Session) -> None:
+    tag_dictionary._commit_pending(session)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_tags(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
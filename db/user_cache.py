@@ -0,0 +1,172 @@
+from db.cache import TTLCache
+from model.domain.user import User
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from typing import Dict
+import itertools
+import threading
+import logging
+import os
+
+"""
+user cache:
+    인증된 사용자(auth-only 프로필) 캐시, get_current_user가 매 요청 DB를 조회하지 않도록 함
+        키: (토큰 subject(uuid), 토큰 id(jti))
+        짧은 TTL, 비밀번호/소셜 로그인/신체 정보 변경과 탈퇴 시 사용자 단위로 무효화
+    AUTH_CACHE_REDIS_URL이 있으면 여러 워커가 Redis를 공유 (redis 패키지 필요)
+    사용자 단위 무효화는 사용자별 버전 번호를 바꿔서 처리 (해당 사용자의 모든 토큰 항목이 무효)
+"""
+
+logger = logging.getLogger(__name__)
+
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", "30"))
+AUTH_CACHE_MAXSIZE = int(os.getenv("AUTH_CACHE_MAXSIZE", "10000"))
+AUTH_CACHE_REDIS_URL = os.getenv("AUTH_CACHE_REDIS_URL")
+
+_PENDING_KEY = "auth_cache_pending"
+
+
+class MemoryAuthBackend:
+    """
+    프로세스 내 캐시
+    사용자별 버전은 항목과 같은 크기, 두 배 TTL의 캐시에 두고 프로세스 안에서 겹치지 않는 번호를 쓴다.
+    버전이 없으면(무효화, 만료, 밀려남) 그 사용자의 기존 항목은 모두 무효로 본다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._versions = TTLCache(maxsize=maxsize, ttl=ttl * 2)
+        self._next_version = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def get(self, uuid: str, jti: str) -> User | None:
+        entry = self._entries.get((uuid, jti))
+        if entry is None:
+            return None
+        version, user = entry
+        return user if version == self._versions.get(uuid) else None
+
+    def set(self, uuid: str, jti: str, user: User) -> None:
+        with self._lock:
+            version = self._versions.get(uuid)
+            if version is None:
+                version = next(self._next_version)
+                self._versions.set(uuid, version)
+        self._entries.set((uuid, jti), (version, user))
+
+    def invalidate(self, uuid: str) -> None:
+        self._versions.pop(uuid)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._versions.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._entries.stats()
+
+
+class RedisAuthBackend:
+    """Redis 공유 캐시 (멀티 워커), 조회는 MGET 한 번"""
+
+    def __init__(self, url: str, ttl: float, prefix: str = "auth_user"):
+        import redis
+        self._redis = redis.Redis.from_url(url)
+        self._ttl_ms = int(ttl * 1000)
+        self._prefix = prefix
+        self._hits = 0
+        self._misses = 0
+
+    def _entry_key(self, uuid: str, jti: str) -> str:
+        return f"{self._prefix}:{uuid}:{jti}"
+
+    def _version_key(self, uuid: str) -> str:
+        return f"{self._prefix}:ver:{uuid}"
+
+    def get(self, uuid: str, jti: str) -> User | None:
+        version, payload = self._redis.mget(self._version_key(uuid), self._entry_key(uuid, jti))
+        if payload is not None:
+            entry_version, _, data = payload.partition(b":")
+            if int(entry_version) == int(version or 0):
+                self._hits += 1
+                return User.model_validate_json(data)
+        self._misses += 1
+        return None
+
+    def set(self, uuid: str, jti: str, user: User) -> None:
+        version = int(self._redis.get(self._version_key(uuid)) or 0)
+        payload = f"{version}:".encode() + user.model_dump_json().encode()
+        self._redis.set(self._entry_key(uuid, jti), payload, px=self._ttl_ms)
+
+    def invalidate(self, uuid: str) -> None:
+        pipe = self._redis.pipeline()
+        pipe.incr(self._version_key(uuid))
+        # 버전 키는 항목보다 오래 남아 있기만 하면 됨
+        pipe.pexpire(self._version_key(uuid), self._ttl_ms * 10)
+        pipe.execute()
+
+    def clear(self) -> None:
+        for key in self._redis.scan_iter(f"{self._prefix}:*"):
+            self._redis.delete(key)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self._hits, "misses": self._misses}
+
+
+class AuthUserCache:
+    """get_current_user용 인증 사용자 캐시"""
+
+    def __init__(self, maxsize: int = AUTH_CACHE_MAXSIZE, ttl: float = AUTH_CACHE_TTL, redis_url: str | None = AUTH_CACHE_REDIS_URL):
+        self.backend = None
+        if redis_url:
+            try:
+                self.backend = RedisAuthBackend(redis_url, ttl)
+            except ImportError:
+                logger.warning("AUTH_CACHE_REDIS_URL이 설정되었지만 redis 패키지가 없어 프로세스 내 캐시를 사용합니다.")
+        if self.backend is None:
+            self.backend = MemoryAuthBackend(maxsize, ttl)
+
+    def get(self, uuid: str, jti: str | None) -> User | None:
+        try:
+            return self.backend.get(uuid, jti or "-")
+        except Exception as e:
+            # 캐시 장애 시 DB 조회로 진행
+            logger.warning(f"인증 캐시 조회 실패: {e}")
+            return None
+
+    def set(self, uuid: str, jti: str | None, user: User) -> None:
+        try:
+            self.backend.set(uuid, jti or "-", user)
+        except Exception as e:
+            logger.warning(f"인증 캐시 저장 실패: {e}")
+
+    def invalidate(self, uuid: str) -> None:
+        self.backend.invalidate(uuid)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self.backend.stats()
+
+
+auth_user_cache = AuthUserCache()
+
+
+def invalidate_user_on_commit(session: Session, uuid: str) -> None:
+    """
+    사용자 캐시 무효화, 지금 한 번 하고 트랜잭션 커밋 후 한 번 더 한다.
+    (커밋 전에 다른 요청이 옛 값을 다시 캐시에 넣는 경우 방지)
+    """
+    auth_user_cache.invalidate(uuid)
+    session.info.setdefault(_PENDING_KEY, set()).add(uuid)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_pending_users(session: Session) -> None:
+    for uuid in session.info.pop(_PENDING_KEY, ()):
+        auth_user_cache.invalidate(uuid)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_users(session: Session, previous_transaction) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Dict, Literal
 
 
 class MandatoryNutrition(BaseModel):
@@ -119,4 +119,23 @@ class Food(BaseModel):
             food_nutrition=food_nutrition,
             food_tags=food_tags,
             food_category=food_category,
-        )
\ No newline at end of file
+        )
+
+
+def normalize_food_name(food_name: str) -> str:
+    """음식 이름 비교용 정규화 (앞뒤 공백 제거, 대소문자 무시)"""
+    return food_name.strip().casefold()
+
+
+class FoodBatch(BaseModel):
+    """일괄 조회 결과, foods는 요청한 키 순서를 유지한다"""
+    foods: Dict[str, Food] = {}
+    missing: List[str] = []
+
+
+class FoodCreateStatus(BaseModel):
+    """일괄 생성 결과 (입력 레코드 하나당 하나)"""
+    food_id: str | None = None
+    food_name: str | None = None
+    status: Literal["created", "conflict", "invalid", "error"]
+    detail: str | None = None
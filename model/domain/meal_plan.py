@@ -0,0 +1,51 @@
+from pydantic import BaseModel, Field
+from typing import List
+from datetime import time, date
+
+
+class NutrientData(BaseModel):
+    """사용자의 일일 권장 영양소 섭취량 데이터."""
+    energy_kcal: float = Field(..., description="권장 일일 에너지 섭취량 (kcal).")
+    protein_g: float = Field(..., description="권장 일일 단백질 섭취량 (g).")
+    fat_g: float = Field(..., description="권장 일일 지방 섭취량 (g).")
+    carbohydrate_g: float = Field(..., description="권장 일일 탄수화물 섭취량 (g).")
+    sugars_g: float = Field(..., description="권장 일일 당류 섭취량 (g).")
+    sodium_mg: float = Field(..., description="권장 일일 나트륨 섭취량 (mg).")
+    cholesterol_mg: float = Field(..., description="권장 일일 콜레스테롤 섭취량 (mg).")
+    saturated_fat_g: float = Field(..., description="권장 일일 포화지방 섭취량 (g).")
+    trans_fat_g: float = Field(..., description="권장 일일 트랜스지방 섭취량 (g).")
+
+
+# 음식 이름과 영양 정보를 함께 담을 Pydantic 모델
+class FoodItem(BaseModel):
+    """식단 내의 단일 음식 항목입니다. 이름과 함께 9가지 영양 정보를 포함합니다."""
+    food_name: str = Field(..., description="음식의 이름입니다.")
+    food_amount: str = Field(..., description="섭취할 음식의 양입니다.")
+
+# 각 식사를 나타내는 Pydantic 모델 (food_list 타입 변경)
+class Meal(BaseModel):
+    """단일 식사에 대한 상세 정보입니다."""
+    time_slot: time = Field(..., description="식사 시간입니다. 'HH:MM' 형식의 분 단위 시간으로 표시됩니다 (예: '13:00').")
+    food_list: List[FoodItem] = Field(..., description="해당 식사에 포함되는 음식 목록입니다.")
+
+# 하루의 식단 계획을 나타내는 Pydantic 모델
+class DailyPlan(BaseModel):
+    """하루의 식단 계획 정보입니다."""
+    day: date = Field(..., description="해당 식단 계획의 날짜입니다. 'YYYY-MM-DD' 형식의 일단위 날짜로 표시됩니다 (예: '2025-06-23').")
+    meals: List[Meal] = Field(..., description="해당 요일의 식사 목록입니다.")
+    nutrients: NutrientData = Field(..., description="해당 날짜의 9가지 영양 정보입니다.")
+
+# 주간 식단 계획 전체를 나타내는 Pydantic 모델
+class WeeklyMealPlan(BaseModel):
+    """7일간의 주간 식단 계획 전체입니다."""
+    days: List[DailyPlan] = Field(..., description="각 요일의 식단 계획 목록입니다. 총 7개의 DailyPlan 객체를 포함해야 합니다.")
+
+
+class PlanSaveResult(BaseModel):
+    """주간 식단 저장 결과"""
+    days: List[date] = Field(default_factory=list, description="교체한 날짜 목록입니다.")
+    deleted_meals: int = Field(0, description="삭제한 기존 식사 수입니다.")
+    created_meals: int = Field(0, description="새로 저장한 식사 수입니다.")
+    created_foods: int = Field(0, description="새로 저장한 음식 항목 수입니다.")
+    unresolved_foods: List[str] = Field(default_factory=list, description="DB에서 찾지 못해 food_id 없이 저장한 음식 이름 목록입니다.")
+    unmerged_foods: List[str] = Field(default_factory=list, description="한 식사 안에서 단위가 달라 양을 합치지 못하고 원문만 저장한 음식 이름 목록입니다.")
@@ -0,0 +1,103 @@
+import re
+from typing import Dict, Iterable, Tuple
+
+"""
+quantity:
+    "300g", "1.5 kg", "200ml", "2인분" 같은 자유 형식 양을 (수치, 단위)로 해석
+    무게/부피 단위는 g 기준으로 환산 (ml은 밀도 1로 간주)
+    같은 음식의 양 합치기: 단위가 같으면 그대로, 무게/부피끼리는 g으로 환산해서, 그 밖에는 합치지 않음
+"""
+
+# 단위 -> g 환산 계수
+GRAM_FACTORS = {
+    "mg": 0.001,
+    "g": 1.0,
+    "kg": 1000.0,
+    "ml": 1.0,
+    "l": 1000.0,
+}
+
+# 단위 표기 정규화
+UNIT_ALIASES = {
+    "밀리그램": "mg",
+    "그램": "g",
+    "그람": "g",
+    "gram": "g",
+    "grams": "g",
+    "킬로그램": "kg",
+    "키로": "kg",
+    "밀리리터": "ml",
+    "미리": "ml",
+    "cc": "ml",
+    "리터": "l",
+    "인분": "serving",
+    "회": "serving",
+    "회분": "serving",
+    "serving": "serving",
+    "servings": "serving",
+}
+
+_QUANTITY_PATTERN = re.compile(r"^\s*(\d+(?:[.,]\d+)?|\.\d+)\s*([^\d\s]*)")
+
+
+def parse_quantity(text: str | float | int | None) -> Tuple[float | None, str | None]:
+    """
+    자유 형식 양을 (수치, 단위)로 해석
+
+    Returns:
+        (amount, unit), 해석할 수 없으면 (None, None), 단위가 없으면 unit은 None
+        예시: "300g" -> (300.0, "g"), "1.5 L" -> (1.5, "l"), "2인분" -> (2.0, "serving")
+    """
+    if text is None:
+        return None, None
+    if isinstance(text, (int, float)):
+        return float(text), None
+    match = _QUANTITY_PATTERN.match(text)
+    if match is None:
+        return None, None
+    amount = float(match.group(1).replace(",", "."))
+    unit = match.group(2).strip().lower() or None
+    if unit is not None:
+        unit = UNIT_ALIASES.get(unit, unit)
+    return amount, unit
+
+
+def to_grams(amount: float | None, unit: str | None) -> float | None:
+    """(수치, 단위)를 g으로 환산, 무게/부피 단위가 아니면 None"""
+    if amount is None:
+        return None
+    if unit is None:
+        return amount
+    factor = GRAM_FACTORS.get(unit)
+    return amount * factor if factor is not None else None
+
+
+def sum_quantities(quantities: Iterable[Tuple[float | None, str | None]]) -> Tuple[float, str | None] | None:
+    """
+    (수치, 단위) 목록의 합계
+
+    Returns:
+        단위가 모두 같으면 (합계, 단위), 모두 무게/부피 단위면 (g 합계, "g")
+        해석할 수 없는 양이 있거나 단위가 섞여 있으면 None (임의의 수치를 만들지 않음)
+        예시: [(300, "g"), (0.2, "kg")] -> (500.0, "g"), [(300, "g"), (2, "serving")] -> None
+    """
+    quantities = list(quantities)
+    if not quantities or any(amount is None for amount, _ in quantities):
+        return None
+    units = {unit for _, unit in quantities}
+    if len(units) == 1:
+        return sum(amount for amount, _ in quantities), units.pop()
+    if all(unit in GRAM_FACTORS for unit in units):
+        return sum(to_grams(amount, unit) for amount, unit in quantities), "g"
+    return None
+
+
+def parse_grams(text: str | float | int | None) -> float | None:
+    """자유 형식 양을 g으로 환산, 무게/부피가 아니면 None"""
+    return to_grams(*parse_quantity(text))
+
+
+def parse_quantity_columns(text: str | float | int | None) -> Dict[str, float | str | None]:
+    """저장용 해석 결과 {"amount", "unit", "amount_g"} (user_food_inventory 컬럼)"""
+    amount, unit = parse_quantity(text)
+    return {"amount": amount, "unit": unit[:20] if unit else None, "amount_g": to_grams(amount, unit)}
@@ -7,7 +7,7 @@ dotenv.load_dotenv()
 
 sys.path.insert(0, os.environ.get("PROJECT_ROOT"))
 
-from model.domain.food import Food
+from model.domain.food import Food, FoodNutrition
 
 
 class SleepPatternItem(BaseModel):
@@ -65,6 +65,36 @@ class MealPlan(BaseModel):
     food_list: List[Food]
     
 
+class ScheduleFoodItem(BaseModel):
+    food_id: str | None = None
+    food_name: str
+    quantity: float | None = None
+    unit: str | None = None
+    amount_text: str | None = None
+    food_nutrition: FoodNutrition | None = None
+
+
+class ScheduleMeal(BaseModel):
+    meal_id: int
+    datetime: datetime
+    foods: List[ScheduleFoodItem]
+
+
+class SchedulePage(BaseModel):
+    """식사 일정 한 페이지, next_cursor가 None이면 마지막 페이지"""
+    meals: List[ScheduleMeal]
+    next_cursor: str | None = None
+
+
+class InventoryItem(BaseModel):
+    food_id: str
+    quantity: str
+    amount: float | None = None
+    unit: str | None = None
+    amount_g: float | None = None
+    expired: datetime | None = None
+
+
 class User(BaseModel):
     uuid: str
     nickname: str
@@ -92,17 +122,28 @@ class User(BaseModel):
         else:
             meal_plan = []
         
-        return User(
-            uuid=user_info.uuid,
-            nickname=user_info.nickname,
-            user_auth=UserAuth(email=user_info.user_auth.email, phone=user_info.user_auth.phone),
-            user_body=UserBody(
+        # 조회 프로필에서 빠진 관계(noload)는 None이므로 빈 값으로 채움
+        if user_info.user_auth is not None:
+            user_auth = UserAuth(email=user_info.user_auth.email, phone=user_info.user_auth.phone)
+        else:
+            user_auth = UserAuth()
+
+        if user_info.user_body is not None:
+            user_body = UserBody(
                 age=user_info.user_body.age,
                 gender=user_info.user_body.gender,
                 tall=user_info.user_body.tall,
                 weight=user_info.user_body.weight,
-            ),
-            password=user_info.password.password,
+            )
+        else:
+            user_body = UserBody()
+
+        return User(
+            uuid=user_info.uuid,
+            nickname=user_info.nickname,
+            user_auth=user_auth,
+            user_body=user_body,
+            password=user_info.password.password if user_info.password is not None else None,
             social_login=social_login,
             subscription=subscription,
             meal_plan=meal_plan,
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, field_validator
 from typing import Optional
 import re
+from model.domain.user import UserBody, Subscription
 
 # 회원가입 스키마
 class UserRegister(BaseModel):
@@ -114,3 +115,13 @@ class UserInfoResponse(BaseModel):
     email: str
     nickname: Optional[str] = None
     phone: Optional[str] = None
+
+# 사용자 프로필 스키마 (식단 계획에 필요한 신체 정보, 구독 포함)
+class UserProfileResponse(BaseModel):
+    uuid: str
+    email: str
+    nickname: Optional[str] = None
+    phone: Optional[str] = None
+    user_body: UserBody
+    social_code: Optional[str] = None
+    subscription: Optional[Subscription] = None
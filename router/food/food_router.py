@@ -1,8 +1,63 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Dict, List, Optional
+import os
+import sys
+from dotenv import load_dotenv
+
+load_dotenv()
+
+project_root = os.getenv("PROJECT_ROOT")
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from db.db_manager import get_async_db_manager, AsyncDBManager
+from db.tag_bitmap_index import load_tag_bitmap_index
+from model.domain.food import Food
 
 food_router = APIRouter(prefix="/food", tags=["food"])
 
 
 @food_router.get("/list")
 async def get_food_list():
-    return {"message": "Hello, World!"}
\ No newline at end of file
+    return {"message": "Hello, World!"}
+
+
+@food_router.get("/tags/search", response_model=List[Food])
+async def search_foods_by_tags(
+    expr: str = Query(..., description='태그 식, 예: 고단백 AND 저염 AND NOT 유제품'),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db_manager: AsyncDBManager = Depends(get_async_db_manager),
+):
+    """태그 조합으로 음식 검색"""
+    try:
+        await load_tag_bitmap_index()
+        return await db_manager.get_foods_by_tags(expr, limit=limit, offset=offset)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@food_router.get("/tags/count")
+async def count_foods_by_tags(
+    expr: str = Query(..., description='태그 식, 예: 고단백 AND 저염 AND NOT 유제품'),
+    db_manager: AsyncDBManager = Depends(get_async_db_manager),
+):
+    """태그 조합에 맞는 음식 수"""
+    try:
+        await load_tag_bitmap_index()
+        return {"expr": expr, "count": await db_manager.count_foods_by_tags(expr)}
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@food_router.get("/tags/facets", response_model=Dict[str, int])
+async def get_tag_facets(
+    expr: Optional[str] = Query(None, description="현재 필터 식, 없으면 전체 음식 기준"),
+    db_manager: AsyncDBManager = Depends(get_async_db_manager),
+):
+    """현재 필터 안에서 태그별 음식 수"""
+    try:
+        await load_tag_bitmap_index()
+        return await db_manager.get_tag_facets(expr)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, status, Request, Header, Response
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, status, Request, Header, Response, Query
 from sqlalchemy.orm import Session
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, EmailStr, validator, Field
@@ -9,15 +9,11 @@ import sys
 import bcrypt
 import re
 import secrets
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from dotenv import load_dotenv
 from fastapi.security import OAuth2AuthorizationCodeBearer, OAuth2PasswordBearer
 from jose import JWTError, jwt
 from starlette.status import HTTP_401_UNAUTHORIZED
 import logging
-import requests
 from fastapi.responses import RedirectResponse
 
 load_dotenv()
@@ -32,16 +28,17 @@ if project_root not in sys.path:
 # DB 모듈 임포트
 from db.database import SessionLocal
 from db.tables.user_table import UserInfo, UserAuth, Password, SocialLogin
-from db.db_manager import get_db_manager, DBManager
-from model.schemas.user import UserRegister, UserLogin, Token, RefreshToken, UserRegisterResponse, UserInfoResponse, EmailVerificationRequest, EmailVerificationConfirm, OAuthRegister
+from db.db_manager import get_async_db_manager, AsyncDBManager
+from db.user_cache import auth_user_cache
+from service.password_service import password_service, PasswordServiceBusy
+from service.oauth_client import google_oauth_client, OAuthError, GOOGLE_AUTH_URL
+from service.email_sender import email_worker
+from service.verification_store import verification_store
+from service.login_log_writer import login_event_writer
+from model.domain.user import SchedulePage
+from model.schemas.user import UserRegister, UserLogin, Token, RefreshToken, UserRegisterResponse, UserInfoResponse, UserProfileResponse, EmailVerificationRequest, EmailVerificationConfirm, OAuthRegister
 
 
-# 이메일 설정값
-EMAIL_HOST = os.getenv("EMAIL_HOST", "smtp.gmail.com")
-EMAIL_PORT = int(os.getenv("EMAIL_PORT", "587"))
-EMAIL_USER = os.getenv("EMAIL_USER")
-EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
-
 # JWT 설정
 SECRET_KEY = os.getenv("SECRET_KEY", "food_scheduler_secret_key_for_jwt")
 ALGORITHM = "HS256"
@@ -52,26 +49,19 @@ REFRESH_TOKEN_EXPIRE_DAYS = 30
 GOOGLE_CLIENT_ID = os.getenv("OAUTH_CLIENT_ID")
 GOOGLE_CLIENT_SECRET = os.getenv("OAUTH_CLIENT_PW")
 GOOGLE_REDIRECT_URI = os.getenv("GOOGLE_REDIRECT_URI", "http://localhost:8000/user/auth/google/callback")
-GOOGLE_AUTH_URL = "https://accounts.google.com/o/oauth2/auth"
-GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
-GOOGLE_USER_INFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
+# 엔드포인트 주소는 service/oauth_client.py (GOOGLE_OAUTH_BASE_URL)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/user/login")
 
 user_router = APIRouter(prefix="/user", tags=["user"])
 
-# 인메모리 저장소 - 이메일 인증 코드 저장
-verification_tokens = {}
+# 이메일 인증 코드 유효 시간 (저장소는 service/verification_store.py)
+VERIFICATION_CODE_TTL = timedelta(minutes=10)
 
-# 이메일 인증 코드 전송 함수
-def send_verification_email(email: str, code: str):
-    try:
-        msg = MIMEMultipart()
-        msg['From'] = EMAIL_USER
-        msg['To'] = email
-        msg['Subject'] = "식품 스케줄러 - 이메일 인증"
-        
-        body = f"""
+# 이메일 인증 메일 내용 (발송은 service/email_sender.py의 워커가 대기열에서)
+def verification_email(code: str) -> tuple[str, str]:
+    subject = "식품 스케줄러 - 이메일 인증"
+    body = f"""
         <html>
           <body>
             <h2>이메일 인증 코드</h2>
@@ -81,18 +71,7 @@ def send_verification_email(email: str, code: str):
           </body>
         </html>
         """
-        
-        msg.attach(MIMEText(body, 'html'))
-        
-        server = smtplib.SMTP(EMAIL_HOST, EMAIL_PORT)
-        server.starttls()
-        server.login(EMAIL_USER, EMAIL_PASSWORD)
-        server.send_message(msg)
-        server.quit()
-        return True
-    except Exception as e:
-        print(f"이메일 전송 오류: {e}")
-        return False
+    return subject, body
 
 # JWT 토큰 생성 함수
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -101,7 +80,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    # jti: 토큰 id, 인증 사용자 캐시 키로 사용
+    to_encode.update({"exp": expire, "jti": secrets.token_urlsafe(12)})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -114,7 +94,7 @@ def create_refresh_token(data: dict):
     return encoded_jwt
 
 # 현재 사용자 가져오기
-async def get_current_user(token: str = Depends(oauth2_scheme), db_manager: DBManager = Depends(get_db_manager)):
+async def get_current_user(token: str = Depends(oauth2_scheme), db_manager: AsyncDBManager = Depends(get_async_db_manager)):
     credentials_exception = HTTPException(
         status_code=HTTP_401_UNAUTHORIZED,
         detail="유효하지 않은 인증 정보입니다.",
@@ -128,19 +108,49 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db_manager: DBMa
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-        
-    user = db_manager.get_user_by_uuid(uuid)
+
+    # 짧은 TTL 캐시에 있으면 DB 조회 없이 반환
+    jti = payload.get("jti")
+    user = auth_user_cache.get(uuid, jti)
+    if user is not None:
+        return user
+
+    # 인증 확인에는 이메일/전화번호만 필요 (user_auth 조인 한 번)
+    user = await db_manager.get_user_by_uuid(uuid, profile="auth-only")
     if user is None:
         raise credentials_exception
+    auth_user_cache.set(uuid, jti, user)
+    return user
+
+# 현재 사용자의 신체 정보, 구독 등 식단 계획에 필요한 정보까지 가져오기 (비밀번호 제외)
+async def get_current_user_profile(
+    current_user = Depends(get_current_user),
+    db_manager: AsyncDBManager = Depends(get_async_db_manager)
+):
+    user = await db_manager.get_user_by_uuid(current_user.uuid, profile="profile")
+    if user is None:
+        raise HTTPException(
+            status_code=HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 인증 정보입니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 # 일반 회원가입 라우트
 @user_router.post("/register", response_model=UserRegisterResponse)
-async def register_user(user_data: UserRegister, db_manager: DBManager = Depends(get_db_manager)):
+async def register_user(user_data: UserRegister, db_manager: AsyncDBManager = Depends(get_async_db_manager)):
     try:
-        uuid = db_manager.create_user(
+        password_hash = await password_service.hash(user_data.password)
+    except PasswordServiceBusy as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    try:
+        uuid = await db_manager.create_user(
             email=user_data.email,
-            password=user_data.password,
+            password=password_hash,
             nickname=user_data.nickname,
             phone=user_data.phone
         )
@@ -168,29 +178,39 @@ async def login_for_access_token(
     response: Response,
     user_data: UserLogin, 
     request: Request,
-    db_manager: DBManager = Depends(get_db_manager)
+    db_manager: AsyncDBManager = Depends(get_async_db_manager)
 ):
-    # 사용자 인증
-    user = db_manager.get_user_by_email(user_data.email)
-    if user is None:
+    # 사용자 인증 (비밀번호 검증은 이벤트 루프 밖의 스레드 풀에서)
+    user = await db_manager.get_user_by_email(user_data.email)
+    try:
+        verified, new_hash = await password_service.verify(user_data.password, user.password if user else None)
+    except PasswordServiceBusy as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+    if not verified:
         # 실패 로그 기록
-        try:
-            db_manager.record_login(
+        if user is not None:
+            login_event_writer.record(
                 uuid=user.uuid, 
                 status_code=401, 
                 ip=request.client.host
             )
-        except:
-            pass
             
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다.",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+    # cost가 바뀌었거나 평문으로 저장된 비밀번호면 새 해시로 교체
+    if new_hash is not None:
+        await db_manager.update_password(uuid=user.uuid, password=new_hash)
     
-    # 성공 로그 기록
-    db_manager.record_login(
+    # 성공 로그 기록 (버퍼에 넣고 백그라운드에서 모아서 저장)
+    login_event_writer.record(
         uuid=user.uuid, 
         status_code=200, 
         ip=request.client.host
@@ -244,7 +264,7 @@ async def refresh_token(
     token_data: RefreshToken = None,
     refresh_token: Optional[str] = Header(None),
     cookie_refresh_token: Optional[str] = None,
-    db_manager: DBManager = Depends(get_db_manager)
+    db_manager: AsyncDBManager = Depends(get_async_db_manager)
 ):
     # 리프레시 토큰 우선 순위: Body > Header > Cookie
     if token_data and token_data.refresh_token:
@@ -271,7 +291,7 @@ async def refresh_token(
             )
             
         # 사용자 확인
-        user = db_manager.get_user_by_uuid(uuid)
+        user = await db_manager.get_user_by_uuid(uuid, profile="auth-only")
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -335,40 +355,35 @@ async def google_auth():
 async def google_auth_callback(
     code: str, 
     request: Request, 
-    db_manager: DBManager = Depends(get_db_manager)
+    db_manager: AsyncDBManager = Depends(get_async_db_manager)
 ):
-    # 액세스 토큰 요청
-    token_data = {
-        "client_id": GOOGLE_CLIENT_ID,
-        "client_secret": GOOGLE_CLIENT_SECRET,
-        "code": code,
-        "redirect_uri": GOOGLE_REDIRECT_URI,
-        "grant_type": "authorization_code"
-    }
-    
-    token_response = requests.post(GOOGLE_TOKEN_URL, data=token_data)
-    if not token_response.ok:
+    # 액세스 토큰 요청 (공용 비동기 클라이언트, 이벤트 루프를 막지 않음)
+    try:
+        token_json = await google_oauth_client.exchange_code(
+            code=code,
+            client_id=GOOGLE_CLIENT_ID,
+            client_secret=GOOGLE_CLIENT_SECRET,
+            redirect_uri=GOOGLE_REDIRECT_URI,
+        )
+    except OAuthError as e:
+        logger.warning(f"Google OAuth 토큰 요청 실패: {e}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Google OAuth 토큰을 가져오는 데 실패했습니다."
         )
     
-    token_json = token_response.json()
     access_token = token_json.get("access_token")
     
     # 사용자 정보 요청
-    user_info_response = requests.get(
-        GOOGLE_USER_INFO_URL,
-        headers={"Authorization": f"Bearer {access_token}"}
-    )
-    
-    if not user_info_response.ok:
+    try:
+        user_info = await google_oauth_client.get_user_info(access_token)
+    except OAuthError as e:
+        logger.warning(f"Google 사용자 정보 요청 실패: {e}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Google 사용자 정보를 가져오는 데 실패했습니다."
         )
     
-    user_info = user_info_response.json()
     email = user_info.get("email")
     
     if not email:
@@ -377,87 +392,38 @@ async def google_auth_callback(
             detail="이메일 정보를 가져올 수 없습니다."
         )
     
-    # 이미 가입된 사용자인지 확인
-    existing_user = db_manager.get_user_by_email(email)
+    # 사용자 조회, 소셜 정보 갱신/생성, 로그인 기록을 한 트랜잭션으로 (커밋 한 번)
+    async with db_manager.transaction():
+        # 이미 가입된 사용자인지 확인
+        existing_user = await db_manager.get_user_by_email(email)
     
-    if existing_user:
-        # 기존 사용자면 소셜 로그인 정보 업데이트
-        db_manager.update_social_login(
-            uuid=existing_user.uuid,
-            social_code="google",
-            access_token=access_token
-        )
-        
-        # 로그인 처리
-        access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-        jwt_access_token = create_access_token(
-            data={"sub": existing_user.uuid},
-            expires_delta=access_token_expires
-        )
-        
-        # 리프레시 토큰 생성
-        jwt_refresh_token = create_refresh_token(
-            data={"sub": existing_user.uuid}
-        )
-        
-        # 성공 로그 기록
-        db_manager.record_login(
-            uuid=existing_user.uuid, 
-            status_code=200, 
-            ip=request.client.host
-        )
-        
-        # 로그인 후 리다이렉트
-        response = RedirectResponse(url="/dashboard")
-        response.set_cookie(
-            key="refresh_token",
-            value=jwt_refresh_token,
-            httponly=True,
-            secure=False,  # 개발 환경을 위해 False로 설정 (HTTPS 사용 시 True로 변경해야 함)
-            samesite="lax",
-            max_age=REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
-            path="/"
-        )
-        response.set_cookie(
-            key="access_token",
-            value=jwt_access_token,
-            httponly=False,  # 자바스크립트에서 접근 가능하게
-            secure=False,  # 개발 환경을 위해 False로 설정 (HTTPS 사용 시 True로 변경해야 함)
-            samesite="lax",
-            max_age=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-            path="/"
-        )
-        return response
-    else:
-        # 새 사용자 생성
-        try:
-            nickname = user_info.get("name") or email.split("@")[0]
-            uuid = db_manager.create_user(
-                email=email,
-                nickname=nickname,
+        if existing_user:
+            # 기존 사용자면 소셜 로그인 정보 업데이트
+            await db_manager.update_social_login(
+                uuid=existing_user.uuid,
                 social_code="google",
                 access_token=access_token
             )
-            
-            # 회원가입 성공 후 로그인 처리
+        
+            # 로그인 처리
             access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
             jwt_access_token = create_access_token(
-                data={"sub": uuid},
+                data={"sub": existing_user.uuid},
                 expires_delta=access_token_expires
             )
-            
+        
             # 리프레시 토큰 생성
             jwt_refresh_token = create_refresh_token(
-                data={"sub": uuid}
+                data={"sub": existing_user.uuid}
             )
-            
+        
             # 성공 로그 기록
-            db_manager.record_login(
-                uuid=uuid, 
+            login_event_writer.record(
+                uuid=existing_user.uuid, 
                 status_code=200, 
                 ip=request.client.host
             )
-            
+        
             # 로그인 후 리다이렉트
             response = RedirectResponse(url="/dashboard")
             response.set_cookie(
@@ -472,26 +438,77 @@ async def google_auth_callback(
             response.set_cookie(
                 key="access_token",
                 value=jwt_access_token,
-                httponly=False,
+                httponly=False,  # 자바스크립트에서 접근 가능하게
                 secure=False,  # 개발 환경을 위해 False로 설정 (HTTPS 사용 시 True로 변경해야 함)
                 samesite="lax",
                 max_age=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
                 path="/"
             )
             return response
+        else:
+            # 새 사용자 생성
+            try:
+                nickname = user_info.get("name") or email.split("@")[0]
+                uuid = await db_manager.create_user(
+                    email=email,
+                    nickname=nickname,
+                    social_code="google",
+                    access_token=access_token
+                )
             
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"OAuth 회원가입 처리 중 오류가 발생했습니다: {str(e)}"
-            )
+                # 회원가입 성공 후 로그인 처리
+                access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+                jwt_access_token = create_access_token(
+                    data={"sub": uuid},
+                    expires_delta=access_token_expires
+                )
+            
+                # 리프레시 토큰 생성
+                jwt_refresh_token = create_refresh_token(
+                    data={"sub": uuid}
+                )
+            
+                # 성공 로그 기록
+                login_event_writer.record(
+                    uuid=uuid, 
+                    status_code=200, 
+                    ip=request.client.host
+                )
+            
+                # 로그인 후 리다이렉트
+                response = RedirectResponse(url="/dashboard")
+                response.set_cookie(
+                    key="refresh_token",
+                    value=jwt_refresh_token,
+                    httponly=True,
+                    secure=False,  # 개발 환경을 위해 False로 설정 (HTTPS 사용 시 True로 변경해야 함)
+                    samesite="lax",
+                    max_age=REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+                    path="/"
+                )
+                response.set_cookie(
+                    key="access_token",
+                    value=jwt_access_token,
+                    httponly=False,
+                    secure=False,  # 개발 환경을 위해 False로 설정 (HTTPS 사용 시 True로 변경해야 함)
+                    samesite="lax",
+                    max_age=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                    path="/"
+                )
+                return response
+            
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=f"OAuth 회원가입 처리 중 오류가 발생했습니다: {str(e)}"
+                )
 
 # OAuth 로그인 API - 클라이언트에서 호출
 @user_router.post("/oauth/login")
-async def oauth_login(user_data: OAuthRegister, db_manager: DBManager = Depends(get_db_manager)):
+async def oauth_login(user_data: OAuthRegister, db_manager: AsyncDBManager = Depends(get_async_db_manager)):
     try:
         # 이메일로 사용자 확인
-        existing_user = db_manager.get_user_by_email(user_data.email)
+        existing_user = await db_manager.get_user_by_email(user_data.email)
         
         if not existing_user:
             # 사용자가 존재하지 않으면 오류 반환
@@ -513,7 +530,7 @@ async def oauth_login(user_data: OAuthRegister, db_manager: DBManager = Depends(
         )
         
         # 성공 로그 기록
-        db_manager.record_login(
+        login_event_writer.record(
             uuid=existing_user.uuid, 
             status_code=200, 
             ip="0.0.0.0"
@@ -536,14 +553,14 @@ async def oauth_login(user_data: OAuthRegister, db_manager: DBManager = Depends(
 
 # OAuth 회원가입 라우트 (API용)
 @user_router.post("/oauth/register", response_model=UserRegisterResponse)
-async def register_oauth_user(user_data: OAuthRegister, db_manager: DBManager = Depends(get_db_manager)):
+async def register_oauth_user(user_data: OAuthRegister, db_manager: AsyncDBManager = Depends(get_async_db_manager)):
     try:
         # 이미 가입된 사용자인지 확인
-        existing_user = db_manager.get_user_by_email(user_data.email)
+        existing_user = await db_manager.get_user_by_email(user_data.email)
         
         if existing_user:
             # 기존 사용자면 소셜 로그인 정보 업데이트
-            db_manager.update_social_login(
+            await db_manager.update_social_login(
                 uuid=existing_user.uuid,
                 social_code=user_data.social_code,
                 access_token=user_data.access_token
@@ -557,7 +574,7 @@ async def register_oauth_user(user_data: OAuthRegister, db_manager: DBManager =
             }
         else:
             # 새 사용자 생성
-            uuid = db_manager.create_user(
+            uuid = await db_manager.create_user(
                 email=user_data.email,
                 nickname=user_data.nickname or user_data.email.split("@")[0],
                 social_code=user_data.social_code,
@@ -585,8 +602,7 @@ async def register_oauth_user(user_data: OAuthRegister, db_manager: DBManager =
 @user_router.post("/verify/email", status_code=status.HTTP_202_ACCEPTED)
 async def request_email_verification(
     request: EmailVerificationRequest, 
-    background_tasks: BackgroundTasks,
-    db_manager: DBManager = Depends(get_db_manager)
+    db_manager: AsyncDBManager = Depends(get_async_db_manager)
 ):
     # 해당 이메일이 등록되어 있는지 확인
     # user = db_manager.get_user_by_email(request.email)
@@ -599,47 +615,42 @@ async def request_email_verification(
     # 인증 코드 생성 (6자리 숫자)
     verification_code = ''.join(secrets.choice('0123456789') for _ in range(6))
     
-    # 인증 토큰 저장
-    verification_tokens[request.email] = {
-        "code": verification_code,
-        "expires_at": datetime.now() + timedelta(minutes=10)
-    }
+    # 인증 코드 저장 (같은 이메일의 이전 코드는 교체)
+    await verification_store.put(request.email, verification_code, VERIFICATION_CODE_TTL)
     
-    # 백그라운드에서 이메일 전송
-    background_tasks.add_task(send_verification_email, request.email, verification_code)
+    # 발송 대기열에 저장 (서버가 재시작되어도 유지), 워커가 풀링된 SMTP 연결로 발송
+    subject, body = verification_email(verification_code)
+    await db_manager.enqueue_email(request.email, subject, body)
+    email_worker.wake()
     
     return {"message": "인증 코드가 이메일로 전송되었습니다. 10분 내에 인증을 완료해주세요."}
 
 # 이메일 인증 코드 확인 라우트
 @user_router.post("/verify/confirm", status_code=status.HTTP_200_OK)
 async def confirm_email_verification(verify: EmailVerificationConfirm):
-    # 인증 코드 확인
-    if verify.email not in verification_tokens:
+    # 인증 코드 확인, 일치하면 저장소에서 삭제 (다른 워커에서 저장한 코드도 확인 가능)
+    result = await verification_store.confirm(verify.email, verify.code)
+    
+    if result == "missing":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="인증 요청을 먼저 진행해주세요."
         )
     
-    token_data = verification_tokens[verify.email]
-    
     # 만료 여부 확인
-    if datetime.now() > token_data["expires_at"]:
-        del verification_tokens[verify.email]
+    if result == "expired":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="인증 코드가 만료되었습니다. 다시 인증 요청을 진행해주세요."
         )
     
     # 코드 확인
-    if token_data["code"] != verify.code:
+    if result == "mismatch":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="인증 코드가 일치하지 않습니다."
         )
     
-    # 인증 성공 후 토큰 삭제
-    del verification_tokens[verify.email]
-    
     return {"message": "이메일 인증이 완료되었습니다."}
 
 # 사용자 정보 조회 라우트
@@ -652,6 +663,42 @@ async def get_user_info(current_user: dict = Depends(get_current_user)):
         "phone": current_user.user_auth.phone
     }
 
+# 사용자 프로필 조회 라우트 (신체 정보, 구독 등; 비밀번호와 소셜 토큰 제외)
+@user_router.get("/profile", response_model=UserProfileResponse)
+async def get_user_profile(current_user = Depends(get_current_user_profile)):
+    return {
+        "uuid": current_user.uuid,
+        "email": current_user.user_auth.email,
+        "nickname": current_user.nickname,
+        "phone": current_user.user_auth.phone,
+        "user_body": current_user.user_body,
+        "social_code": current_user.social_login.social_code if current_user.social_login else None,
+        "subscription": current_user.subscription,
+    }
+
+# 식사 일정 조회 라우트 (기간 [start, end), next_cursor로 다음 페이지)
+@user_router.get("/schedule", response_model=SchedulePage)
+async def get_user_schedule(
+    start: datetime = Query(..., description="조회 시작 시각 (포함)"),
+    end: datetime = Query(..., description="조회 종료 시각 (미포함)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(100, ge=1, le=500),
+    current_user = Depends(get_current_user),
+    db_manager: AsyncDBManager = Depends(get_async_db_manager)
+):
+    if end <= start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end는 start보다 뒤여야 합니다."
+        )
+    try:
+        return await db_manager.get_user_schedule(current_user.uuid, start, end, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
 # 로그아웃 라우트
 @user_router.post("/logout")
 async def logout(response: Response):
@@ -0,0 +1,253 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Tuple
+import asyncio
+import logging
+import json
+import math
+import time
+import os
+
+from prometheus_client import Counter, Gauge
+
+from db.metrics import recent_checkout_wait
+
+"""
+admission:
+    요청 폭주 대응 ASGI 미들웨어 (app.py)
+        rate limit      라우트별 토큰 버킷, 키는 클라이언트 IP 또는 계정(JSON 본문의 email)
+                        키마다 (토큰 수, 마지막 갱신 시각)만 저장, 버킷이 다 찰 만큼 쉰 키와 max_keys 초과분은 오래된 순으로 제거
+                        초과 시 429 + Retry-After
+        load shedding   이벤트 루프 지연이나 DB 커넥션 풀 대기 시간이 임계값을 넘으면 새 요청을 503 + Retry-After로 거절
+                        (대기열이 길어지기 전에 거절해서 처리 중인 요청의 지연 시간 유지)
+"""
+
+logger = logging.getLogger(__name__)
+
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "true").lower() in ("1", "true", "yes")
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+# 프록시 뒤에서만 켤 것 (X-Forwarded-For의 첫 번째 주소를 클라이언트 IP로 사용)
+TRUST_FORWARDED_FOR = os.getenv("TRUST_FORWARDED_FOR", "false").lower() in ("1", "true", "yes")
+SHED_MAX_LOOP_LAG_MS = float(os.getenv("SHED_MAX_LOOP_LAG_MS", "200"))
+SHED_MAX_POOL_WAIT_MS = float(os.getenv("SHED_MAX_POOL_WAIT_MS", "1000"))
+SHED_RETRY_AFTER = int(os.getenv("SHED_RETRY_AFTER", "2"))
+# 계정 키를 찾기 위해 읽는 요청 본문 최대 크기
+_MAX_KEY_BODY_BYTES = 64 * 1024
+
+ADMISSION_REJECTIONS = Counter(
+    "admission_rejections_total",
+    "rate limit / load shedding으로 거절한 요청 수",
+    ["reason", "route"],
+)
+EVENT_LOOP_LAG = Gauge(
+    "event_loop_lag_seconds",
+    "이벤트 루프 지연 (최근 값의 지수 이동 평균)",
+)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    토큰 버킷 규칙
+        key: "ip" (클라이언트 IP) 또는 "account" (JSON 본문의 email, 없으면 적용 안 함)
+        rate: 초당 토큰 보충량
+        burst: 버킷 크기 (연속으로 허용하는 요청 수)
+    """
+    key: Literal["ip", "account"]
+    rate: float
+    burst: int
+
+
+class TokenBucketLimiter:
+    """키별 토큰 버킷, 키당 O(1) 메모리"""
+
+    def __init__(self, rate: float, burst: int, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate와 burst는 0보다 커야 합니다.")
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        # 이 시간 동안 요청이 없던 키는 버킷이 가득 찬 상태라 새 키와 같음
+        self.idle_seconds = burst / rate
+        # key -> (토큰 수, 마지막 갱신 시각), 최근에 사용한 키가 뒤쪽
+        self._buckets: OrderedDict[str, Tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _evict(self, now: float) -> None:
+        buckets = self._buckets
+        while buckets:
+            key, (_, updated) = next(iter(buckets.items()))
+            if now - updated < self.idle_seconds and len(buckets) <= self.max_keys:
+                return
+            buckets.popitem(last=False)
+
+    def acquire(self, key: str, now: float | None = None) -> float:
+        """토큰 하나 사용, 허용되면 0, 거절되면 다음 토큰까지 기다릴 시간(초)"""
+        now = time.monotonic() if now is None else now
+        tokens, updated = self._buckets.pop(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated) * self.rate)
+        if tokens >= 1:
+            self._buckets[key] = (tokens - 1, now)
+            wait = 0.0
+        else:
+            self._buckets[key] = (tokens, now)
+            wait = (1 - tokens) / self.rate
+        self._evict(now)
+        return wait
+
+
+class LoadMonitor:
+    """이벤트 루프 지연 측정 (백그라운드 태스크) 및 과부하 판단"""
+
+    def __init__(
+            self,
+            max_loop_lag: float = SHED_MAX_LOOP_LAG_MS / 1000,
+            max_pool_wait: float = SHED_MAX_POOL_WAIT_MS / 1000,
+            interval: float = 0.1):
+        self.max_loop_lag = max_loop_lag
+        self.max_pool_wait = max_pool_wait
+        self.interval = interval
+        self.loop_lag = 0.0
+        self._task: asyncio.Task | None = None
+
+    async def _measure(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - start - self.interval)
+            self.loop_lag += 0.3 * (lag - self.loop_lag)
+            EVENT_LOOP_LAG.set(self.loop_lag)
+
+    def ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._measure())
+
+    def overload_reason(self) -> str | None:
+        """과부하면 원인("loop_lag" / "pool_wait"), 아니면 None"""
+        if self.loop_lag > self.max_loop_lag:
+            return "loop_lag"
+        if recent_checkout_wait() > self.max_pool_wait:
+            return "pool_wait"
+        return None
+
+
+class AdmissionControlMiddleware:
+    """
+    라우트별 rate limit + 전역 load shedding ASGI 미들웨어
+    예시:
+        app.add_middleware(AdmissionControlMiddleware, rules={
+            "/user/login": [RateLimit("ip", rate=1, burst=10), RateLimit("account", rate=0.1, burst=5)],
+        })
+    """
+
+    def __init__(
+            self,
+            app,
+            rules: Dict[str, List[RateLimit]] | None = None,
+            exempt_prefixes: Tuple[str, ...] = ("/metrics", "/static"),
+            monitor: LoadMonitor | None = None,
+            enabled: bool = ADMISSION_ENABLED):
+        self.app = app
+        self.enabled = enabled
+        self.exempt_prefixes = exempt_prefixes
+        self.monitor = monitor or LoadMonitor()
+        # 규칙마다 별도 버킷 (같은 IP라도 라우트별로 따로 계산)
+        self.limiters: Dict[str, List[Tuple[RateLimit, TokenBucketLimiter]]] = {
+            path: [(rule, TokenBucketLimiter(rule.rate, rule.burst)) for rule in path_rules]
+            for path, path_rules in (rules or {}).items()
+        }
+
+    @staticmethod
+    def _client_ip(scope) -> str:
+        if TRUST_FORWARDED_FOR:
+            for name, value in scope.get("headers", ()):
+                if name == b"x-forwarded-for":
+                    return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "-"
+
+    @staticmethod
+    async def _read_body(receive) -> Tuple[bytes, List[dict]]:
+        """계정 키를 찾기 위해 본문을 읽고, 앱에 다시 전달할 메시지 목록도 돌려줌"""
+        messages = []
+        body = b""
+        while True:
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                break
+            body += message.get("body", b"")
+            if not message.get("more_body", False) or len(body) > _MAX_KEY_BODY_BYTES:
+                break
+        return body, messages
+
+    @staticmethod
+    def _account_key(body: bytes) -> str | None:
+        if len(body) > _MAX_KEY_BODY_BYTES:
+            return None
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return None
+        email = data.get("email") if isinstance(data, dict) else None
+        return email.strip().lower() if isinstance(email, str) and email.strip() else None
+
+    @staticmethod
+    async def _reject(send, status_code: int, retry_after: float, detail: str) -> None:
+        body = json.dumps({"detail": detail}, ensure_ascii=False).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.enabled or scope["path"].startswith(self.exempt_prefixes):
+            return await self.app(scope, receive, send)
+
+        self.monitor.ensure_started()
+        path = scope["path"]
+
+        reason = self.monitor.overload_reason()
+        if reason is not None:
+            ADMISSION_REJECTIONS.labels(reason, path if path in self.limiters else "other").inc()
+            return await self._reject(send, 503, SHED_RETRY_AFTER, "서버가 혼잡합니다. 잠시 후 다시 시도해주세요.")
+
+        limiters = self.limiters.get(path)
+        if limiters:
+            account = None
+            if any(rule.key == "account" for rule, _ in limiters) and scope.get("method") in ("POST", "PUT", "PATCH"):
+                body, messages = await self._read_body(receive)
+                account = self._account_key(body)
+                receive = _replay(messages, receive)
+
+            now = time.monotonic()
+            wait = 0.0
+            for rule, limiter in limiters:
+                key = self._client_ip(scope) if rule.key == "ip" else account
+                if key is not None:
+                    wait = max(wait, limiter.acquire(key, now))
+            if wait > 0:
+                ADMISSION_REJECTIONS.labels("rate_limit", path).inc()
+                return await self._reject(send, 429, wait, "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.")
+
+        await self.app(scope, receive, send)
+
+
+def _replay(messages: List[dict], receive):
+    """이미 읽은 본문 메시지를 먼저 돌려주고, 그 뒤로는 원래 receive로"""
+    pending = list(messages)
+
+    async def replay_receive():
+        if pending:
+            return pending.pop(0)
+        return await receive()
+    return replay_receive
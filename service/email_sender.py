@@ -0,0 +1,321 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from typing import Dict, Any, List, Tuple
+import asyncio
+import threading
+import logging
+import smtplib
+import queue
+import ssl
+import time
+import os
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from db.db_manager import DBManager
+
+"""
+email sender:
+    outbound_email 대기열을 읽어 SMTP로 발송하는 워커
+        SMTP 연결 풀   STARTTLS / 로그인을 마친 연결을 재사용 (메일마다 핸드셰이크하지 않음)
+                       오래 쉰 연결은 NOOP으로 확인, 끊긴 연결은 버리고 다시 연결
+        배치 발송      한 번에 EMAIL_BATCH_SIZE개를 점유해 풀 크기만큼 병렬 발송
+        재시도         일시적 오류는 지수 백오프로 재시도, 5xx 응답이나 EMAIL_MAX_ATTEMPTS 초과는 failed
+        지표           발송 시간, 결과별 건수, 대기열 길이, SMTP 연결 수 (app.py /metrics)
+    앱 시작 시 start(), 종료 시 stop() (app.py lifespan)
+    테스트용 로컬 SMTP: EMAIL_HOST=localhost EMAIL_PORT=1025 EMAIL_USE_TLS=false (EMAIL_USER 없으면 로그인 생략)
+        예: python -m aiosmtpd -n -l localhost:1025
+"""
+
+logger = logging.getLogger(__name__)
+
+EMAIL_HOST = os.getenv("EMAIL_HOST", "smtp.gmail.com")
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", "587"))
+EMAIL_USER = os.getenv("EMAIL_USER")
+EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
+EMAIL_FROM = os.getenv("EMAIL_FROM", EMAIL_USER or "")
+EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "true").lower() in ("1", "true", "yes")
+EMAIL_SMTP_TIMEOUT = float(os.getenv("EMAIL_SMTP_TIMEOUT", "10"))
+EMAIL_SMTP_POOL_SIZE = int(os.getenv("EMAIL_SMTP_POOL_SIZE", "2"))
+# 이 시간(초) 넘게 쉰 연결은 사용 전 NOOP으로 확인
+EMAIL_SMTP_MAX_IDLE = float(os.getenv("EMAIL_SMTP_MAX_IDLE", "30"))
+
+EMAIL_WORKER_ENABLED = os.getenv("EMAIL_WORKER_ENABLED", "true").lower() in ("1", "true", "yes")
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", "50"))
+EMAIL_POLL_INTERVAL = float(os.getenv("EMAIL_POLL_INTERVAL", "2"))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "5"))
+EMAIL_RETRY_BASE_SECONDS = float(os.getenv("EMAIL_RETRY_BASE_SECONDS", "30"))
+EMAIL_RETRY_MAX_SECONDS = float(os.getenv("EMAIL_RETRY_MAX_SECONDS", "3600"))
+# 점유한 배치를 이 시간 안에 처리하지 못하면(워커 중단) 다른 워커가 다시 가져감
+EMAIL_LEASE_SECONDS = int(os.getenv("EMAIL_LEASE_SECONDS", "120"))
+
+EMAIL_SEND_SECONDS = Histogram(
+    "email_send_seconds",
+    "이메일 한 통의 SMTP 발송 시간 (연결 획득 포함)",
+    ["result"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+EMAIL_RESULTS = Counter(
+    "email_send_results_total",
+    "발송 결과별 이메일 수 (sent, retry, failed)",
+    ["result"],
+)
+EMAIL_QUEUE_DEPTH = Gauge(
+    "email_queue_depth",
+    "발송 대기열의 이메일 수",
+    ["status"],
+)
+SMTP_CONNECTIONS_OPENED = Counter(
+    "email_smtp_connections_opened_total",
+    "새로 연 SMTP 연결 수 (STARTTLS / 로그인 포함)",
+)
+
+
+class SMTPConnectionPool:
+    """인증을 마친 SMTP 연결 풀, 최대 size개"""
+
+    def __init__(
+            self,
+            host: str = EMAIL_HOST,
+            port: int = EMAIL_PORT,
+            user: str | None = EMAIL_USER,
+            password: str | None = EMAIL_PASSWORD,
+            use_tls: bool = EMAIL_USE_TLS,
+            size: int = EMAIL_SMTP_POOL_SIZE,
+            timeout: float = EMAIL_SMTP_TIMEOUT,
+            max_idle: float = EMAIL_SMTP_MAX_IDLE):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        # (연결, 마지막 사용 시각), 최근에 쓴 연결부터 재사용
+        self._idle: queue.LifoQueue[Tuple[smtplib.SMTP, float]] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls(context=ssl.create_default_context())
+            if self.user:
+                server.login(self.user, self.password)
+        except Exception:
+            self._discard(server)
+            raise
+        SMTP_CONNECTIONS_OPENED.inc()
+        return server
+
+    @staticmethod
+    def _discard(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def _get(self) -> smtplib.SMTP:
+        while True:
+            try:
+                server, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            if time.monotonic() - last_used < self.max_idle:
+                return server
+            try:
+                if server.noop()[0] == 250:
+                    return server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._discard(server)
+
+    @contextmanager
+    def connection(self):
+        """
+        연결 하나를 빌려 사용, 연결이 끊겨 예외가 나면 반납하지 않고 버림
+        예시:
+            with pool.connection() as server:
+                server.send_message(msg)
+        """
+        with self._slots:
+            server = self._get()
+            try:
+                yield server
+            except smtplib.SMTPServerDisconnected:
+                self._discard(server)
+                raise
+            except smtplib.SMTPException:
+                # 수신자 거부 등 메시지 단위 오류는 연결을 계속 씀 (SMTPException은 OSError의 하위 클래스라 먼저 확인)
+                self._idle.put((server, time.monotonic()))
+                raise
+            except Exception:
+                # 소켓 오류 등은 연결 상태를 알 수 없으므로 버림
+                self._discard(server)
+                raise
+            else:
+                self._idle.put((server, time.monotonic()))
+
+    def send(self, msg: EmailMessage) -> None:
+        """이메일 발송, 재사용한 연결이 끊겨 있었으면 새 연결로 한 번 더 시도"""
+        try:
+            with self.connection() as server:
+                server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            with self.connection() as server:
+                server.send_message(msg)
+
+    def close(self) -> None:
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(server)
+
+
+def _is_permanent(error: Exception) -> bool:
+    """다시 보내도 성공하지 않을 오류 (5xx 응답, 모든 수신자 거부)"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 500 <= error.smtp_code < 600
+    return False
+
+
+class OutboundEmailWorker:
+    """outbound_email 대기열 발송 워커"""
+
+    def __init__(
+            self,
+            pool: SMTPConnectionPool | None = None,
+            sender: str = EMAIL_FROM,
+            batch_size: int = EMAIL_BATCH_SIZE,
+            poll_interval: float = EMAIL_POLL_INTERVAL,
+            max_attempts: int = EMAIL_MAX_ATTEMPTS,
+            retry_base: float = EMAIL_RETRY_BASE_SECONDS,
+            retry_max: float = EMAIL_RETRY_MAX_SECONDS,
+            lease_seconds: int = EMAIL_LEASE_SECONDS):
+        self.pool = pool or SMTPConnectionPool()
+        self.sender = sender
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.lease_seconds = lease_seconds
+        self._executor: ThreadPoolExecutor | None = None
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.pool.size, thread_name_prefix="smtp")
+        return self._executor
+
+    def retry_delay(self, attempts: int) -> float:
+        """attempts번째 시도가 실패한 뒤 기다릴 시간(초)"""
+        return min(self.retry_base * 2 ** (attempts - 1), self.retry_max)
+
+    def _build_message(self, email: Dict[str, Any]) -> EmailMessage:
+        msg = EmailMessage()
+        msg["From"] = self.sender
+        msg["To"] = email["recipient"]
+        msg["Subject"] = email["subject"]
+        msg.set_content(email["body_html"], subtype="html")
+        return msg
+
+    def _send_one(self, email: Dict[str, Any]) -> Exception | None:
+        start = time.perf_counter()
+        try:
+            self.pool.send(self._build_message(email))
+        except Exception as e:
+            EMAIL_SEND_SECONDS.labels("error").observe(time.perf_counter() - start)
+            return e
+        EMAIL_SEND_SECONDS.labels("sent").observe(time.perf_counter() - start)
+        return None
+
+    def process_batch(self) -> int:
+        """
+        대기열에서 한 배치를 점유해 발송하고 결과를 기록, 점유한 이메일 수 반환
+        동기 함수 (스크립트에서 직접 호출 가능)
+        """
+        with DBManager() as manager:
+            emails = manager.claim_outbound_emails(self.batch_size, self.lease_seconds)
+
+        if emails:
+            errors = list(self.executor.map(self._send_one, emails))
+
+            sent_ids: List[int] = []
+            with DBManager() as manager:
+                with manager.transaction():
+                    for email, error in zip(emails, errors):
+                        if error is None:
+                            sent_ids.append(email["id"])
+                            continue
+                        if _is_permanent(error) or email["attempts"] >= self.max_attempts:
+                            EMAIL_RESULTS.labels("failed").inc()
+                            logger.error(f"이메일 발송 실패 (id={email['id']}, {email['attempts']}회): {error!r}")
+                            manager.mark_email_failed(email["id"], repr(error))
+                        else:
+                            EMAIL_RESULTS.labels("retry").inc()
+                            logger.warning(f"이메일 발송 재시도 예정 (id={email['id']}, {email['attempts']}회): {error!r}")
+                            retry_at = datetime.now() + timedelta(seconds=self.retry_delay(email["attempts"]))
+                            manager.mark_email_failed(email["id"], repr(error), retry_at=retry_at)
+                    manager.mark_emails_sent(sent_ids)
+            EMAIL_RESULTS.labels("sent").inc(len(sent_ids))
+
+        with DBManager() as manager:
+            for status, count in manager.count_pending_emails().items():
+                EMAIL_QUEUE_DEPTH.labels(status).set(count)
+        return len(emails)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await asyncio.to_thread(self.process_batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"이메일 대기열 처리 오류: {e}")
+                claimed = 0
+            if claimed >= self.batch_size:
+                # 대기열이 밀려 있으면 바로 다음 배치
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def wake(self) -> None:
+        """새 이메일이 들어왔음을 알림 (다음 폴링을 기다리지 않고 발송)"""
+        if self._wake is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.pool.close()
+
+
+email_worker = OutboundEmailWorker()
@@ -0,0 +1,148 @@
+from datetime import datetime
+from typing import Any, Dict, List
+import asyncio
+import logging
+import time
+import os
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.exc import IntegrityError
+
+from db.db_manager import DBManager
+
+"""
+login log writer:
+    로그인 기록(login_log)을 요청 안에서 바로 쓰지 않고 메모리 버퍼에 모았다가 백그라운드에서 저장
+        LOGIN_LOG_BATCH_SIZE개가 모이거나 LOGIN_LOG_FLUSH_MS가 지나면 multi-row INSERT 한 번으로 저장
+        버퍼가 LOGIN_LOG_MAX_BUFFER에 차면 새 기록은 버리고 카운터만 올림 (로그인 응답을 기다리게 하지 않음)
+        저장 실패 시 버퍼 앞에 되돌려 다음 주기에 다시 시도, FK 오류(롤백된 신규 가입 등)는 행 단위로 나눠 해당 행만 버림
+    앱 시작 시 start(), 종료 시 stop() (남은 기록을 모두 저장, app.py lifespan)
+"""
+
+logger = logging.getLogger(__name__)
+
+LOGIN_LOG_BATCH_SIZE = int(os.getenv("LOGIN_LOG_BATCH_SIZE", "200"))
+LOGIN_LOG_FLUSH_MS = float(os.getenv("LOGIN_LOG_FLUSH_MS", "500"))
+LOGIN_LOG_MAX_BUFFER = int(os.getenv("LOGIN_LOG_MAX_BUFFER", "10000"))
+
+LOGIN_LOG_EVENTS = Counter(
+    "login_log_events_total",
+    "로그인 기록 처리 결과별 건수 (written, dropped, rejected)",
+    ["result"],
+)
+LOGIN_LOG_BUFFERED = Gauge(
+    "login_log_buffered",
+    "저장 대기 중인 로그인 기록 수",
+)
+LOGIN_LOG_FLUSH_SECONDS = Histogram(
+    "login_log_flush_seconds",
+    "로그인 기록 배치 저장 시간",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+
+class LoginEventWriter:
+    """로그인 기록 write-behind 버퍼"""
+
+    def __init__(
+            self,
+            batch_size: int = LOGIN_LOG_BATCH_SIZE,
+            flush_interval: float = LOGIN_LOG_FLUSH_MS / 1000,
+            max_buffer: int = LOGIN_LOG_MAX_BUFFER):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self._buffer: List[Dict[str, Any]] = []
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self._flush_lock: asyncio.Lock | None = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def record(self, uuid: str, status_code: int, ip: str) -> bool:
+        """로그인 기록 추가 (DB를 기다리지 않음), 버퍼가 가득 차서 버렸으면 False"""
+        if len(self._buffer) >= self.max_buffer:
+            LOGIN_LOG_EVENTS.labels("dropped").inc()
+            return False
+        self._buffer.append({"uuid": uuid, "status_code": status_code, "ip": ip, "datetime": datetime.now()})
+        LOGIN_LOG_BUFFERED.set(len(self._buffer))
+        if self._wake is not None and len(self._buffer) >= self.batch_size:
+            self._wake.set()
+        return True
+
+    @staticmethod
+    def _write(events: List[Dict[str, Any]]) -> int:
+        """배치 저장, 무결성 오류가 나면 행 단위로 다시 저장하고 실패한 행은 버림"""
+        try:
+            with DBManager() as manager:
+                return manager.record_logins(events)
+        except IntegrityError:
+            if len(events) == 1:
+                logger.warning(f"로그인 기록 저장 불가, 버림: {events[0]}")
+                LOGIN_LOG_EVENTS.labels("rejected").inc()
+                return 0
+        written = 0
+        for event in events:
+            written += LoginEventWriter._write([event])
+        return written
+
+    async def flush(self) -> int:
+        """버퍼의 기록을 batch_size개씩 모두 저장, 저장한 수 반환"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        written = 0
+        async with self._flush_lock:
+            while self._buffer:
+                batch = self._buffer[:self.batch_size]
+                del self._buffer[:self.batch_size]
+                start = time.perf_counter()
+                try:
+                    count = await asyncio.to_thread(self._write, batch)
+                except Exception as e:
+                    # DB 장애: 되돌려 놓고 다음 주기에 재시도 (버퍼 크기 제한은 유지)
+                    logger.warning(f"로그인 기록 저장 실패, 재시도 예정 ({len(batch)}건): {e}")
+                    room = max(0, self.max_buffer - len(self._buffer))
+                    self._buffer[:0] = batch[:room]
+                    if len(batch) > room:
+                        LOGIN_LOG_EVENTS.labels("dropped").inc(len(batch) - room)
+                    break
+                finally:
+                    LOGIN_LOG_BUFFERED.set(len(self._buffer))
+                LOGIN_LOG_FLUSH_SECONDS.observe(time.perf_counter() - start)
+                LOGIN_LOG_EVENTS.labels("written").inc(count)
+                written += count
+        return written
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.exception(f"로그인 기록 저장 오류: {e}")
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._wake = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 태스크를 멈추고 남은 기록 저장"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        self._wake = None
+
+
+login_event_writer = LoginEventWriter()
@@ -0,0 +1,145 @@
+from typing import Any, Dict
+import asyncio
+import logging
+import os
+
+import httpx
+
+"""
+oauth client:
+    Google OAuth 토큰 교환 / 사용자 정보 조회용 공용 비동기 HTTP 클라이언트
+        keep-alive 연결 풀, 연결/읽기 타임아웃
+        연결 실패는 요청 종류와 관계없이 재시도 (요청이 전송되지 않았으므로 안전)
+        5xx / 429는 GET(사용자 정보)만 지수 백오프로 재시도 (인가 코드는 한 번만 쓸 수 있음)
+    앱 시작 시 start(), 종료 시 aclose() (app.py lifespan)
+    GOOGLE_OAUTH_BASE_URL을 주면 모든 엔드포인트를 그 주소 아래로 보냄 (테스트용 로컬 stub 서버)
+"""
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_OAUTH_BASE_URL = os.getenv("GOOGLE_OAUTH_BASE_URL")
+GOOGLE_AUTH_URL = f"{GOOGLE_OAUTH_BASE_URL}/o/oauth2/auth" if GOOGLE_OAUTH_BASE_URL else "https://accounts.google.com/o/oauth2/auth"
+GOOGLE_TOKEN_URL = f"{GOOGLE_OAUTH_BASE_URL}/token" if GOOGLE_OAUTH_BASE_URL else "https://oauth2.googleapis.com/token"
+GOOGLE_USER_INFO_URL = f"{GOOGLE_OAUTH_BASE_URL}/oauth2/v2/userinfo" if GOOGLE_OAUTH_BASE_URL else "https://www.googleapis.com/oauth2/v2/userinfo"
+
+OAUTH_HTTP_TIMEOUT = float(os.getenv("OAUTH_HTTP_TIMEOUT", "5"))
+OAUTH_HTTP_CONNECT_TIMEOUT = float(os.getenv("OAUTH_HTTP_CONNECT_TIMEOUT", "3"))
+OAUTH_HTTP_RETRIES = int(os.getenv("OAUTH_HTTP_RETRIES", "2"))
+OAUTH_HTTP_MAX_CONNECTIONS = int(os.getenv("OAUTH_HTTP_MAX_CONNECTIONS", "50"))
+
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class OAuthError(Exception):
+    """OAuth 제공자 응답 오류"""
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class GoogleOAuthClient:
+    """Google OAuth 비동기 클라이언트"""
+
+    def __init__(
+            self,
+            token_url: str = GOOGLE_TOKEN_URL,
+            user_info_url: str = GOOGLE_USER_INFO_URL,
+            timeout: float = OAUTH_HTTP_TIMEOUT,
+            connect_timeout: float = OAUTH_HTTP_CONNECT_TIMEOUT,
+            retries: int = OAUTH_HTTP_RETRIES,
+            max_connections: int = OAUTH_HTTP_MAX_CONNECTIONS):
+        self.token_url = token_url
+        self.user_info_url = user_info_url
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.retries = retries
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections // 2 or 1)
+        self._client: httpx.AsyncClient | None = None
+
+    async def start(self) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                # 연결 단계 실패만 재시도하는 transport
+                transport=httpx.AsyncHTTPTransport(retries=self.retries, limits=self.limits),
+            )
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            # lifespan 밖(스크립트, 테스트)에서 쓰는 경우
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self.limits,
+                transport=httpx.AsyncHTTPTransport(retries=self.retries, limits=self.limits),
+            )
+        return self._client
+
+    async def _get_with_retry(self, url: str, **kwargs) -> httpx.Response:
+        for attempt in range(self.retries + 1):
+            try:
+                response = await self.client.get(url, **kwargs)
+            except httpx.TimeoutException as e:
+                if attempt == self.retries:
+                    raise OAuthError(f"OAuth 서버 응답 시간 초과: {e}") from e
+            else:
+                if response.status_code not in _RETRY_STATUS or attempt == self.retries:
+                    return response
+            await asyncio.sleep(0.2 * 2 ** attempt)
+        raise AssertionError("unreachable")
+
+    @staticmethod
+    def _json(response: httpx.Response, message: str) -> Dict[str, Any]:
+        """응답 본문을 JSON으로 해석, 해석할 수 없으면 OAuthError"""
+        try:
+            return response.json()
+        except ValueError as e:
+            raise OAuthError(f"{message}: 응답을 JSON으로 해석할 수 없습니다 ({e})", response.status_code) from e
+
+    async def exchange_code(self, code: str, client_id: str, client_secret: str, redirect_uri: str) -> Dict[str, Any]:
+        """
+        인가 코드를 토큰으로 교환
+
+        Raises:
+            OAuthError: 교환 실패, 시간 초과
+        """
+        try:
+            response = await self.client.post(self.token_url, data={
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "code": code,
+                "redirect_uri": redirect_uri,
+                "grant_type": "authorization_code",
+            })
+        except httpx.HTTPError as e:
+            raise OAuthError(f"OAuth 토큰 요청 실패: {e}") from e
+        if response.is_error:
+            raise OAuthError(f"OAuth 토큰 요청 실패: {response.status_code}", response.status_code)
+        return self._json(response, "OAuth 토큰 요청 실패")
+
+    async def get_user_info(self, access_token: str) -> Dict[str, Any]:
+        """
+        액세스 토큰으로 사용자 정보 조회
+
+        Raises:
+            OAuthError: 조회 실패, 시간 초과
+        """
+        try:
+            response = await self._get_with_retry(
+                self.user_info_url,
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+        except httpx.HTTPError as e:
+            raise OAuthError(f"OAuth 사용자 정보 요청 실패: {e}") from e
+        if response.is_error:
+            raise OAuthError(f"OAuth 사용자 정보 요청 실패: {response.status_code}", response.status_code)
+        return self._json(response, "OAuth 사용자 정보 요청 실패")
+
+
+google_oauth_client = GoogleOAuthClient()
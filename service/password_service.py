@@ -0,0 +1,171 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+import asyncio
+import threading
+import logging
+import hmac
+import time
+import os
+
+import bcrypt
+
+"""
+password service:
+    bcrypt 해시 / 검증을 이벤트 루프 밖의 제한된 스레드 풀에서 실행
+        bcrypt는 계산 중 GIL을 놓으므로 스레드 수만큼 코어를 사용
+        대기 중인 작업이 PASSWORD_HASH_MAX_PENDING을 넘으면 PasswordServiceBusy (크리덴셜 스터핑 폭주 대응)
+    cost(rounds)는 PASSWORD_BCRYPT_ROUNDS로 고정하거나, 시작 시 벤치마크로 목표 시간에 맞춰 자동 조정
+    로그인 시 저장된 해시의 cost가 현재 값보다 낮거나 평문으로 저장된 옛 비밀번호면 새 해시를 돌려줌
+"""
+
+logger = logging.getLogger(__name__)
+
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+# 실행 중 + 대기 중 작업 수 상한
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", str(PASSWORD_HASH_WORKERS * 8)))
+# 해시 한 번의 목표 시간(ms), 자동 조정 기준
+PASSWORD_HASH_TARGET_MS = float(os.getenv("PASSWORD_HASH_TARGET_MS", "250"))
+# 지정하면 자동 조정하지 않음
+PASSWORD_BCRYPT_ROUNDS = os.getenv("PASSWORD_BCRYPT_ROUNDS")
+
+MIN_ROUNDS = 10
+MAX_ROUNDS = 16
+
+
+class PasswordServiceBusy(Exception):
+    """해시 작업 대기열이 가득 참, 잠시 후 다시 시도해야 함"""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__("비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+        self.retry_after = retry_after
+
+
+def _is_bcrypt_hash(value: str) -> bool:
+    return value.startswith(("$2a$", "$2b$", "$2y$")) and len(value) == 60
+
+
+def _hash_rounds(hashed: str) -> int | None:
+    try:
+        return int(hashed.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+class PasswordService:
+    """비밀번호 해시 / 검증 서비스"""
+
+    def __init__(
+            self,
+            workers: int = PASSWORD_HASH_WORKERS,
+            max_pending: int = PASSWORD_HASH_MAX_PENDING,
+            rounds: int | None = int(PASSWORD_BCRYPT_ROUNDS) if PASSWORD_BCRYPT_ROUNDS else None):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.rounds = rounds or 12
+        self.rounds_fixed = rounds is not None
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        # 없는 사용자 로그인도 같은 시간이 걸리도록 비교할 해시
+        self._dummy_hash: bytes | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password")
+        return self._executor
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def tune(self, target_ms: float = PASSWORD_HASH_TARGET_MS) -> int:
+        """
+        해시 한 번이 target_ms를 넘지 않는 가장 큰 cost를 찾아 적용
+        rounds가 1 늘 때마다 시간이 두 배가 되므로 MIN_ROUNDS 한 번만 재고 나머지는 계산
+        """
+        if self.rounds_fixed:
+            return self.rounds
+        password = b"benchmark-password"
+        salt = bcrypt.gensalt(rounds=MIN_ROUNDS)
+        start = time.perf_counter()
+        bcrypt.hashpw(password, salt)
+        base_ms = (time.perf_counter() - start) * 1000
+        rounds = MIN_ROUNDS
+        while rounds < MAX_ROUNDS and base_ms * 2 ** (rounds + 1 - MIN_ROUNDS) <= target_ms:
+            rounds += 1
+        self.rounds = rounds
+        self._dummy_hash = None
+        logger.info(f"bcrypt cost {rounds} 적용 (cost {MIN_ROUNDS}: {base_ms:.1f}ms, 목표 {target_ms:.0f}ms)")
+        return rounds
+
+    async def autotune(self, target_ms: float = PASSWORD_HASH_TARGET_MS) -> int:
+        """tune()을 스레드 풀에서 실행 (서버 시작 시)"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self.tune, target_ms)
+
+    async def _run(self, func, *args):
+        """대기열 상한을 지키며 스레드 풀에서 실행"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PasswordServiceBusy(retry_after=max(1, round(self._pending / self.workers * PASSWORD_HASH_TARGET_MS / 1000)))
+            self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def hash_sync(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=self.rounds)).decode("utf-8")
+
+    def verify_sync(self, password: str, hashed: str | None) -> bool:
+        if hashed is None:
+            # 없는 사용자: 같은 비용의 비교를 한 번 해서 응답 시간으로 가입 여부가 드러나지 않게 함
+            if self._dummy_hash is None:
+                self._dummy_hash = bcrypt.hashpw(b"dummy-password", bcrypt.gensalt(rounds=self.rounds))
+            bcrypt.checkpw(password.encode("utf-8"), self._dummy_hash)
+            return False
+        if not _is_bcrypt_hash(hashed):
+            # 해시 도입 전 평문으로 저장된 비밀번호
+            return hmac.compare_digest(password.encode("utf-8"), hashed.encode("utf-8"))
+        return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """
+        평문이거나 cost가 현재 값보다 낮으면 True
+        워커마다 자동 조정된 cost가 달라도 로그인마다 번갈아 다시 해시하지 않도록 높이는 방향만 허용
+        """
+        return not _is_bcrypt_hash(hashed) or (_hash_rounds(hashed) or 0) < self.rounds
+
+    async def hash(self, password: str) -> str:
+        """
+        비밀번호 해시
+
+        Raises:
+            PasswordServiceBusy: 대기열이 가득 찬 경우
+        """
+        return await self._run(self.hash_sync, password)
+
+    async def verify(self, password: str, hashed: str | None) -> Tuple[bool, str | None]:
+        """
+        비밀번호 검증, hashed가 None이면 (없는 사용자) 항상 실패
+
+        Returns:
+            (일치 여부, 새 해시), 일치했고 다시 해시해야 하면 새 해시, 아니면 None
+
+        Raises:
+            PasswordServiceBusy: 대기열이 가득 찬 경우
+        """
+        def verify_and_rehash():
+            if not self.verify_sync(password, hashed):
+                return False, None
+            return True, self.hash_sync(password) if self.needs_rehash(hashed) else None
+        return await self._run(verify_and_rehash)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_service = PasswordService()
@@ -0,0 +1,133 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Dict, List, Literal, Tuple
+import heapq
+import threading
+import logging
+import time
+import os
+
+from db.db_manager import AsyncDBManager
+
+"""
+verification store:
+    이메일 인증 코드 저장소
+        put(email, code, ttl)   코드 저장, 같은 이메일은 새 코드로 교체
+        confirm(email, code)    일치하면 삭제하고 "ok", 아니면 "missing" / "expired" / "mismatch"
+    MemoryVerificationStore     단일 프로세스용, 만료 시각 힙으로 만료 항목을 앞에서부터 정리, 최대 크기 제한
+    SQLVerificationStore        여러 워커가 공유 (email_verification 테이블), 확인은 DELETE 한 번으로 원자적
+    VERIFICATION_STORE=memory | database (기본 database)
+"""
+
+logger = logging.getLogger(__name__)
+
+VERIFICATION_STORE = os.getenv("VERIFICATION_STORE", "database")
+VERIFICATION_STORE_MAXSIZE = int(os.getenv("VERIFICATION_STORE_MAXSIZE", "100000"))
+# database 저장소의 만료 행 정리 주기(초)
+VERIFICATION_PURGE_INTERVAL = float(os.getenv("VERIFICATION_PURGE_INTERVAL", "300"))
+
+VerificationResult = Literal["ok", "missing", "expired", "mismatch"]
+
+
+class VerificationStore(ABC):
+    """이메일 인증 코드 저장소 인터페이스"""
+
+    @abstractmethod
+    async def put(self, email: str, code: str, ttl: timedelta) -> None:
+        ...
+
+    @abstractmethod
+    async def confirm(self, email: str, code: str) -> VerificationResult:
+        ...
+
+
+class MemoryVerificationStore(VerificationStore):
+    """프로세스 내 저장소, 최대 maxsize개 (넘으면 가장 먼저 만료될 코드부터 제거)"""
+
+    def __init__(self, maxsize: int = VERIFICATION_STORE_MAXSIZE):
+        if maxsize <= 0:
+            raise ValueError("maxsize는 1 이상이어야 합니다.")
+        self.maxsize = maxsize
+        # email -> (code, 만료 시각(monotonic), 세대 번호)
+        self._codes: Dict[str, Tuple[str, float, int]] = {}
+        # (만료 시각, 세대 번호, email), 코드가 교체되거나 확인된 항목은 세대 번호가 달라 무시
+        self._heap: List[Tuple[float, int, str]] = []
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def _pop_head(self) -> None:
+        _, generation, email = heapq.heappop(self._heap)
+        entry = self._codes.get(email)
+        if entry is not None and entry[2] == generation:
+            del self._codes[email]
+
+    def _purge(self, now: float) -> None:
+        """만료된 항목 정리, 항목마다 힙에서 한 번씩만 꺼내므로 put당 평균 O(log n)"""
+        while self._heap and self._heap[0][0] <= now:
+            self._pop_head()
+        # 교체/확인으로 힙에만 남은 항목이 살아 있는 항목보다 많아지면 힙을 다시 만듦
+        if len(self._heap) > 2 * len(self._codes) + 64:
+            self._heap = [(expires, generation, email) for email, (_, expires, generation) in self._codes.items()]
+            heapq.heapify(self._heap)
+
+    async def put(self, email: str, code: str, ttl: timedelta) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._purge(now)
+            while len(self._codes) >= self.maxsize and email not in self._codes:
+                self._pop_head()
+            self._generation += 1
+            expires = now + ttl.total_seconds()
+            self._codes[email] = (code, expires, self._generation)
+            heapq.heappush(self._heap, (expires, self._generation, email))
+
+    async def confirm(self, email: str, code: str) -> VerificationResult:
+        with self._lock:
+            entry = self._codes.get(email)
+            if entry is None:
+                return "missing"
+            stored_code, expires, _ = entry
+            if time.monotonic() >= expires:
+                del self._codes[email]
+                return "expired"
+            if stored_code != code:
+                return "mismatch"
+            del self._codes[email]
+            return "ok"
+
+
+class SQLVerificationStore(VerificationStore):
+    """email_verification 테이블 저장소 (멀티 워커)"""
+
+    def __init__(self, purge_interval: float = VERIFICATION_PURGE_INTERVAL):
+        self.purge_interval = purge_interval
+        self._last_purge = time.monotonic()
+
+    async def put(self, email: str, code: str, ttl: timedelta) -> None:
+        async with AsyncDBManager() as db_manager:
+            await db_manager.save_verification_code(email, code, datetime.now() + ttl)
+            # 확인하지 않고 만료된 코드는 주기적으로 삭제 (테이블 크기 유지)
+            now = time.monotonic()
+            if now - self._last_purge >= self.purge_interval:
+                self._last_purge = now
+                purged = await db_manager.purge_expired_verification_codes()
+                if purged:
+                    logger.info(f"만료된 인증 코드 {purged}개 삭제")
+
+    async def confirm(self, email: str, code: str) -> VerificationResult:
+        async with AsyncDBManager() as db_manager:
+            return await db_manager.consume_verification_code(email, code)
+
+
+def create_verification_store(kind: str = VERIFICATION_STORE) -> VerificationStore:
+    if kind == "memory":
+        return MemoryVerificationStore()
+    if kind == "database":
+        return SQLVerificationStore()
+    raise ValueError(f"알 수 없는 VERIFICATION_STORE: {kind}")
+
+
+verification_store = create_verification_store()
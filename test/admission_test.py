@@ -0,0 +1,139 @@
+import os
+import sys
+import unittest
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from service.admission import AdmissionControlMiddleware, LoadMonitor, RateLimit, TokenBucketLimiter
+
+"""
+요청 폭주 대응 테스트 (service/admission.py)
+    토큰 버킷 허용 / 대기 시간 / 보충, 쉰 키와 초과 키 제거, IP / 계정 키 rate limit(429 + Retry-After),
+    본문을 읽은 뒤에도 앱이 같은 본문을 받는지, 과부하 시 503, 제외 경로 확인
+"""
+
+
+class TokenBucketLimiterTest(unittest.TestCase):
+
+    def test_burst_then_wait(self):
+        limiter = TokenBucketLimiter(rate=1, burst=2)
+        self.assertEqual(limiter.acquire("a", now=0), 0)
+        self.assertEqual(limiter.acquire("a", now=0), 0)
+        self.assertAlmostEqual(limiter.acquire("a", now=0), 1.0)
+        self.assertAlmostEqual(limiter.acquire("a", now=0.5), 0.5)
+        # 토큰은 시간에 따라 보충되고 burst를 넘지 않음
+        self.assertEqual(limiter.acquire("a", now=1.0), 0)
+        self.assertEqual(limiter.acquire("b", now=1.0), 0)
+
+    def test_refill_is_capped(self):
+        limiter = TokenBucketLimiter(rate=1, burst=2, max_keys=10)
+        limiter.acquire("a", now=0)
+        limiter.acquire("a", now=100)
+        limiter.acquire("a", now=100)
+        self.assertGreater(limiter.acquire("a", now=100), 0)
+
+    def test_idle_keys_are_evicted(self):
+        limiter = TokenBucketLimiter(rate=1, burst=2)
+        limiter.acquire("a", now=0)
+        limiter.acquire("b", now=1)
+        limiter.acquire("c", now=2.5)
+        # a는 burst / rate(2초) 넘게 쉬어 새 키와 같으므로 제거
+        self.assertEqual(list(limiter._buckets), ["b", "c"])
+
+    def test_max_keys(self):
+        limiter = TokenBucketLimiter(rate=1, burst=5, max_keys=3)
+        for i in range(10):
+            limiter.acquire(f"ip{i}", now=0)
+        self.assertEqual(len(limiter), 3)
+        self.assertEqual(list(limiter._buckets), ["ip7", "ip8", "ip9"])
+
+    def test_invalid_rule(self):
+        with self.assertRaises(ValueError):
+            TokenBucketLimiter(rate=0, burst=1)
+
+
+class AdmissionControlMiddlewareTest(unittest.TestCase):
+
+    def setUp(self):
+        app = FastAPI()
+
+        @app.post("/login")
+        async def login(request: Request):
+            return await request.json()
+
+        @app.get("/metrics")
+        async def metrics():
+            return "ok"
+
+        @app.get("/other")
+        async def other():
+            return "ok"
+
+        self.monitor = LoadMonitor(max_loop_lag=10, max_pool_wait=10)
+        app.add_middleware(AdmissionControlMiddleware, monitor=self.monitor, enabled=True, rules={
+            "/login": [RateLimit("ip", rate=0.001, burst=3), RateLimit("account", rate=0.001, burst=2)],
+        })
+        self.client = TestClient(app)
+
+    def login(self, email):
+        return self.client.post("/login", json={"email": email, "password": "pw"})
+
+    def test_body_is_passed_through(self):
+        response = self.login("a@example.com")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"email": "a@example.com", "password": "pw"})
+
+    def test_account_limit(self):
+        self.assertEqual(self.login("A@example.com ").status_code, 200)
+        self.assertEqual(self.login("a@example.com").status_code, 200)
+        # 이메일은 대소문자 / 공백을 무시한 같은 계정
+        response = self.login("a@example.com")
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response.headers["retry-after"]), 1)
+        self.assertIn("detail", response.json())
+
+    def test_ip_limit(self):
+        for email in ("a@example.com", "b@example.com", "c@example.com"):
+            self.assertEqual(self.login(email).status_code, 200)
+        self.assertEqual(self.login("d@example.com").status_code, 429)
+
+    def test_unlimited_route(self):
+        for _ in range(10):
+            self.assertEqual(self.client.get("/other").status_code, 200)
+
+    def test_overload_is_shed(self):
+        self.monitor.loop_lag = 100
+        response = self.client.get("/other")
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("retry-after", response.headers)
+        # 지표 수집 경로는 과부하여도 통과
+        self.assertEqual(self.client.get("/metrics").status_code, 200)
+
+    def test_pool_wait_overload(self):
+        with mock.patch("service.admission.recent_checkout_wait", return_value=100):
+            self.assertEqual(self.monitor.overload_reason(), "pool_wait")
+            self.assertEqual(self.client.get("/other").status_code, 503)
+
+
+class AccountKeyTest(unittest.TestCase):
+
+    def test_account_key(self):
+        self.assertEqual(AdmissionControlMiddleware._account_key(b'{"email": " A@Example.com "}'), "a@example.com")
+        self.assertIsNone(AdmissionControlMiddleware._account_key(b"not json"))
+        self.assertIsNone(AdmissionControlMiddleware._account_key(b'["a@example.com"]'))
+        self.assertIsNone(AdmissionControlMiddleware._account_key(b'{"email": "  "}'))
+        self.assertIsNone(AdmissionControlMiddleware._account_key(b'{"email": "' + b"a" * 70000 + b'"}'))
+
+
+if __name__ == "__main__":
+    unittest.main()
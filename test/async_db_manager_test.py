@@ -0,0 +1,80 @@
+import os
+import sys
+import asyncio
+import unittest
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from db.db_manager import AsyncDBManager, DBManager
+from db.db_mixin.food_mixin import food_cache
+from db.tables.food_table import FoodInfo, FoodCategory, FoodNutrition, FoodTag, FoodInfoTag
+
+"""
+AsyncDBManager 테스트
+    DBManager 공개 메서드를 코루틴으로 노출하는지, 동기 세션에 바인딩해 실행하는지 확인
+    MySQL 없이 돌리기 위해 AsyncSession 대신 SQLite 동기 세션으로 run_sync를 실행하는 세션을 쓴다.
+"""
+
+
+class SyncBackedAsyncSession:
+    """run_sync만 흉내 내는 테스트용 AsyncSession"""
+
+    def __init__(self, sync_session):
+        self.sync_session = sync_session
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.sync_session, *args, **kwargs)
+
+
+class AsyncDBManagerTest(unittest.TestCase):
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        for table in (FoodInfo, FoodCategory, FoodNutrition, FoodTag, FoodInfoTag):
+            table.__table__.create(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.session.add(FoodInfo(food_id="F1", food_name="김치찌개", data_type_code="D"))
+        self.session.commit()
+        food_cache.clear()
+        self.manager = AsyncDBManager()
+        self.manager.session = SyncBackedAsyncSession(self.session)
+
+    def tearDown(self):
+        self.session.close()
+        food_cache.clear()
+
+    def test_public_method_is_awaitable(self):
+        food = asyncio.run(self.manager.get_food_by_id("F1"))
+        self.assertEqual(food.food_name, "김치찌개")
+
+    def test_run_sync_binds_sync_session(self):
+        def read(manager, food_id):
+            self.assertIsInstance(manager, DBManager)
+            self.assertIs(manager.session, self.session)
+            return manager.get_food_by_id(food_id).food_id
+
+        self.assertEqual(asyncio.run(self.manager.run_sync(read, "F1")), "F1")
+
+    def test_private_and_sync_only_names_are_hidden(self):
+        for name in ("_to_domain", "check_user_exists", "check_session", "no_such_method"):
+            with self.subTest(name=name):
+                with self.assertRaises(AttributeError):
+                    getattr(self.manager, name)
+
+    def test_run_sync_requires_session(self):
+        manager = AsyncDBManager()
+        with self.assertRaises(RuntimeError):
+            asyncio.run(manager.get_food_by_id("F1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY, generate_latest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import StaticPool
+from db import metrics
+from db.metrics import DBMetricsMiddleware, InstrumentedQueuePool, instrument_engine, instrument_methods
+
+"""
+DB 계측 테스트 (db/metrics.py)
+    쿼리 실행 시간 / 행 수 / 오류 / 느린 쿼리, 메서드와 라우트 구분, 풀 checkout 대기와 timeout, 풀 상태 수집 확인
+    Prometheus 기본 레지스트리를 공유하므로 테스트마다 풀 이름을 따로 쓴다.
+"""
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class QueryMetricsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.name = f"test-query-{self.id().rsplit('.', 1)[-1]}"
+        self.engine = instrument_engine(
+            create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False}), self.name
+        )
+        with self.engine.begin() as connection:
+            connection.execute(text("CREATE TABLE item (id INTEGER)"))
+            connection.execute(text("INSERT INTO item VALUES (1), (2), (3)"))
+
+    def tearDown(self):
+        metrics._engines.pop(self.name, None)
+
+    def labels(self, operation, method="-", route="-"):
+        return {"pool": self.name, "operation": operation, "method": method, "route": route}
+
+    def test_duration_and_rows(self):
+        with self.engine.begin() as connection:
+            connection.execute(text("UPDATE item SET id = id + 1"))
+            connection.execute(text("SELECT id FROM item")).all()
+        self.assertEqual(sample("db_query_duration_seconds_count", **self.labels("SELECT")), 1)
+        self.assertEqual(sample("db_query_rows_sum", **self.labels("UPDATE")), 3)
+
+    def test_errors_are_counted(self):
+        with self.assertRaises(OperationalError), self.engine.connect() as connection:
+            connection.execute(text("SELECT * FROM missing"))
+        self.assertEqual(sample("db_query_errors_total", **self.labels("SELECT")), 1)
+        self.assertEqual(sample("db_query_duration_seconds_count", **self.labels("SELECT")), 0)
+
+    def test_slow_query_log(self):
+        with mock.patch.object(metrics, "SLOW_QUERY_MS", 0), self.assertLogs("db.metrics", "WARNING") as logs:
+            with self.engine.connect() as connection:
+                connection.execute(text("SELECT   id\n FROM item"))
+        self.assertEqual(sample("db_slow_queries_total", **self.labels("SELECT")), 1)
+        self.assertIn("SELECT id FROM item", logs.output[0])
+
+    def test_method_label(self):
+        engine = self.engine
+
+        @instrument_methods
+        class Manager:
+            def outer(self):
+                return self.inner()
+
+            def inner(self):
+                with engine.connect() as connection:
+                    return connection.execute(text("SELECT id FROM item")).all()
+
+            def _private(self):
+                return self.inner()
+
+        Manager().outer()
+        Manager()._private()
+        # 다른 메서드를 부르면 바깥 메서드 이름, 비공개 메서드는 계측하지 않음
+        self.assertEqual(sample("db_query_duration_seconds_count", **self.labels("SELECT", method="outer")), 1)
+        self.assertEqual(sample("db_query_duration_seconds_count", **self.labels("SELECT", method="inner")), 1)
+
+    def test_route_label(self):
+        app = FastAPI()
+        app.add_middleware(DBMetricsMiddleware)
+        engine = self.engine
+
+        @app.get("/items/{item_id}")
+        def read_item(item_id: int):
+            with engine.connect() as connection:
+                return {"id": connection.execute(text("SELECT id FROM item WHERE id = :id"), {"id": item_id}).scalar()}
+
+        @app.get("/metrics")
+        def read_metrics():
+            return generate_latest().decode()
+
+        with TestClient(app) as client:
+            self.assertEqual(client.get("/items/2").json(), {"id": 2})
+            body = client.get("/metrics").json()
+        self.assertEqual(sample("db_query_duration_seconds_count", **self.labels("SELECT", route="/items/{item_id}")), 1)
+        self.assertIn(f'db_query_duration_seconds_count{{method="-",operation="SELECT",pool="{self.name}",route="/items/{{item_id}}"}}', body)
+
+
+class PoolMetricsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.name = f"test-pool-{self.id().rsplit('.', 1)[-1]}"
+        self.directory = tempfile.TemporaryDirectory()
+        self.engine = create_engine(
+            f"sqlite:///{self.directory.name}/pool.db",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        instrument_engine(self.engine, self.name)
+
+    def tearDown(self):
+        metrics._engines.pop(self.name, None)
+        self.engine.dispose()
+        self.directory.cleanup()
+
+    def test_checkout_wait_and_pool_state(self):
+        with self.engine.connect():
+            self.assertEqual(sample("db_pool_checkout_wait_seconds_count", pool=self.name), 1)
+            self.assertEqual(sample("db_pool_checked_out", pool=self.name), 1)
+            self.assertEqual(sample("db_pool_connections_created_total", pool=self.name), 1)
+        self.assertEqual(sample("db_pool_checked_out", pool=self.name), 0)
+        self.assertEqual(sample("db_pool_checked_in", pool=self.name), 1)
+        self.assertEqual(sample("db_pool_size", pool=self.name), 1)
+
+    def test_checkout_timeout(self):
+        with self.engine.connect():
+            with self.assertRaises(PoolTimeoutError), self.engine.connect():
+                pass
+        self.assertEqual(sample("db_pool_checkout_timeouts_total", pool=self.name), 1)
+        self.assertGreater(metrics.recent_checkout_wait(), 0)
+
+    def test_name_survives_dispose(self):
+        self.engine.dispose()
+        self.assertEqual(self.engine.pool.metrics_name, self.name)
+
+    def test_invalidation(self):
+        with self.engine.connect() as connection:
+            connection.invalidate()
+        self.assertEqual(sample("db_pool_invalidations_total", pool=self.name, soft="false"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import os
+import io
+import sys
+import json
+import tempfile
+import unittest
+from contextlib import ExitStack, contextmanager, redirect_stdout
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+import pandas as pd
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from data import db_migration
+from db.db_manager import DBManager
+from db.db_mixin.food_mixin import food_cache
+from db.tag_dictionary import tag_dictionary
+from db.tables.food_table import FoodInfo, FoodCategory, FoodSourceInfo, FoodCompany, FoodNutrition, FoodTag, FoodInfoTag
+from db.tables.migration_table import MigrationCheckpoint
+
+"""
+음식 데이터 적재(data/db_migration.py) 테스트
+    CSV 청크 변환, 청크별 체크포인트로 이어서 진행, 청크 크기가 바뀌면 처음부터 진행 확인
+    DB 생성/권한/파티션/영양 행렬 단계는 건너뛰고 SQLite에 음식 테이블만 만들어 실행한다.
+"""
+
+CSV_COLUMNS = "food_id,food_name,data_type_code,reference_date,mfg_report_no,energy_kcal\n"
+
+
+def mysql_insert_ignore(conn, cursor, statement, parameters, context, executemany):
+    return statement.replace("INSERT IGNORE", "INSERT OR IGNORE"), parameters
+
+
+class PrepareFoodRecordsTest(unittest.TestCase):
+
+    def test_converts_columns(self):
+        chunk = pd.DataFrame({
+            "food_id": ["F1", "F2"],
+            "food_name": ["김치찌개", "된장찌개"],
+            "reference_date": ["2025-04-08", "날짜 아님"],
+            "mfg_report_no": ["2.01304E+12", None],
+            "energy_kcal": [120.0, float("nan")],
+        })
+        records = db_migration.prepare_food_records(chunk, {"F1": ["한식", "국물"]})
+        self.assertEqual(str(records[0]["reference_date"]), "2025-04-08")
+        self.assertIsNone(records[1]["reference_date"])
+        self.assertEqual(records[0]["mfg_report_no"], 2013040000000)
+        self.assertIsNone(records[1]["mfg_report_no"])
+        self.assertIsNone(records[1]["energy_kcal"])
+        self.assertEqual(records[0]["tags"], ["한식", "국물"])
+        self.assertEqual(records[1]["tags"], [])
+
+
+class FoodImportResumeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        event.listen(self.engine, "before_cursor_execute", mysql_insert_ignore, retval=True)
+        for table in (FoodInfo, FoodCategory, FoodSourceInfo, FoodCompany, FoodNutrition, FoodTag, FoodInfoTag, MigrationCheckpoint):
+            table.__table__.create(self.engine)
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.food_path = Path(self.directory.name) / "foods.csv"
+        self.food_path.write_text(CSV_COLUMNS + "".join(
+            f"F{i},음식{i},D,2025-04-08,,{100 + i}\n" for i in range(5)
+        ), encoding="utf-8")
+        self.tag_path = Path(self.directory.name) / "food_tags.json"
+        self.tag_path.write_text(json.dumps({"F0": ["한식"]}, ensure_ascii=False), encoding="utf-8")
+
+        self.patches = ExitStack()
+        self.patches.enter_context(mock.patch.object(db_migration, "root_engine", mock.MagicMock()))
+        self.patches.enter_context(mock.patch.object(db_migration, "engine", self.engine))
+        self.patches.enter_context(mock.patch.object(db_migration.Base.metadata, "create_all"))
+        self.patches.enter_context(mock.patch.object(db_migration, "partition_login_log", return_value=False))
+        self.patches.enter_context(mock.patch.object(db_migration, "rebuild_nutrition_matrix"))
+        self.patches.enter_context(mock.patch("db.db_manager.SessionLocal", sessionmaker(bind=self.engine)))
+        food_cache.clear()
+        tag_dictionary.clear()
+
+    def tearDown(self):
+        self.patches.close()
+        self.directory.cleanup()
+        food_cache.clear()
+        tag_dictionary.clear()
+
+    def run_import(self, chunk_size):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            db_migration.create_all_tables(self.food_path, self.tag_path, chunk_size=chunk_size)
+        return output.getvalue()
+
+    @contextmanager
+    def count_bulk_calls(self):
+        """create_foods_bulk에 넘어온 청크 기록"""
+        calls = []
+        create_foods_bulk = DBManager.create_foods_bulk
+
+        def record(manager, records, chunk_size=1000):
+            calls.append(records)
+            return create_foods_bulk(manager, records, chunk_size=chunk_size)
+
+        with mock.patch.object(DBManager, "create_foods_bulk", record):
+            yield calls
+
+    def scalar(self, query):
+        with self.engine.connect() as connection:
+            return connection.scalar(query)
+
+    def test_import_writes_checkpoint_per_chunk(self):
+        self.run_import(chunk_size=2)
+        self.assertEqual(self.scalar(select(func.count()).select_from(FoodInfo)), 5)
+        self.assertEqual(self.scalar(select(func.count()).select_from(FoodInfoTag)), 1)
+        with self.engine.connect() as connection:
+            checkpoints = connection.execute(
+                select(MigrationCheckpoint.job_name, MigrationCheckpoint.chunk_index, MigrationCheckpoint.row_count)
+                .order_by(MigrationCheckpoint.chunk_index)
+            ).all()
+        self.assertEqual([(index, rows) for _, index, rows in checkpoints], [(0, 2), (1, 2), (2, 1)])
+        self.assertTrue(all(name == "food_import:foods.csv:chunk_size=2" for name, _, _ in checkpoints))
+
+    def test_rerun_skips_completed_chunks(self):
+        self.run_import(chunk_size=2)
+        with self.count_bulk_calls() as calls:
+            output = self.run_import(chunk_size=2)
+        self.assertEqual(calls, [])
+        self.assertIn("완료된 청크 3개를 건너뜁니다", output)
+
+    def test_resumes_after_failed_chunk(self):
+        insert_food_chunk = DBManager._insert_food_chunk
+
+        def fail_on_second_chunk(manager, records):
+            if records[0]["food_id"] == "F2":
+                raise RuntimeError("연결 끊김")
+            return insert_food_chunk(manager, records)
+
+        with mock.patch.object(DBManager, "_insert_food_chunk", fail_on_second_chunk), \
+                self.assertLogs("db.db_mixin.food_mixin", "ERROR"):
+            output = self.run_import(chunk_size=2)
+        self.assertIn("[오류] 1번 청크", output)
+        self.assertEqual(self.scalar(select(func.count()).select_from(MigrationCheckpoint)), 1)
+
+        with self.count_bulk_calls() as calls:
+            self.run_import(chunk_size=2)
+        self.assertEqual([records[0]["food_id"] for records in calls], ["F2", "F4"])
+        self.assertEqual(self.scalar(select(func.count()).select_from(FoodInfo)), 5)
+
+    def test_other_chunk_size_starts_over(self):
+        self.run_import(chunk_size=2)
+        output = self.run_import(chunk_size=3)
+        self.assertIn("다른 청크 크기로 진행된 기록", output)
+        with self.engine.connect() as connection:
+            chunks = connection.execute(
+                select(MigrationCheckpoint.chunk_index, MigrationCheckpoint.created_count)
+                .where(MigrationCheckpoint.job_name == "food_import:foods.csv:chunk_size=3")
+                .order_by(MigrationCheckpoint.chunk_index)
+            ).all()
+        # 이미 들어간 음식은 중복으로 걸러져 새로 생성되지 않음
+        self.assertEqual(chunks, [(0, 0), (1, 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
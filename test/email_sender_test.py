@@ -0,0 +1,236 @@
+import os
+import sys
+import smtplib
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from db.db_manager import DBManager
+from db.tables.email_table import OutboundEmail
+from service.email_sender import OutboundEmailWorker, SMTPConnectionPool, _is_permanent
+
+"""
+이메일 발송 테스트 (outbound_email 대기열, service/email_sender.py)
+    대기열 추가 / 점유 / 점유 만료 후 재점유, 발송 결과 기록(sent / 재시도 / failed), 재시도 간격,
+    SMTP 연결 재사용, 끊긴 연결 교체, 오래 쉰 연결 NOOP 확인
+    SMTP 서버 대신 가짜 smtplib.SMTP를 쓴다.
+"""
+
+
+class FakeSMTP:
+    """smtplib.SMTP 대역, 만든 연결과 보낸 메일을 기록"""
+
+    created = []
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        self.closed = False
+        self.fail_next = None
+        self.noop_code = 250
+        FakeSMTP.created.append(self)
+
+    def starttls(self, context=None):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def noop(self):
+        return self.noop_code, b"OK"
+
+    def send_message(self, msg):
+        if self.fail_next is not None:
+            error, self.fail_next = self.fail_next, None
+            raise error
+        self.sent.append(msg["To"])
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+class SMTPConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        FakeSMTP.created = []
+        patcher = mock.patch("service.email_sender.smtplib.SMTP", FakeSMTP)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = SMTPConnectionPool(host="smtp.test", port=25, user=None, use_tls=False, size=2, max_idle=60)
+
+    def message(self, recipient="a@example.com"):
+        return OutboundEmailWorker(pool=self.pool, sender="noreply@example.com")._build_message(
+            {"recipient": recipient, "subject": "제목", "body_html": "<p>본문</p>"}
+        )
+
+    def test_connection_is_reused(self):
+        self.pool.send(self.message("a@example.com"))
+        self.pool.send(self.message("b@example.com"))
+        self.assertEqual(len(FakeSMTP.created), 1)
+        self.assertEqual(FakeSMTP.created[0].sent, ["a@example.com", "b@example.com"])
+
+    def test_disconnected_connection_is_replaced(self):
+        self.pool.send(self.message())
+        FakeSMTP.created[0].fail_next = smtplib.SMTPServerDisconnected("끊김")
+        self.pool.send(self.message("b@example.com"))
+        self.assertEqual(len(FakeSMTP.created), 2)
+        self.assertTrue(FakeSMTP.created[0].closed)
+        self.assertEqual(FakeSMTP.created[1].sent, ["b@example.com"])
+
+    def test_refused_recipient_keeps_connection(self):
+        self.pool.send(self.message())
+        FakeSMTP.created[0].fail_next = smtplib.SMTPRecipientsRefused({"b@example.com": (550, b"no such user")})
+        with self.assertRaises(smtplib.SMTPRecipientsRefused):
+            self.pool.send(self.message("b@example.com"))
+        self.pool.send(self.message("c@example.com"))
+        self.assertEqual(len(FakeSMTP.created), 1)
+
+    def test_idle_connection_is_checked(self):
+        self.pool.max_idle = 0
+        self.pool.send(self.message())
+        FakeSMTP.created[0].noop_code = 421
+        self.pool.send(self.message("b@example.com"))
+        self.assertEqual(len(FakeSMTP.created), 2)
+        self.assertTrue(FakeSMTP.created[0].closed)
+
+    def test_close(self):
+        self.pool.send(self.message())
+        self.pool.close()
+        self.assertTrue(FakeSMTP.created[0].closed)
+
+
+class EmailQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        OutboundEmail.__table__.create(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.manager = DBManager()
+        self.manager.session = self.session
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_claim_and_lease(self):
+        first = self.manager.enqueue_email("a@example.com", "제목", "<p>본문</p>")
+        self.manager.enqueue_email("b@example.com", "제목", "<p>본문</p>")
+        claimed = self.manager.claim_outbound_emails(batch_size=1, lease_seconds=60)
+        self.assertEqual([(email["id"], email["attempts"]) for email in claimed], [(first, 1)])
+        self.assertEqual(self.manager.count_pending_emails(), {"pending": 1, "sending": 1})
+        self.assertEqual(len(self.manager.claim_outbound_emails(batch_size=10, lease_seconds=60)), 1)
+        # 점유 중인 행은 만료 전까지 다시 가져가지 않음
+        self.assertEqual(self.manager.claim_outbound_emails(batch_size=10), [])
+
+    def test_expired_lease_is_claimed_again(self):
+        self.manager.enqueue_email("a@example.com", "제목", "<p>본문</p>")
+        self.manager.claim_outbound_emails(lease_seconds=-1)
+        claimed = self.manager.claim_outbound_emails()
+        self.assertEqual(claimed[0]["attempts"], 2)
+
+    def test_mark_results(self):
+        ids = [self.manager.enqueue_email(f"{i}@example.com", "제목", "본문") for i in range(3)]
+        self.manager.claim_outbound_emails()
+        self.assertEqual(self.manager.mark_emails_sent([ids[0]]), 1)
+        self.assertTrue(self.manager.mark_email_failed(ids[1], "일시 오류", retry_at=datetime.now() + timedelta(minutes=1)))
+        self.assertTrue(self.manager.mark_email_failed(ids[2], "x" * 600))
+        rows = dict(self.session.execute(select(OutboundEmail.id, OutboundEmail.status)).all())
+        self.assertEqual([rows[id] for id in ids], ["sent", "pending", "failed"])
+        self.assertEqual(len(self.session.get(OutboundEmail, ids[2]).last_error), 500)
+        # 재시도 시각 전에는 점유하지 않음
+        self.assertEqual(self.manager.claim_outbound_emails(), [])
+
+
+class OutboundEmailWorkerTest(unittest.TestCase):
+
+    class FakePool:
+        size = 2
+
+        def __init__(self):
+            self.errors = {}
+            self.sent = []
+
+        def send(self, msg):
+            if msg["To"] in self.errors:
+                raise self.errors[msg["To"]]
+            self.sent.append(msg["To"])
+
+        def close(self):
+            pass
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        OutboundEmail.__table__.create(self.engine)
+        Session = sessionmaker(bind=self.engine)
+        patcher = mock.patch("db.db_manager.SessionLocal", Session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = self.FakePool()
+        self.worker = OutboundEmailWorker(pool=self.pool, sender="noreply@example.com", max_attempts=2, retry_base=30)
+        self.addCleanup(self.worker.executor.shutdown)
+        with DBManager() as manager:
+            self.ids = {
+                recipient: manager.enqueue_email(recipient, "제목", "<p>본문</p>")
+                for recipient in ("ok@example.com", "temp@example.com", "refused@example.com")
+            }
+
+    def status(self):
+        with self.engine.connect() as connection:
+            rows = connection.execute(select(OutboundEmail.recipient, OutboundEmail.status, OutboundEmail.attempts)).all()
+        return {recipient: (status, attempts) for recipient, status, attempts in rows}
+
+    def test_process_batch(self):
+        self.pool.errors = {
+            "temp@example.com": smtplib.SMTPServerDisconnected("끊김"),
+            "refused@example.com": smtplib.SMTPRecipientsRefused({"refused@example.com": (550, b"no such user")}),
+        }
+        with self.assertLogs("service.email_sender", "WARNING"):
+            self.assertEqual(self.worker.process_batch(), 3)
+        self.assertEqual(self.pool.sent, ["ok@example.com"])
+        self.assertEqual(self.status(), {
+            "ok@example.com": ("sent", 1),
+            "temp@example.com": ("pending", 1),
+            "refused@example.com": ("failed", 1),
+        })
+        # 재시도 시각 전이므로 다음 배치는 비어 있음
+        self.assertEqual(self.worker.process_batch(), 0)
+
+    def test_gives_up_after_max_attempts(self):
+        self.pool.errors = {"temp@example.com": smtplib.SMTPServerDisconnected("끊김")}
+        self.worker.retry_base = 0
+        with self.assertLogs("service.email_sender", "WARNING"):
+            self.worker.process_batch()
+            self.assertEqual(self.worker.process_batch(), 1)
+        self.assertEqual(self.status()["temp@example.com"], ("failed", 2))
+
+    def test_retry_delay(self):
+        self.assertEqual([self.worker.retry_delay(n) for n in (1, 2, 3)], [30, 60, 120])
+        self.worker.retry_max = 45
+        self.assertEqual(self.worker.retry_delay(3), 45)
+
+
+class PermanentErrorTest(unittest.TestCase):
+
+    def test_is_permanent(self):
+        self.assertTrue(_is_permanent(smtplib.SMTPRecipientsRefused({})))
+        self.assertTrue(_is_permanent(smtplib.SMTPDataError(554, b"rejected")))
+        self.assertFalse(_is_permanent(smtplib.SMTPDataError(451, b"try later")))
+        self.assertFalse(_is_permanent(smtplib.SMTPServerDisconnected("끊김")))
+        self.assertFalse(_is_permanent(OSError("연결 거부")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from db.db_manager import DBManager
+from db.db_mixin.food_mixin import food_cache
+from db.tables.food_table import FoodInfo, FoodCategory, FoodNutrition, FoodTag, FoodInfoTag
+
+"""
+음식 일괄 조회 테스트 (get_foods_by_ids / get_foods_by_names)
+    요청 순서 유지, 중복 제거, 없는 음식 목록, 청크 단위 IN 조회 확인
+"""
+
+
+class FoodBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        for table in (FoodInfo, FoodCategory, FoodNutrition, FoodTag, FoodInfoTag):
+            table.__table__.create(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.session.add_all([
+            FoodInfo(food_id=f"F{i}", food_name=name, data_type_code="D")
+            for i, name in enumerate(["김치찌개", "된장찌개", "Bibimbap", "불고기", "잡채"])
+        ])
+        self.session.commit()
+        food_cache.clear()
+        self.manager = DBManager()
+        self.manager.session = self.session
+
+    def tearDown(self):
+        self.session.close()
+        food_cache.clear()
+
+    def test_by_ids_keeps_request_order_and_reports_missing(self):
+        batch = self.manager.get_foods_by_ids(["F3", "X9", "F0", "F3"], profile="card")
+        self.assertEqual(list(batch.foods), ["F3", "F0"])
+        self.assertEqual(batch.foods["F0"].food_name, "김치찌개")
+        self.assertEqual(batch.missing, ["X9"])
+
+    def test_by_names_keys_are_requested_names(self):
+        batch = self.manager.get_foods_by_names([" 불고기 ", "잡채", "없는음식"], profile="card")
+        self.assertEqual(list(batch.foods), [" 불고기 ", "잡채"])
+        self.assertEqual(batch.foods[" 불고기 "].food_id, "F3")
+        self.assertEqual(batch.missing, ["없는음식"])
+
+    def test_chunks_in_queries(self):
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(self.engine, "before_cursor_execute", listener)
+        self.manager.batch_chunk_size = 2
+        try:
+            batch = self.manager.get_foods_by_ids([f"F{i}" for i in range(5)], profile="nutrition-only")
+        finally:
+            event.remove(self.engine, "before_cursor_execute", listener)
+        self.assertEqual(len(batch.foods), 5)
+        self.assertEqual(sum("FROM food_info" in statement for statement in statements), 3)
+
+    def test_full_profile_second_read_comes_from_cache(self):
+        self.manager.get_foods_by_ids(["F0", "F1"], profile="full")
+        self.session.query(FoodInfo).delete()
+        self.session.commit()
+        batch = self.manager.get_foods_by_ids(["F0", "F1", "F2"], profile="full")
+        self.assertEqual(list(batch.foods), ["F0", "F1"])
+        self.assertEqual(batch.missing, ["F2"])
+
+    def test_empty_request(self):
+        batch = self.manager.get_foods_by_names([])
+        self.assertEqual(batch.foods, {})
+        self.assertEqual(batch.missing, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import sys
+import unittest
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+from db.db_manager import DBManager
+from db.db_mixin.food_mixin import food_cache
+from db.tag_dictionary import tag_dictionary
+from db.tables.food_table import FoodInfo, FoodCategory, FoodSourceInfo, FoodCompany, FoodNutrition, FoodTag, FoodInfoTag
+
+"""
+음식 일괄 생성 테스트 (create_foods_bulk)
+    레코드별 상태(created / conflict / invalid / error), 하위 테이블과 태그 저장, 청크별 커밋 확인
+    SQLite에서 돌리기 위해 MySQL의 INSERT IGNORE를 INSERT OR IGNORE로 바꿔 실행한다.
+"""
+
+
+def mysql_insert_ignore(conn, cursor, statement, parameters, context, executemany):
+    return statement.replace("INSERT IGNORE", "INSERT OR IGNORE"), parameters
+
+
+class FoodBulkCreateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        event.listen(self.engine, "before_cursor_execute", mysql_insert_ignore, retval=True)
+        for table in (FoodInfo, FoodCategory, FoodSourceInfo, FoodCompany, FoodNutrition, FoodTag, FoodInfoTag):
+            table.__table__.create(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.session.add(FoodInfo(food_id="F0", food_name="김치찌개", data_type_code="D"))
+        self.session.commit()
+        food_cache.clear()
+        tag_dictionary.clear()
+        self.manager = DBManager()
+        self.manager.session = self.session
+
+    def tearDown(self):
+        self.session.close()
+        food_cache.clear()
+        tag_dictionary.clear()
+
+    def count(self, table):
+        return self.session.scalar(select(func.count()).select_from(table))
+
+    def test_statuses_follow_input_order(self):
+        results = self.manager.create_foods_bulk([
+            {"food_id": "F1", "name": "된장찌개", "data_type_code": "D"},
+            {"food_id": "F2", "food_name": "불고기", "data_type_code": "D"},
+            {"food_id": "F0", "name": "다른 이름", "data_type_code": "D"},
+            {"food_id": "F3", "name": " 김치찌개 ", "data_type_code": "D"},
+            {"food_id": "F4", "name": "된장찌개", "data_type_code": "D"},
+            {"food_id": "F5", "data_type_code": "D"},
+        ])
+        self.assertEqual(
+            [(result.food_id, result.status) for result in results],
+            [("F1", "created"), ("F2", "created"), ("F0", "conflict"), ("F3", "conflict"), ("F4", "conflict"), ("F5", "invalid")],
+        )
+        self.assertEqual(self.count(FoodInfo), 3)
+
+    def test_child_rows_and_tags(self):
+        self.manager.create_foods_bulk([
+            {"food_id": "F1", "name": "된장찌개", "data_type_code": "D", "major_category_name": "찌개류",
+             "energy_kcal": 120, "tags": ["한식", "저염"]},
+            {"food_id": "F2", "name": "스테이크", "data_type_code": "D", "company_name": "식당",
+             "tags": ["양식", "고단백"]},
+            {"food_id": "F3", "name": "비빔밥", "data_type_code": "D", "tags": ["한식"]},
+        ])
+        self.assertEqual(self.count(FoodCategory), 3)
+        self.assertEqual(self.count(FoodNutrition), 3)
+        # 회사 정보가 모두 비어 있는 음식은 food_companies 행을 만들지 않음
+        self.assertEqual(self.session.scalars(select(FoodCompany.food_id)).all(), ["F2"])
+        # 태그는 이름당 한 행만 만들고 재사용
+        self.assertEqual(self.count(FoodTag), 4)
+        self.assertEqual(self.count(FoodInfoTag), 5)
+
+    def test_commits_each_chunk(self):
+        commits = []
+        event.listen(self.session, "after_commit", lambda session: commits.append(True))
+        records = [{"food_id": f"F{i}", "name": f"음식{i}", "data_type_code": "D"} for i in range(1, 6)]
+        results = self.manager.create_foods_bulk(records, chunk_size=2)
+        self.assertTrue(all(result.status == "created" for result in results))
+        self.assertEqual(len(commits), 3)
+
+    def test_failed_chunk_is_reported_and_rolled_back(self):
+        insert_chunk = DBManager._insert_food_chunk
+
+        def fail_second_chunk(manager, chunk):
+            if chunk[0]["food_id"] == "F3":
+                raise RuntimeError("청크 저장 실패")
+            return insert_chunk(manager, chunk)
+
+        records = [{"food_id": f"F{i}", "name": f"음식{i}", "data_type_code": "D"} for i in range(1, 5)]
+        with mock.patch.object(DBManager, "_insert_food_chunk", fail_second_chunk), \
+                self.assertLogs("db.db_mixin.food_mixin", "ERROR"):
+            results = self.manager.create_foods_bulk(records, chunk_size=2)
+        self.assertEqual([result.status for result in results], ["created", "created", "error", "error"])
+        self.assertEqual(results[2].detail, "청크 저장 실패")
+        self.assertEqual(self.count(FoodInfo), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import os
+import sys
+import unittest
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from db.cache import TTLCache
+from db.db_manager import DBManager
+from db.db_mixin.food_mixin import FoodCache, food_cache, invalidate_food_on_commit
+from db.tables.food_table import FoodInfo, FoodCategory, FoodNutrition, FoodTag, FoodInfoTag
+from model.domain.food import Food
+
+"""
+음식 캐시 테스트
+    TTLCache의 LRU / 만료, FoodCache의 복사 반환, 커밋 후 무효화, "full" 프로필만 캐시 사용 확인
+"""
+
+
+class TTLCacheTest(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_expiration(self):
+        cache = TTLCache(maxsize=10, ttl=5)
+        with mock.patch("db.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+            cache.set("b", 2, ttl=50)
+        with mock.patch("db.cache.time.monotonic", return_value=106.0):
+            self.assertNotIn("a", cache)
+            self.assertIsNone(cache.get("a"))
+            self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(cache.stats()["expirations"], 1)
+
+    def test_pop_and_default(self):
+        cache = TTLCache(maxsize=10)
+        cache.set("a", 1)
+        self.assertEqual(cache.pop("a"), 1)
+        self.assertEqual(cache.pop("a", "없음"), "없음")
+        self.assertEqual(cache.get("a", 0), 0)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            TTLCache(maxsize=0)
+
+
+class FoodCacheTest(unittest.TestCase):
+
+    def test_returns_copies(self):
+        cache = FoodCache(maxsize=10, ttl=None)
+        food = Food(food_id="F1", food_name="김치찌개")
+        cache.put(food)
+        food.food_name = "바뀐 이름"
+        cached = cache.get_by_id("F1")
+        cached.food_name = "또 바뀐 이름"
+        self.assertEqual(cache.get_by_id("F1").food_name, "김치찌개")
+        self.assertIsNot(cache.get_by_id("F1"), cache.get_by_id("F1"))
+
+    def test_name_key_is_normalized(self):
+        cache = FoodCache(maxsize=10, ttl=None)
+        cache.put(Food(food_id="F1", food_name="Bibimbap"))
+        self.assertEqual(cache.get_by_name("  bibimbap ").food_id, "F1")
+
+    def test_invalidate_removes_both_keys(self):
+        cache = FoodCache(maxsize=10, ttl=None)
+        cache.put(Food(food_id="F1", food_name="김치찌개"))
+        cache.invalidate("F1")
+        self.assertIsNone(cache.get_by_id("F1"))
+        self.assertIsNone(cache.get_by_name("김치찌개"))
+
+
+class FoodCacheSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        for table in (FoodInfo, FoodCategory, FoodNutrition, FoodTag, FoodInfoTag):
+            table.__table__.create(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.session.add(FoodInfo(food_id="F1", food_name="김치찌개", data_type_code="D"))
+        self.session.commit()
+        food_cache.clear()
+        self.manager = DBManager()
+        self.manager.session = self.session
+
+    def tearDown(self):
+        self.session.close()
+        food_cache.clear()
+
+    def test_invalidated_again_after_commit(self):
+        self.manager.get_food_by_id("F1")
+        invalidate_food_on_commit(self.session, "F1", "김치찌개")
+        self.assertIsNone(food_cache.get_by_id("F1"))
+        # 커밋 전에 다른 요청이 옛 값을 다시 넣은 경우
+        food_cache.put(Food(food_id="F1", food_name="김치찌개"))
+        self.session.commit()
+        self.assertIsNone(food_cache.get_by_id("F1"))
+
+    def test_pending_session_skips_cache(self):
+        food_cache.put(Food(food_id="F1", food_name="옛 이름"))
+        self.session.get(FoodInfo, "F1").food_name = "새 이름"
+        self.assertEqual(self.manager.get_food_by_id("F1").food_name, "새 이름")
+        self.session.rollback()
+
+    def test_only_full_profile_uses_cache(self):
+        food_cache.put(Food(food_id="F1", food_name="캐시에 있는 이름"))
+        self.assertEqual(self.manager.get_food_by_id("F1", profile="card").food_name, "김치찌개")
+        self.assertEqual(self.manager.get_food_by_id("F1", profile="full").food_name, "캐시에 있는 이름")
+
+    def test_only_full_profile_fills_cache(self):
+        self.manager.get_food_by_id("F1", profile="card")
+        self.assertIsNone(food_cache.get_by_id("F1"))
+        self.manager.get_food_by_id("F1", profile="full")
+        self.assertEqual(food_cache.get_by_id("F1").food_name, "김치찌개")
+
+
+if __name__ == "__main__":
+    unittest.main()
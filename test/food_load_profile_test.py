@@ -0,0 +1,95 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from db.db_manager import DBManager
+from db.db_mixin.food_mixin import food_cache
+from db.tables.food_table import FoodInfo, FoodCategory, FoodNutrition, FoodTag, FoodInfoTag
+
+"""
+음식 조회 프로필 테스트
+    프로필별로 필요한 관계만 채워지는지, 음식 수와 관계없이 쿼리 수가 고정인지(N+1 없음) 확인
+"""
+
+
+class FoodLoadProfileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        for table in (FoodInfo, FoodCategory, FoodNutrition, FoodTag, FoodInfoTag):
+            table.__table__.create(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.session.add_all([FoodTag(tag_id=1, tag_name="고단백"), FoodTag(tag_id=2, tag_name="저염")])
+        for i in range(5):
+            food_id = f"F{i}"
+            self.session.add_all([
+                FoodInfo(food_id=food_id, food_name=f"음식{i}", data_type_code="D"),
+                FoodCategory(food_id=food_id, major_category_name="밥류"),
+                FoodNutrition(food_id=food_id, energy_kcal=100 + i, protein_g=10),
+                FoodInfoTag(food_id=food_id, tag_id=1),
+                FoodInfoTag(food_id=food_id, tag_id=2),
+            ])
+        self.session.commit()
+        self.session.expunge_all()
+        food_cache.clear()
+        self.manager = DBManager()
+        self.manager.session = self.session
+
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._count)
+
+    def tearDown(self):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+        self.session.close()
+        food_cache.clear()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def test_full_profile_loads_everything(self):
+        food = self.manager.get_food_by_id("F0", profile="full")
+        self.assertEqual(float(food.food_nutrition.energy_kcal), 100)
+        self.assertEqual(food.food_category.major_category_name, "밥류")
+        self.assertEqual(sorted(tag.tag_name for tag in food.food_tags), ["고단백", "저염"])
+
+    def test_card_profile_skips_nutrition(self):
+        food = self.manager.get_food_by_id("F0", profile="card")
+        self.assertIsNone(food.food_nutrition)
+        self.assertEqual(food.food_category.major_category_name, "밥류")
+        self.assertEqual(len(food.food_tags), 2)
+
+    def test_nutrition_only_profile_skips_category_and_tags(self):
+        food = self.manager.get_food_by_id("F0", profile="nutrition-only")
+        self.assertIsNotNone(food.food_nutrition)
+        self.assertIsNone(food.food_category)
+        self.assertFalse(food.food_tags)
+
+    def test_query_count_does_not_grow_with_foods(self):
+        self.manager.get_foods_by_ids(["F0"], profile="full")
+        one = len(self.statements)
+        self.session.expunge_all()
+        food_cache.clear()
+        self.statements.clear()
+        self.manager.get_foods_by_ids([f"F{i}" for i in range(5)], profile="full")
+        self.assertEqual(len(self.statements), one)
+        # joinedload 한 번 + 태그 selectinload 한 번
+        self.assertLessEqual(one, 2)
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            self.manager.get_food_by_id("F0", profile="detail")
+
+
+if __name__ == "__main__":
+    unittest.main()
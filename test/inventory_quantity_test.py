@@ -0,0 +1,189 @@
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+from data import backfill_inventory_quantity
+from data.backfill_inventory_quantity import _same_amount
+from db.db_manager import DBManager
+from db.tables.user_table import UserInfo, UserAuth, UserBody, SocialLogin, Password, Subscription, UserFoodInventory
+from model.domain.quantity import parse_grams, parse_quantity, parse_quantity_columns, sum_quantities, to_grams
+
+"""
+식품 인벤토리 수량 테스트
+    자유 형식 양 해석(단위 별칭, 소수점 쉼표, 단위 없음, 해석 불가), g 환산과 합계,
+    인벤토리 저장 시 수치 / 단위 / g 컬럼 채우기, 유통기한 임박 / 지난 식품과 식품별 g 합계 조회, 기존 행 채우기 확인
+"""
+
+NOW = datetime(2026, 3, 2, 12)
+
+
+class ParseQuantityTest(unittest.TestCase):
+
+    def test_units(self):
+        self.assertEqual(parse_quantity("300g"), (300.0, "g"))
+        self.assertEqual(parse_quantity(" 1.5 L"), (1.5, "l"))
+        self.assertEqual(parse_quantity("2인분"), (2.0, "serving"))
+        self.assertEqual(parse_quantity("500 그램"), (500.0, "g"))
+        self.assertEqual(parse_quantity("200cc"), (200.0, "ml"))
+        self.assertEqual(parse_quantity("3개"), (3.0, "개"))
+
+    def test_numbers(self):
+        self.assertEqual(parse_quantity("0,5kg"), (0.5, "kg"))
+        self.assertEqual(parse_quantity(".5kg"), (0.5, "kg"))
+        self.assertEqual(parse_quantity("300"), (300.0, None))
+        self.assertEqual(parse_quantity(2), (2.0, None))
+        self.assertEqual(parse_quantity(0.25), (0.25, None))
+
+    def test_unparsable(self):
+        for text in (None, "", "적당량", "약 300g"):
+            self.assertEqual(parse_quantity(text), (None, None))
+
+    def test_to_grams(self):
+        self.assertEqual(to_grams(1.5, "kg"), 1500.0)
+        self.assertEqual(to_grams(250, "mg"), 0.25)
+        self.assertEqual(to_grams(200, "ml"), 200.0)
+        self.assertEqual(to_grams(300, None), 300)
+        self.assertIsNone(to_grams(2, "serving"))
+        self.assertIsNone(to_grams(None, "g"))
+        self.assertEqual(parse_grams("1.5 L"), 1500.0)
+        self.assertIsNone(parse_grams("2인분"))
+
+    def test_sum_quantities(self):
+        self.assertEqual(sum_quantities([(300, "g"), (0.2, "kg")]), (500.0, "g"))
+        self.assertEqual(sum_quantities([(1, "serving"), (2, "serving")]), (3, "serving"))
+        self.assertEqual(sum_quantities([(300, "g"), (200, "ml")]), (500.0, "g"))
+        self.assertIsNone(sum_quantities([(300, "g"), (2, "serving")]))
+        self.assertIsNone(sum_quantities([(300, "g"), (None, None)]))
+        self.assertIsNone(sum_quantities([]))
+
+    def test_columns(self):
+        self.assertEqual(parse_quantity_columns("1.5kg"), {"amount": 1.5, "unit": "kg", "amount_g": 1500.0})
+        self.assertEqual(parse_quantity_columns("2인분"), {"amount": 2.0, "unit": "serving", "amount_g": None})
+        self.assertEqual(parse_quantity_columns("적당량"), {"amount": None, "unit": None, "amount_g": None})
+        # 단위 컬럼 길이(20)에 맞춰 자름
+        self.assertEqual(len(parse_quantity_columns("1" + "가" * 30)["unit"]), 20)
+
+
+class SameAmountTest(unittest.TestCase):
+    """FLOAT 컬럼에서 읽은 단정밀도 값은 해석한 값과 같은 것으로 봄"""
+
+    def test_same_amount(self):
+        self.assertTrue(_same_amount(None, None))
+        self.assertTrue(_same_amount(0.1000000014901161, 0.1))
+        self.assertTrue(_same_amount(0.0, 0.0))
+        self.assertFalse(_same_amount(None, 0.0))
+        self.assertFalse(_same_amount(0.1, None))
+        self.assertFalse(_same_amount(0.1, 0.2))
+
+
+class InventoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        for table in (UserInfo, UserAuth, UserBody, SocialLogin, Password, Subscription, UserFoodInventory):
+            table.__table__.create(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.manager = DBManager()
+        self.manager.session = self.session
+        self.uuid = self.manager.create_user(nickname="테스터", email="tester@example.com", password="pw")
+        for food_id, quantity, expired in (
+            ("F1", "300g", NOW + timedelta(days=1)),
+            ("F2", "1.5kg", NOW + timedelta(days=5)),
+            ("F3", "2인분", NOW + timedelta(hours=12)),
+            ("F4", "200ml", NOW - timedelta(days=1)),
+            ("F5", "500g", None),
+        ):
+            self.manager.update_user_inventory(self.uuid, food_id, quantity, expired=expired)
+
+    def tearDown(self):
+        self.session.close()
+
+    def row(self, food_id):
+        return self.session.scalar(select(UserFoodInventory).where(UserFoodInventory.food_id == food_id))
+
+    def test_columns_are_filled(self):
+        row = self.row("F2")
+        self.assertEqual((row.quantity, row.amount, row.unit, row.amount_g), ("1.5kg", 1.5, "kg", 1500.0))
+        self.manager.update_user_inventory(self.uuid, "F2", "3인분", expired=None)
+        self.session.expire_all()
+        row = self.row("F2")
+        self.assertEqual((row.quantity, row.amount, row.unit, row.amount_g), ("3인분", 3.0, "serving", None))
+
+    def test_empty_quantity_deletes(self):
+        self.manager.update_user_inventory(self.uuid, "F1", "0g")
+        self.manager.update_user_inventory(self.uuid, "F2", " ")
+        self.assertIsNone(self.row("F1"))
+        self.assertIsNone(self.row("F2"))
+        self.assertTrue(self.manager.update_user_inventory(self.uuid, "F9", "0"))
+        self.assertIsNone(self.row("F9"))
+
+    def test_unknown_user(self):
+        self.assertFalse(self.manager.update_user_inventory("없는 uuid", "F1", "300g"))
+
+    def test_expiring(self):
+        items = self.manager.get_expiring_inventory(self.uuid, days=2, now=NOW)
+        self.assertEqual([item.food_id for item in items], ["F3", "F1"])
+        self.assertEqual((items[1].amount, items[1].unit, items[1].amount_g), (300.0, "g", 300.0))
+        self.assertEqual(self.manager.get_expiring_inventory("없는 uuid", days=2, now=NOW), [])
+
+    def test_expired(self):
+        self.assertEqual([item.food_id for item in self.manager.get_expired_inventory(self.uuid, now=NOW)], ["F4"])
+
+    def test_grams(self):
+        self.assertEqual(self.manager.get_inventory_grams(self.uuid, now=NOW), {"F1": 300.0, "F2": 1500.0, "F5": 500.0})
+        self.assertEqual(self.manager.get_inventory_grams(self.uuid, include_expired=True, now=NOW),
+                         {"F1": 300.0, "F2": 1500.0, "F4": 200.0, "F5": 500.0})
+
+    def test_without_session(self):
+        self.manager.session = None
+        for query in (lambda: self.manager.get_expiring_inventory(self.uuid, days=1),
+                      lambda: self.manager.get_expired_inventory(self.uuid),
+                      lambda: self.manager.get_inventory_grams(self.uuid)):
+            with self.assertRaises(RuntimeError):
+                query()
+
+
+class BackfillInventoryQuantityTest(unittest.TestCase):
+    """quantity 원문만 있는 기존 행을 채우고, 이미 맞는 행은 다시 갱신하지 않음"""
+
+    def test_backfill(self):
+        engine = create_engine("sqlite://")
+        UserFoodInventory.__table__.create(engine)
+        with engine.begin() as connection:
+            connection.execute(insert(UserFoodInventory), [
+                {"uuid": "U1", "food_id": f"F{i}", "quantity": quantity}
+                for i, quantity in enumerate(("300g", "0.1kg", "2인분", "적당량", "1.5 L"))
+            ])
+        with mock.patch.object(backfill_inventory_quantity, "engine", engine), mock.patch("builtins.print"):
+            self.assertEqual(backfill_inventory_quantity.backfill_inventory_quantity(batch_size=2), 4)
+            # 이미 채운 행은 다시 실행해도 갱신하지 않음
+            self.assertEqual(backfill_inventory_quantity.backfill_inventory_quantity(batch_size=2), 0)
+        with engine.connect() as connection:
+            rows = connection.execute(
+                select(UserFoodInventory.food_id, UserFoodInventory.amount, UserFoodInventory.unit, UserFoodInventory.amount_g)
+                .order_by(UserFoodInventory.food_id)
+            ).all()
+        self.assertEqual([tuple(row) for row in rows], [
+            ("F0", 300.0, "g", 300.0),
+            ("F1", 0.1, "kg", 100.0),
+            ("F2", 2.0, "serving", None),
+            ("F3", None, None, None),
+            ("F4", 1.5, "l", 1500.0),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
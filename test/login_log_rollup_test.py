@@ -0,0 +1,156 @@
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import sessionmaker
+from db import login_log_partitions
+from db.db_manager import DBManager
+from db.login_log_partitions import (
+    add_months, drop_expired_partitions, ensure_future_partitions, month_start, partition_name, purge_expired_rollups,
+)
+from db.tables.user_table import LoginLogHourly
+
+"""
+로그인 기록 파티션 / 시간별 집계 테스트
+    월 계산과 파티션 이름, 만료 파티션 삭제 / 미래 파티션 추가 DDL, 만료 집계 삭제,
+    로그인 기록을 (시간, uuid, ip, 상태 코드)별로 묶어 누적하는 문장, 집계 조회(사용자 / IP / 상위 IP), 세션 없을 때 확인
+    파티션 DDL은 MySQL 전용이므로 파티션 목록을 바꿔 넣고 실행한 SQL만 확인한다.
+"""
+
+NOW = month_start(datetime.now())
+
+
+class PartitionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.connection = mock.Mock()
+
+    def executed(self):
+        return [str(call.args[0]) for call in self.connection.execute.call_args_list]
+
+    def test_months(self):
+        self.assertEqual(add_months(datetime(2025, 11, 1), 3), datetime(2026, 2, 1))
+        self.assertEqual(add_months(datetime(2026, 1, 1), -1), datetime(2025, 12, 1))
+        self.assertEqual(month_start(datetime(2026, 3, 15, 12, 30)), datetime(2026, 3, 1))
+        self.assertEqual(partition_name(datetime(2026, 3, 1)), "p202603")
+
+    def test_drop_expired(self):
+        partitions = [partition_name(add_months(NOW, offset)) for offset in (-13, -12, -11, 0)] + ["p_future"]
+        with mock.patch.object(login_log_partitions, "get_partitions", return_value=partitions):
+            dropped = drop_expired_partitions(self.connection, retention_months=12)
+        self.assertEqual(dropped, partitions[:2])
+        self.assertEqual(self.executed(), [f"ALTER TABLE login_log DROP PARTITION {partitions[0]}, {partitions[1]}"])
+
+    def test_nothing_to_drop(self):
+        with mock.patch.object(login_log_partitions, "get_partitions", return_value=[partition_name(NOW), "p_future"]):
+            self.assertEqual(drop_expired_partitions(self.connection), [])
+        self.connection.execute.assert_not_called()
+
+    def test_ensure_future(self):
+        with mock.patch.object(login_log_partitions, "get_partitions", return_value=[partition_name(NOW), "p_future"]):
+            added = ensure_future_partitions(self.connection, months_ahead=2)
+        self.assertEqual(added, [partition_name(add_months(NOW, 1)), partition_name(add_months(NOW, 2))])
+        statement = self.executed()[0]
+        self.assertTrue(statement.startswith("ALTER TABLE login_log REORGANIZE PARTITION p_future INTO"))
+        self.assertIn("PARTITION p_future VALUES LESS THAN (MAXVALUE)", statement)
+
+    def test_ensure_future_without_partitions(self):
+        with mock.patch.object(login_log_partitions, "get_partitions", return_value=[]):
+            self.assertEqual(ensure_future_partitions(self.connection), [])
+        self.connection.execute.assert_not_called()
+
+
+class LoginRollupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        LoginLogHourly.__table__.create(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.hour = datetime.now().replace(minute=0, second=0, microsecond=0)
+        self.session.add_all([
+            LoginLogHourly(hour=self.hour, uuid="U1", ip="1.1.1.1", status_code=200, count=3),
+            LoginLogHourly(hour=self.hour, uuid="U1", ip="1.1.1.1", status_code=401, count=2),
+            LoginLogHourly(hour=self.hour, uuid="U2", ip="2.2.2.2", status_code=401, count=5),
+            LoginLogHourly(hour=self.hour - timedelta(hours=3), uuid="U1", ip="2.2.2.2", status_code=401, count=7),
+        ])
+        self.session.commit()
+        self.manager = DBManager()
+        self.manager.session = self.session
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_count_logins(self):
+        since = datetime.now() - timedelta(minutes=1)
+        self.assertEqual(self.manager.count_logins("U1", since), 5)
+        self.assertEqual(self.manager.count_logins("U1", since, status_code=401), 2)
+        self.assertEqual(self.manager.count_logins("U1", since - timedelta(hours=3)), 12)
+        self.assertEqual(self.manager.count_logins("없음", since), 0)
+
+    def test_failed_logins_by_ip(self):
+        since = datetime.now() - timedelta(minutes=1)
+        self.assertEqual(self.manager.count_failed_logins_by_ip("1.1.1.1", since), 2)
+        self.assertEqual(self.manager.count_failed_logins_by_ip("2.2.2.2", since - timedelta(hours=3)), 12)
+
+    def test_top_failed_ips(self):
+        since = self.hour - timedelta(hours=3)
+        self.assertEqual(self.manager.get_top_failed_login_ips(since), [("2.2.2.2", 12), ("1.1.1.1", 2)])
+        self.assertEqual(self.manager.get_top_failed_login_ips(since, limit=1), [("2.2.2.2", 12)])
+
+    def test_since_is_floored_to_hour(self):
+        self.assertEqual(DBManager._floor_hour(datetime(2026, 3, 1, 10, 59, 30, 1)), datetime(2026, 3, 1, 10))
+
+    def test_without_session(self):
+        self.manager.session = None
+        with self.assertLogs("db.db_mixin.user_mixin", "WARNING"):
+            self.assertEqual(self.manager.count_logins("U1", self.hour), 0)
+            self.assertEqual(self.manager.count_failed_logins_by_ip("1.1.1.1", self.hour), 0)
+            self.assertEqual(self.manager.get_top_failed_login_ips(self.hour), [])
+
+    def test_purge_expired_rollups(self):
+        self.session.add(LoginLogHourly(hour=add_months(NOW, -30), uuid="U1", ip="1.1.1.1", status_code=200, count=1))
+        self.session.commit()
+        with self.engine.begin() as connection:
+            self.assertEqual(purge_expired_rollups(connection, retention_months=24), 1)
+        self.assertEqual(self.session.scalar(select(func.count()).select_from(LoginLogHourly)), 4)
+
+
+class AddLoginRollupsTest(unittest.TestCase):
+    """로그인 기록을 (시간, uuid, ip, 상태 코드)별로 묶어 INSERT ... ON DUPLICATE KEY UPDATE 한 번으로 누적"""
+
+    def test_events_are_grouped(self):
+        manager = DBManager()
+        manager.session = mock.Mock()
+        events = [
+            {"uuid": "U1", "ip": "1.1.1.1", "status_code": 401, "datetime": datetime(2026, 3, 1, 10, 5)},
+            {"uuid": "U1", "ip": "1.1.1.1", "status_code": 401, "datetime": datetime(2026, 3, 1, 10, 55)},
+            {"uuid": None, "ip": "1.1.1.1", "status_code": 401, "datetime": datetime(2026, 3, 1, 11, 0)},
+        ]
+        manager._add_login_rollups(events)
+        statement = manager.session.execute.call_args.args[0].compile(dialect=mysql.dialect())
+        self.assertIn("ON DUPLICATE KEY UPDATE count = (login_log_hourly.count + VALUES(count))", str(statement))
+        rows = sorted(
+            (params["hour"], params["uuid"], params["count"])
+            for params in (
+                {name[:-3]: value for name, value in statement.params.items() if name.endswith(f"_m{i}")}
+                for i in range(2)
+            )
+        )
+        self.assertEqual(rows, [(datetime(2026, 3, 1, 10), "U1", 2), (datetime(2026, 3, 1, 11), "", 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
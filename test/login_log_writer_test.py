@@ -0,0 +1,129 @@
+import os
+import sys
+import asyncio
+import unittest
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy.exc import IntegrityError
+from db.db_manager import DBManager
+from service.login_log_writer import LoginEventWriter
+
+"""
+로그인 기록 write-behind 버퍼 테스트 (service/login_log_writer.py)
+    버퍼 상한, batch_size 단위 저장, 저장 실패 시 버퍼 복구, 무결성 오류 행만 버림, 백그라운드 저장과 종료 시 저장 확인
+    DB 저장(_write / record_logins)은 기록만 하는 함수로 바꿔 실행한다.
+"""
+
+
+class LoginEventWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.batches = []
+        self.failing = False
+        patcher = mock.patch.object(LoginEventWriter, "_write", staticmethod(self.write))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write(self, events):
+        if self.failing:
+            raise ConnectionError("DB 연결 실패")
+        self.batches.append([event["uuid"] for event in events])
+        return len(events)
+
+    def record(self, writer, count, start=0):
+        return [writer.record(f"U{i}", 200, "127.0.0.1") for i in range(start, start + count)]
+
+    def test_record_is_bounded(self):
+        writer = LoginEventWriter(batch_size=10, max_buffer=3)
+        self.assertEqual(self.record(writer, 4), [True, True, True, False])
+        self.assertEqual(len(writer), 3)
+        self.assertEqual(set(writer._buffer[0]), {"uuid", "status_code", "ip", "datetime"})
+
+    def test_flush_in_batches(self):
+        writer = LoginEventWriter(batch_size=2, max_buffer=100)
+        self.record(writer, 5)
+        self.assertEqual(asyncio.run(writer.flush()), 5)
+        self.assertEqual(self.batches, [["U0", "U1"], ["U2", "U3"], ["U4"]])
+        self.assertEqual(len(writer), 0)
+
+    def test_failed_batch_is_restored(self):
+        writer = LoginEventWriter(batch_size=2, max_buffer=100)
+        self.record(writer, 3)
+        self.failing = True
+        with self.assertLogs("service.login_log_writer", "WARNING"):
+            self.assertEqual(asyncio.run(writer.flush()), 0)
+        self.assertEqual([event["uuid"] for event in writer._buffer], ["U0", "U1", "U2"])
+        self.failing = False
+        self.assertEqual(asyncio.run(writer.flush()), 3)
+
+    def test_restore_keeps_buffer_limit(self):
+        writer = LoginEventWriter(batch_size=2, max_buffer=3)
+        self.record(writer, 3)
+        self.failing = True
+
+        async def scenario():
+            # 첫 배치를 저장하는 동안 새 기록이 들어와 되돌릴 자리가 하나뿐 (U1은 버림)
+            write = self.write
+
+            def fill_then_fail(events):
+                self.record(writer, 1, start=10)
+                return write(events)
+
+            with mock.patch.object(LoginEventWriter, "_write", staticmethod(fill_then_fail)):
+                return await writer.flush()
+
+        with self.assertLogs("service.login_log_writer", "WARNING"):
+            asyncio.run(scenario())
+        self.assertEqual(len(writer), 3)
+        self.assertEqual([event["uuid"] for event in writer._buffer], ["U0", "U2", "U10"])
+
+    def test_background_flush_and_stop(self):
+        writer = LoginEventWriter(batch_size=3, flush_interval=60, max_buffer=100)
+
+        async def scenario():
+            await writer.start()
+            self.record(writer, 3)
+            # batch_size가 차면 flush_interval을 기다리지 않고 저장
+            for _ in range(100):
+                if self.batches:
+                    break
+                await asyncio.sleep(0.01)
+            self.record(writer, 1, start=3)
+            await writer.stop()
+
+        asyncio.run(scenario())
+        self.assertEqual(self.batches, [["U0", "U1", "U2"], ["U3"]])
+
+
+class WriteTest(unittest.TestCase):
+    """무결성 오류가 나면 행 단위로 나눠 저장하고 실패한 행만 버림"""
+
+    def test_integrity_error_splits_batch(self):
+        written = []
+
+        def record_logins(manager, events):
+            if any(event["uuid"] == "deleted" for event in events):
+                raise IntegrityError("INSERT", {}, Exception("foreign key"))
+            written.extend(event["uuid"] for event in events)
+            return len(events)
+
+        events = [{"uuid": uuid, "status_code": 200, "ip": "127.0.0.1"} for uuid in ("U1", "deleted", "U2")]
+        with mock.patch.object(DBManager, "__enter__", lambda manager: manager), \
+                mock.patch.object(DBManager, "__exit__", lambda manager, *args: None), \
+                mock.patch.object(DBManager, "record_logins", record_logins), \
+                self.assertLogs("service.login_log_writer", "WARNING"):
+            self.assertEqual(LoginEventWriter._write(events), 2)
+        self.assertEqual(written, ["U1", "U2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
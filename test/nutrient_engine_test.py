@@ -0,0 +1,117 @@
+import os
+import sys
+import unittest
+from datetime import date, time
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+import numpy as np
+from Agent.tools.nutrient_engine import NutrientAggregator, _parse_amount
+from db.nutrition_matrix import NutritionMatrix, NUTRIENT_COLUMNS
+from model.domain.meal_plan import DailyPlan, FoodItem, Meal, NutrientData, WeeklyMealPlan
+
+"""
+식단 영양소 합계 테스트 (NutrientAggregator)
+    g 단위 / 인분 단위 환산, 식사 -> 일 -> 주 누적, 없는 음식, 빈 행렬 확인
+"""
+
+ZERO = NutrientData(**{field: 0 for field in NutrientData.model_fields})
+
+
+def make_matrix(rows):
+    """rows: [(이름, 열량, 기준량 g, 1회 섭취량 g)]"""
+    values = np.full((len(rows), len(NUTRIENT_COLUMNS)), np.nan, dtype=np.float32)
+    values[:, NUTRIENT_COLUMNS.index("energy_kcal")] = [row[1] for row in rows]
+    return NutritionMatrix(
+        food_ids=[f"F{i}" for i in range(len(rows))],
+        food_names=[row[0] for row in rows],
+        values=values,
+        missing=np.isnan(values),
+        reference_g=np.array([row[2] for row in rows], dtype=np.float32),
+        serving_g=np.array([row[3] for row in rows], dtype=np.float32),
+    )
+
+
+def make_plan(days):
+    """days: [[[(음식 이름, 양), ...] 식사, ...] 하루, ...]"""
+    return WeeklyMealPlan(days=[
+        DailyPlan(
+            day=date(2026, 1, 1 + day_index),
+            nutrients=ZERO,
+            meals=[
+                Meal(time_slot=time(8 + 4 * meal_index), food_list=[FoodItem(food_name=name, food_amount=amount) for name, amount in meal])
+                for meal_index, meal in enumerate(meals)
+            ],
+        )
+        for day_index, meals in enumerate(days)
+    ])
+
+
+class ParseAmountTest(unittest.TestCase):
+
+    def test_weight_and_volume_become_grams(self):
+        self.assertEqual(_parse_amount("200g"), (200.0, False))
+        self.assertEqual(_parse_amount("0.5kg"), (500.0, False))
+        self.assertEqual(_parse_amount("250ml"), (250.0, False))
+
+    def test_other_units_are_servings(self):
+        self.assertEqual(_parse_amount("2인분"), (2.0, True))
+        self.assertEqual(_parse_amount("1공기"), (1.0, True))
+
+    def test_unparsable_is_one_serving(self):
+        self.assertEqual(_parse_amount("적당히"), (1.0, True))
+
+
+class NutrientAggregatorTest(unittest.TestCase):
+
+    def setUp(self):
+        # 밥: 100g당 150kcal, 1회 210g / 국: 기준량 모름(100g), 1회 섭취량 모름(기준량)
+        self.matrix = make_matrix([("밥", 150, 100, 210), ("국", 40, np.nan, np.nan)])
+        self.energy = NUTRIENT_COLUMNS.index("energy_kcal")
+
+    def test_meal_day_week_totals(self):
+        plan = make_plan([
+            [[("밥", "200g"), ("국", "1인분")], [("밥", "1인분")]],
+            [[("국", "2인분")]],
+        ])
+        totals = NutrientAggregator(self.matrix).aggregate(plan)
+        np.testing.assert_allclose(totals.meal_totals[:, self.energy], [300 + 40, 315, 80])
+        np.testing.assert_allclose(totals.day_totals[:, self.energy], [655, 80])
+        self.assertAlmostEqual(totals.week().energy_kcal, 735, places=3)
+        self.assertAlmostEqual(totals.day(1).energy_kcal, 80, places=3)
+        self.assertEqual(totals.missing_foods, [])
+
+    def test_missing_foods_add_nothing(self):
+        plan = make_plan([[[("밥", "100g"), ("없는 음식", "100g"), ("없는 음식", "1인분")]]])
+        totals = NutrientAggregator(self.matrix).aggregate(plan)
+        self.assertAlmostEqual(totals.week().energy_kcal, 150, places=3)
+        self.assertEqual(totals.missing_foods, ["없는 음식"])
+
+    def test_empty_matrix(self):
+        plan = make_plan([[[("밥", "100g"), ("국", "1인분")]]])
+        totals = NutrientAggregator(make_matrix([])).aggregate(plan)
+        self.assertEqual(totals.week().energy_kcal, 0)
+        self.assertEqual(totals.missing_foods, ["밥", "국"])
+
+    def test_empty_plan(self):
+        totals = NutrientAggregator(self.matrix).aggregate(WeeklyMealPlan(days=[]))
+        self.assertEqual(totals.week_total.shape, (len(NUTRIENT_COLUMNS),))
+        self.assertEqual(totals.to_dict()["days"], [])
+
+    def test_to_dict_shape(self):
+        plan = make_plan([[[("밥", "100g")], [("국", "1인분")]]])
+        result = NutrientAggregator(self.matrix).aggregate(plan).to_dict()
+        self.assertEqual([meal["time_slot"] for meal in result["days"][0]["meals"]], ["08:00", "12:00"])
+        self.assertAlmostEqual(result["days"][0]["meals"][1]["nutrients"]["energy_kcal"], 40, places=3)
+        self.assertAlmostEqual(result["week"]["energy_kcal"], 190, places=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from db.nutrition_matrix import NutritionMatrix, NUTRIENT_COLUMNS
+from db.tables.food_table import FoodInfo, FoodNutrition
+
+"""
+영양 행렬 테스트
+    DB 스냅샷 생성, 저장/로드(직전 버전 보존, 파일 교체 시 재시도), 합계/필터/순위 계산 확인
+"""
+
+
+def make_matrix(energy, protein, reference_g=None):
+    """energy_kcal, protein_g 두 열만 채운 테스트용 행렬 (나머지는 결측)"""
+    size = len(energy)
+    values = np.full((size, len(NUTRIENT_COLUMNS)), np.nan, dtype=np.float32)
+    values[:, NUTRIENT_COLUMNS.index("energy_kcal")] = energy
+    values[:, NUTRIENT_COLUMNS.index("protein_g")] = protein
+    return NutritionMatrix(
+        food_ids=[f"F{i}" for i in range(size)],
+        food_names=[f"음식{i}" for i in range(size)],
+        values=values,
+        missing=np.isnan(values),
+        reference_g=np.array(reference_g if reference_g is not None else [100.0] * size, dtype=np.float32),
+        serving_g=np.full(size, np.nan, dtype=np.float32),
+    )
+
+
+class NutritionMatrixTest(unittest.TestCase):
+
+    def test_total_scales_by_reference_amount(self):
+        matrix = make_matrix([100, 200, np.nan], [10, 20, 5], reference_g=[100, np.nan, 50])
+        total = matrix.total(["F0", "F1", "F2", "없음"], amounts_g=[50, 100, 100, 1000])
+        self.assertAlmostEqual(total[matrix.column_index["energy_kcal"]], 50 + 200)
+        # F1은 기준량을 몰라 100g 기준, F2는 50g 기준이라 2배
+        self.assertAlmostEqual(total[matrix.column_index["protein_g"]], 5 + 20 + 10)
+
+    def test_filter_and_rank_skip_missing(self):
+        matrix = make_matrix([100, np.nan, 300, 200], [1, 2, 3, 4])
+        self.assertEqual(matrix.filter("energy_kcal", min_value=150), ["F2", "F3"])
+        self.assertEqual([food_id for food_id, _ in matrix.rank("energy_kcal", k=10)], ["F2", "F3", "F0"])
+        self.assertEqual(matrix.rank("energy_kcal", k=1, ascending=True), [("F0", 100.0)])
+        self.assertEqual(make_matrix([np.nan], [np.nan]).rank("energy_kcal"), [])
+
+    def test_rows_by_names_normalizes(self):
+        matrix = make_matrix([1, 2], [1, 2])
+        self.assertEqual(matrix.rows_by_names([" 음식1 ", "없음"]).tolist(), [1, -1])
+
+    def test_from_database(self):
+        engine = create_engine("sqlite://")
+        for table in (FoodInfo, FoodNutrition):
+            table.__table__.create(engine)
+        with Session(engine) as session:
+            session.add_all([
+                FoodInfo(food_id="F2", food_name="된장찌개", data_type_code="D"),
+                FoodInfo(food_id="F1", food_name="김치찌개", data_type_code="D"),
+                FoodNutrition(food_id="F1", nutrient_reference_amount_g="100g", energy_kcal=120),
+                FoodNutrition(food_id="F2", nutrient_reference_amount_g="알 수 없음", protein_g=8),
+            ])
+            session.commit()
+        matrix = NutritionMatrix.from_database(engine)
+        self.assertEqual(matrix.food_ids, ["F1", "F2"])
+        self.assertEqual(matrix.values[0, matrix.column_index["energy_kcal"]], 120)
+        self.assertTrue(matrix.missing[1, matrix.column_index["energy_kcal"]])
+        self.assertEqual(matrix.reference_g[0], 100)
+        self.assertTrue(np.isnan(matrix.reference_g[1]))
+
+
+class NutritionMatrixStorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def versions_on_disk(self):
+        return {path.name.split("-", 1)[1].rsplit(".", 1)[0] for path in self.path.glob("values-*.npy")}
+
+    def test_save_and_load_roundtrip(self):
+        matrix = make_matrix([100, 200], [10, 20])
+        version = matrix.save(self.path)
+        loaded = NutritionMatrix.load(self.path)
+        self.assertEqual(loaded.version, version)
+        self.assertEqual(loaded.food_names, matrix.food_names)
+        np.testing.assert_array_equal(loaded.values, matrix.values)
+        self.assertFalse(loaded.values.flags.writeable)
+
+    def test_save_keeps_previous_version_only(self):
+        first = make_matrix([1], [1]).save(self.path)
+        second = make_matrix([2], [2]).save(self.path)
+        self.assertEqual(self.versions_on_disk(), {first, second})
+        third = make_matrix([3], [3]).save(self.path)
+        self.assertEqual(self.versions_on_disk(), {second, third})
+
+    def test_load_retries_when_files_are_replaced(self):
+        make_matrix([1], [1]).save(self.path)
+        latest = make_matrix([2], [2]).save(self.path)
+        load_version = NutritionMatrix._load_version.__func__
+        calls = []
+
+        def flaky(cls, directory, mmap):
+            calls.append(directory)
+            if len(calls) == 1:
+                raise FileNotFoundError("교체된 파일")
+            return load_version(cls, directory, mmap)
+
+        with mock.patch.object(NutritionMatrix, "_load_version", classmethod(flaky)), \
+                self.assertLogs("db.nutrition_matrix", "WARNING"):
+            self.assertEqual(NutritionMatrix.load(self.path).version, latest)
+        self.assertEqual(len(calls), 2)
+
+    def test_load_rejects_other_columns(self):
+        make_matrix([1], [1]).save(self.path)
+        with mock.patch("db.nutrition_matrix.NUTRIENT_COLUMNS", ["energy_kcal"]):
+            with self.assertRaises(ValueError):
+                NutritionMatrix.load(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
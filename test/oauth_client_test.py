@@ -0,0 +1,118 @@
+import os
+import sys
+import asyncio
+import unittest
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+import httpx
+from service.oauth_client import GoogleOAuthClient, OAuthError
+
+"""
+Google OAuth 클라이언트 테스트 (service/oauth_client.py)
+    토큰 교환 / 사용자 정보 조회, GET만 5xx / 429 / 시간 초과 재시도, 오류 상태와 JSON이 아닌 응답은 OAuthError 확인
+    httpx.MockTransport로 응답을 흉내 내고 재시도 대기(asyncio.sleep)는 건너뛴다.
+"""
+
+TOKEN_URL = "https://oauth.test/token"
+USER_INFO_URL = "https://oauth.test/userinfo"
+
+
+class GoogleOAuthClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.requests = []
+        self.responses = []
+        self.oauth = GoogleOAuthClient(token_url=TOKEN_URL, user_info_url=USER_INFO_URL, retries=2)
+        self.oauth._client = httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+        patcher = mock.patch("service.oauth_client.asyncio.sleep", mock.AsyncMock())
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        asyncio.run(self.oauth.aclose())
+
+    def handle(self, request):
+        self.requests.append(request)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def exchange(self):
+        return asyncio.run(self.oauth.exchange_code("code", "client-id", "secret", "https://app.test/callback"))
+
+    def user_info(self):
+        return asyncio.run(self.oauth.get_user_info("access-token"))
+
+    def test_exchange_code(self):
+        self.responses = [httpx.Response(200, json={"access_token": "token"})]
+        self.assertEqual(self.exchange(), {"access_token": "token"})
+        form = dict(pair.split("=") for pair in self.requests[0].content.decode().split("&"))
+        self.assertEqual(form["grant_type"], "authorization_code")
+        self.assertEqual(form["code"], "code")
+
+    def test_exchange_code_is_not_retried(self):
+        # 인가 코드는 한 번만 쓸 수 있으므로 5xx에도 다시 보내지 않음
+        self.responses = [httpx.Response(503)]
+        with self.assertRaises(OAuthError) as caught:
+            self.exchange()
+        self.assertEqual(caught.exception.status_code, 503)
+        self.assertEqual(len(self.requests), 1)
+
+    def test_exchange_code_transport_error(self):
+        self.responses = [httpx.ReadTimeout("시간 초과")]
+        with self.assertRaises(OAuthError):
+            self.exchange()
+
+    def test_user_info(self):
+        self.responses = [httpx.Response(200, json={"email": "tester@example.com"})]
+        self.assertEqual(self.user_info(), {"email": "tester@example.com"})
+        self.assertEqual(self.requests[0].headers["Authorization"], "Bearer access-token")
+
+    def test_user_info_retries_server_errors(self):
+        self.responses = [httpx.Response(503), httpx.Response(429), httpx.Response(200, json={"email": "a@b.c"})]
+        self.assertEqual(self.user_info(), {"email": "a@b.c"})
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual([call.args[0] for call in self.sleep.await_args_list], [0.2, 0.4])
+
+    def test_user_info_gives_up_after_retries(self):
+        self.responses = [httpx.Response(502)] * 3
+        with self.assertRaises(OAuthError) as caught:
+            self.user_info()
+        self.assertEqual(caught.exception.status_code, 502)
+        self.assertEqual(len(self.requests), 3)
+
+    def test_user_info_retries_timeouts(self):
+        self.responses = [httpx.ReadTimeout("시간 초과"), httpx.Response(200, json={"email": "a@b.c"})]
+        self.assertEqual(self.user_info(), {"email": "a@b.c"})
+        self.responses = [httpx.ReadTimeout("시간 초과")] * 3
+        with self.assertRaises(OAuthError):
+            self.user_info()
+
+    def test_client_error_is_not_retried(self):
+        self.responses = [httpx.Response(401)]
+        with self.assertRaises(OAuthError) as caught:
+            self.user_info()
+        self.assertEqual(caught.exception.status_code, 401)
+        self.assertEqual(len(self.requests), 1)
+
+    def test_non_json_response(self):
+        for call in (self.exchange, self.user_info):
+            with self.subTest(call=call.__name__):
+                self.responses = [httpx.Response(200, text="<html>점검 중</html>")]
+                with self.assertRaises(OAuthError) as caught:
+                    call()
+                self.assertEqual(caught.exception.status_code, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
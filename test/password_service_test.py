@@ -0,0 +1,114 @@
+import os
+import sys
+import asyncio
+import threading
+import unittest
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+import bcrypt
+from service.password_service import MAX_ROUNDS, MIN_ROUNDS, PasswordService, PasswordServiceBusy
+
+"""
+비밀번호 서비스 테스트 (service/password_service.py)
+    해시 / 검증, 평문으로 저장된 옛 비밀번호, 다시 해시할 조건(cost는 높이는 방향만), 대기열 상한, cost 자동 조정 확인
+    테스트 시간을 줄이려고 bcrypt 최소 cost(4)를 쓴다.
+"""
+
+
+def bcrypt_hash(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=rounds)).decode()
+
+
+class PasswordServiceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.service = PasswordService(workers=2, max_pending=4, rounds=4)
+
+    def tearDown(self):
+        self.service.shutdown()
+
+    def test_hash_and_verify(self):
+        hashed = asyncio.run(self.service.hash("비밀번호123"))
+        self.assertTrue(hashed.startswith("$2b$04$"))
+        self.assertEqual(asyncio.run(self.service.verify("비밀번호123", hashed)), (True, None))
+        self.assertEqual(asyncio.run(self.service.verify("틀린 비밀번호", hashed)), (False, None))
+        self.assertEqual(self.service.pending, 0)
+
+    def test_missing_user_never_matches(self):
+        self.assertEqual(asyncio.run(self.service.verify("비밀번호", None)), (False, None))
+
+    def test_plaintext_password_is_rehashed(self):
+        matched, new_hash = asyncio.run(self.service.verify("옛비밀번호", "옛비밀번호"))
+        self.assertTrue(matched)
+        self.assertTrue(bcrypt.checkpw("옛비밀번호".encode(), new_hash.encode()))
+        self.assertEqual(asyncio.run(self.service.verify("다른 값", "옛비밀번호")), (False, None))
+
+    def test_needs_rehash_only_raises_cost(self):
+        self.service.rounds = 5
+        self.assertTrue(self.service.needs_rehash("평문"))
+        self.assertTrue(self.service.needs_rehash(bcrypt_hash("pw", 4)))
+        self.assertFalse(self.service.needs_rehash(bcrypt_hash("pw", 5)))
+        # 다른 워커가 더 높은 cost로 만든 해시는 낮추지 않음
+        self.assertFalse(self.service.needs_rehash(bcrypt_hash("pw", 6)))
+
+    def test_low_cost_hash_is_rehashed_on_login(self):
+        old_hash = bcrypt_hash("pw", 4)
+        self.service.rounds = 5
+        matched, new_hash = asyncio.run(self.service.verify("pw", old_hash))
+        self.assertTrue(matched)
+        self.assertTrue(new_hash.startswith("$2b$05$"))
+
+    def test_busy_when_queue_is_full(self):
+        service = PasswordService(workers=1, max_pending=1, rounds=4)
+        self.addCleanup(service.shutdown)
+        release = threading.Event()
+
+        async def scenario():
+            blocked = asyncio.ensure_future(service._run(release.wait))
+            await asyncio.sleep(0.01)
+            with self.assertRaises(PasswordServiceBusy) as caught:
+                await service.hash("pw")
+            release.set()
+            await blocked
+            return caught.exception
+
+        busy = asyncio.run(scenario())
+        self.assertGreaterEqual(busy.retry_after, 1)
+        self.assertEqual(service.pending, 0)
+
+
+class TuneTest(unittest.TestCase):
+
+    def test_fixed_rounds_are_kept(self):
+        service = PasswordService(rounds=11)
+        self.assertEqual(service.tune(target_ms=0), 11)
+
+    def test_rounds_follow_benchmark(self):
+        service = PasswordService(rounds=None)
+        # cost 10 한 번에 10ms -> 목표 80ms면 cost 13
+        with mock.patch("service.password_service.bcrypt.hashpw"), \
+                mock.patch("service.password_service.time.perf_counter", side_effect=[0.0, 0.010]), \
+                self.assertLogs("service.password_service", "INFO"):
+            self.assertEqual(service.tune(target_ms=80), 13)
+        self.assertEqual(service.rounds, 13)
+
+    def test_rounds_are_clamped(self):
+        service = PasswordService(rounds=None)
+        with mock.patch("service.password_service.bcrypt.hashpw"), \
+                mock.patch("service.password_service.time.perf_counter", side_effect=[0.0, 1.0, 0.0, 0.0]), \
+                self.assertLogs("service.password_service", "INFO"):
+            self.assertEqual(service.tune(target_ms=1), MIN_ROUNDS)
+            self.assertEqual(service.tune(target_ms=1000), MAX_ROUNDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
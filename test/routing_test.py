@@ -0,0 +1,170 @@
+import os
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import Column, MetaData, String, Table, create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from db.db_manager import DBManager
+from db.db_mixin.session_mixin import check_session
+from db.routing import ReplicaRouter, RoutingSession, STICKY_PRIMARY, use_primary
+
+"""
+복제본 라우팅 테스트
+    라운드 로빈 선택, 오류 복제본 제외와 재확인, primary 대체, SELECT / 쓰기 / FOR UPDATE 분기, primary 고정 확인
+    primary와 복제본마다 SQLite 메모리 DB를 따로 만들고 자기 이름을 넣어 어느 엔진에서 읽었는지 확인한다.
+"""
+
+metadata = MetaData()
+marker = Table("marker", metadata, Column("name", String(20)))
+
+
+def make_engine(name):
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(marker).values(name=name))
+    return engine
+
+
+class ReplicaRouterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.primary = make_engine("primary")
+        self.replicas = [make_engine("r0"), make_engine("r1")]
+        self.router = ReplicaRouter(self.primary, self.replicas, retry_interval=60)
+
+    def test_round_robin(self):
+        chosen = [self.router.choose() for _ in range(4)]
+        self.assertEqual(chosen, [self.replicas[0], self.replicas[1], self.replicas[0], self.replicas[1]])
+
+    def test_without_replicas_uses_primary(self):
+        self.assertIs(ReplicaRouter(self.primary, []).choose(), self.primary)
+
+    def test_down_replica_is_skipped(self):
+        with self.assertLogs("db.routing", "WARNING"):
+            self.router.mark_down(self.replicas[0])
+        self.assertEqual(self.router.healthy(), [self.replicas[1]])
+        self.assertEqual({self.router.choose() for _ in range(4)}, {self.replicas[1]})
+
+    def test_all_down_falls_back_to_primary(self):
+        with self.assertLogs("db.routing", "WARNING"):
+            for replica in self.replicas:
+                self.router.mark_down(replica)
+        self.assertEqual(self.router.healthy(), [])
+        self.assertIs(self.router.choose(), self.primary)
+
+    def test_unknown_engine_is_ignored(self):
+        self.router.mark_down(self.primary)
+        self.assertEqual(self.router.healthy(), self.replicas)
+
+    def test_replica_returns_after_retry_interval(self):
+        router = ReplicaRouter(self.primary, self.replicas[:1], retry_interval=0)
+        with self.assertLogs("db.routing", "WARNING"):
+            router.mark_down(self.replicas[0])
+        time.sleep(0.01)
+        # 제외 시간이 지나면 SELECT 1로 확인하고 다시 사용
+        self.assertIs(router.choose(), self.replicas[0])
+        self.assertEqual(router._down_until[id(self.replicas[0])], 0.0)
+
+    def test_failed_check_keeps_replica_down(self):
+        router = ReplicaRouter(self.primary, self.replicas[:1], retry_interval=0)
+        with self.assertLogs("db.routing", "WARNING"):
+            router.mark_down(self.replicas[0])
+        time.sleep(0.01)
+        with mock.patch.object(self.replicas[0], "connect", side_effect=OSError("연결 거부")), \
+                self.assertLogs("db.routing", "WARNING") as logs:
+            self.assertIs(router.choose(), self.primary)
+        self.assertTrue(any("상태 확인 실패" in line for line in logs.output))
+
+    def test_only_disconnect_errors_mark_down(self):
+        self.router._on_error(SimpleNamespace(is_disconnect=False, engine=self.replicas[0]))
+        self.assertEqual(self.router.healthy(), self.replicas)
+        with self.assertLogs("db.routing", "WARNING"):
+            self.router._on_error(SimpleNamespace(is_disconnect=True, engine=self.replicas[0]))
+        self.assertEqual(self.router.healthy(), [self.replicas[1]])
+
+
+class RoutingSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.primary = make_engine("primary")
+        self.replica = make_engine("replica")
+        self.router = ReplicaRouter(self.primary, [self.replica])
+        self.Session = sessionmaker(bind=self.primary, class_=RoutingSession, router=self.router)
+
+    def read(self, session, for_update=False):
+        query = select(marker.c.name)
+        if for_update:
+            query = query.with_for_update()
+        return session.scalar(query)
+
+    def test_select_goes_to_replica(self):
+        with self.Session() as session:
+            self.assertEqual(self.read(session), "replica")
+            self.assertNotIn(STICKY_PRIMARY, session.info)
+
+    def test_write_pins_session_to_primary(self):
+        with self.Session() as session:
+            session.execute(insert(marker).values(name="new"))
+            self.assertTrue(session.info[STICKY_PRIMARY])
+            # 방금 쓴 행을 볼 수 있도록 이후 읽기도 primary에서
+            self.assertEqual(session.scalars(select(marker.c.name)).all(), ["primary", "new"])
+
+    def test_for_update_goes_to_primary(self):
+        with self.Session() as session:
+            self.assertEqual(self.read(session, for_update=True), "primary")
+
+    def test_use_primary(self):
+        with self.Session() as session:
+            use_primary(session)
+            self.assertEqual(self.read(session), "primary")
+
+    def test_use_primary_on_async_session_wrapper(self):
+        with self.Session() as session:
+            use_primary(SimpleNamespace(sync_session=session))
+            self.assertTrue(session.info[STICKY_PRIMARY])
+
+
+class PrimaryPinningTest(unittest.TestCase):
+    """check_session 메서드와 transaction() 블록 안의 읽기는 primary에서"""
+
+    class Manager:
+        def __init__(self, session):
+            self.session = session
+
+        @check_session
+        def read_in_write_method(self):
+            return self.session.scalar(select(marker.c.name))
+
+    def setUp(self):
+        self.primary = make_engine("primary")
+        self.replica = make_engine("replica")
+        self.Session = sessionmaker(bind=self.primary, class_=RoutingSession, router=ReplicaRouter(self.primary, [self.replica]))
+
+    def test_check_session_pins_before_first_query(self):
+        with self.Session() as session:
+            self.assertEqual(self.Manager(session).read_in_write_method(), "primary")
+
+    def test_transaction_reads_from_primary(self):
+        with mock.patch("db.db_manager.SessionLocal", self.Session):
+            manager = DBManager()
+            with manager.transaction():
+                self.assertEqual(manager.session.scalar(select(marker.c.name)), "primary")
+            manager.session.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
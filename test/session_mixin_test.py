@@ -0,0 +1,146 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import String, create_engine, event, insert, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+from db.db_manager import DBManager
+from db.db_mixin.session_mixin import HAS_WRITES, UNIT_OF_WORK, check_session
+
+"""
+세션 / 트랜잭션 관리 테스트 (check_session, transaction, savepoint)
+    읽기만 한 메서드는 커밋 생략, 쓰기 메서드는 커밋, transaction() 안에서는 flush 후 블록 끝에서 한 번 커밋,
+    예외 시 롤백, savepoint 부분 롤백 확인
+"""
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+
+    name: Mapped[str] = mapped_column(String(20), primary_key=True)
+
+
+class ItemManager(DBManager):
+
+    @check_session
+    def add_item(self, name: str) -> None:
+        self.session.add(Item(name=name))
+
+    @check_session
+    def insert_item(self, name: str) -> None:
+        self.session.execute(insert(Item).values(name=name))
+
+    @check_session
+    def add_and_flush(self, name: str) -> None:
+        self.session.add(Item(name=name))
+        self.session.flush()
+
+    @check_session
+    def add_and_fail(self, name: str) -> None:
+        self.session.add(Item(name=name))
+        raise ValueError("저장 실패")
+
+    @check_session
+    def read_items(self) -> list:
+        return self.session.scalars(select(Item.name).order_by(Item.name)).all()
+
+
+class SessionMixinTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.commits = []
+        event.listen(self.session, "after_commit", lambda session: self.commits.append(True))
+        self.manager = ItemManager()
+        self.manager.session = self.session
+
+    def tearDown(self):
+        self.session.close()
+
+    def stored(self):
+        with self.engine.connect() as connection:
+            return connection.scalars(select(Item.name).order_by(Item.name)).all()
+
+    def test_read_does_not_commit(self):
+        self.assertEqual(self.manager.read_items(), [])
+        self.assertEqual(self.commits, [])
+
+    def test_writes_commit(self):
+        self.manager.add_item("a")
+        self.manager.insert_item("b")
+        self.manager.add_and_flush("c")
+        self.assertEqual(len(self.commits), 3)
+        self.assertEqual(self.stored(), ["a", "b", "c"])
+        # 커밋 뒤에는 쓰기 기록이 지워져 다음 읽기가 커밋하지 않음
+        self.assertNotIn(HAS_WRITES, self.session.info)
+        self.manager.read_items()
+        self.assertEqual(len(self.commits), 3)
+
+    def test_error_rolls_back(self):
+        with self.assertRaises(ValueError):
+            self.manager.add_and_fail("a")
+        self.assertEqual(self.manager.read_items(), [])
+
+    def test_without_session(self):
+        self.manager.session = None
+        with self.assertRaises(RuntimeError):
+            self.manager.read_items()
+        with self.assertRaises(RuntimeError), self.manager.savepoint():
+            pass
+
+    def test_transaction_commits_once(self):
+        with self.manager.transaction():
+            self.assertTrue(self.manager.in_unit_of_work)
+            self.manager.add_item("a")
+            # 커밋 전이지만 flush했으므로 같은 블록의 읽기에 보임
+            self.assertEqual(self.manager.read_items(), ["a"])
+            self.manager.insert_item("b")
+            self.assertEqual(self.commits, [])
+        self.assertEqual(len(self.commits), 1)
+        self.assertFalse(self.manager.in_unit_of_work)
+        self.assertEqual(self.stored(), ["a", "b"])
+
+    def test_nested_transaction_joins_outer(self):
+        with self.manager.transaction():
+            self.manager.add_item("a")
+            with self.manager.transaction():
+                self.manager.add_item("b")
+            self.assertTrue(self.session.info[UNIT_OF_WORK])
+            self.assertEqual(self.commits, [])
+        self.assertEqual(len(self.commits), 1)
+
+    def test_transaction_error_rolls_back_block(self):
+        with self.assertRaises(ValueError), self.manager.transaction():
+            self.manager.add_item("a")
+            self.manager.add_and_fail("b")
+        self.assertEqual(self.commits, [])
+        self.assertEqual(self.stored(), [])
+        self.assertFalse(self.manager.in_unit_of_work)
+
+    def test_savepoint_rolls_back_part(self):
+        with self.manager.transaction():
+            self.manager.add_item("a")
+            with self.assertRaises(ValueError), self.manager.savepoint():
+                self.manager.add_and_fail("b")
+            self.manager.add_item("c")
+        self.assertEqual(len(self.commits), 1)
+        self.assertEqual(self.stored(), ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
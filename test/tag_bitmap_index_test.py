@@ -0,0 +1,229 @@
+import os
+import sys
+import asyncio
+import threading
+import unittest
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine, delete
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session
+from db import tag_bitmap_index
+from db.tag_bitmap_index import TagBitmapIndex, schedule_food_tags
+from db.tables.food_table import FoodInfo, FoodTag, FoodInfoTag
+
+"""
+태그 비트맵 인덱스 테스트
+    태그 식 해석(AND / OR / NOT / 괄호 / 따옴표), 조회/개수/패싯, 태그 변경 반영, 커밋 후 갱신과 재생성 확인
+"""
+
+FOOD_IDS = ["F0", "F1", "F2", "F3", "F4"]
+TAGS = {
+    "고단백": [0, 1, 2],
+    "저염": [1, 2, 3],
+    "유제품": [2],
+    "매운 음식": [3, 4],
+}
+
+
+def make_index():
+    return TagBitmapIndex(FOOD_IDS, TAGS)
+
+
+class TokenizeTest(unittest.TestCase):
+
+    def test_operators_and_keywords(self):
+        self.assertEqual(
+            TagBitmapIndex._tokenize('고단백 and (저염 || !유제품) & -"매운 음식"'),
+            [("tag", "고단백"), ("op", "&"), ("op", "("), ("tag", "저염"), ("op", "|"), ("op", "!"), ("tag", "유제품"),
+             ("op", ")"), ("op", "&"), ("op", "!"), ("tag", "매운 음식")],
+        )
+
+    def test_keywords_are_case_insensitive(self):
+        self.assertEqual(TagBitmapIndex._tokenize("NOT a OR b"), [("op", "!"), ("tag", "a"), ("op", "|"), ("tag", "b")])
+
+    def test_unclosed_quote(self):
+        with self.assertRaises(ValueError):
+            TagBitmapIndex._tokenize('"매운 음식')
+
+
+class EvaluateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = make_index()
+
+    def test_and_or_not(self):
+        self.assertEqual(self.index.query("고단백 AND 저염 AND NOT 유제품"), ["F1"])
+        self.assertEqual(self.index.query("유제품 | \"매운 음식\""), ["F2", "F3", "F4"])
+        self.assertEqual(self.index.query("!고단백"), ["F3", "F4"])
+
+    def test_precedence(self):
+        # NOT > AND > OR
+        self.assertEqual(self.index.query("유제품 | 고단백 & !저염"), ["F0", "F2"])
+        self.assertEqual(self.index.query("(유제품 | 고단백) & !저염"), ["F0"])
+        self.assertEqual(self.index.query("!!유제품"), ["F2"])
+
+    def test_implicit_and(self):
+        self.assertEqual(self.index.query("고단백 저염"), self.index.query("고단백 & 저염"))
+
+    def test_unknown_tag_is_empty(self):
+        self.assertEqual(self.index.query("없는태그"), [])
+        self.assertEqual(self.index.count("!없는태그"), len(FOOD_IDS))
+
+    def test_syntax_errors(self):
+        for expression in ["", "   ", "고단백 &", "(고단백", "고단백)", "& 저염", "()"]:
+            with self.subTest(expression=expression):
+                with self.assertRaises(ValueError):
+                    self.index.evaluate(expression)
+
+    def test_query_paging_and_count(self):
+        self.assertEqual(self.index.query("고단백 | 저염", limit=2), ["F0", "F1"])
+        self.assertEqual(self.index.query("고단백 | 저염", limit=2, offset=2), ["F2", "F3"])
+        self.assertEqual(self.index.count("고단백 | 저염"), 4)
+
+    def test_facets(self):
+        self.assertEqual(self.index.facets(), {"고단백": 3, "저염": 3, "유제품": 1, "매운 음식": 2})
+        self.assertEqual(self.index.facets("저염"), {"고단백": 2, "저염": 3, "유제품": 1, "매운 음식": 1})
+        self.assertEqual(self.index.facets("유제품", tag_names=["고단백", "매운 음식"]), {"고단백": 1})
+
+
+class SetFoodTagsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = make_index()
+
+    def test_replaces_tags_of_one_food(self):
+        self.assertTrue(self.index.set_food_tags("F2", ["저염", "채식"]))
+        self.assertEqual(self.index.query("고단백"), ["F0", "F1"])
+        self.assertEqual(self.index.query("채식"), ["F2"])
+        # 마지막 음식이 빠진 태그는 사라짐
+        self.assertNotIn("유제품", self.index.tags())
+        self.assertEqual(self.index.food_tags[2], frozenset({"저염", "채식"}))
+
+    def test_clear_all_tags(self):
+        self.index.set_food_tags("F0", [])
+        self.assertNotIn(0, self.index.food_tags)
+        self.assertEqual(self.index.query("고단백"), ["F1", "F2"])
+
+    def test_unknown_food(self):
+        self.assertFalse(self.index.set_food_tags("F9", ["고단백"]))
+
+    def test_readers_see_consistent_snapshot(self):
+        stop = threading.Event()
+        errors = []
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                self.index.set_food_tags("F0", [f"태그{i % 50}", "고단백"])
+                i += 1
+
+        def reader():
+            try:
+                for _ in range(2000):
+                    self.index.facets()
+                    self.index.tags()
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            reader()
+        finally:
+            stop.set()
+            thread.join()
+        self.assertEqual(errors, [])
+
+
+class IndexLifecycleTest(unittest.TestCase):
+    """모듈 공용 인덱스: DB에서 생성, 커밋 후 태그 반영, 음식 추가 시 재생성"""
+
+    def setUp(self):
+        # 백그라운드 재생성 스레드도 같은 메모리 DB를 보도록 연결 하나를 공유
+        self.engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        for table in (FoodInfo, FoodTag, FoodInfoTag):
+            table.__table__.create(self.engine)
+        with Session(self.engine) as session:
+            session.add_all([
+                FoodInfo(food_id="F2", food_name="된장찌개", data_type_code="D"),
+                FoodInfo(food_id="F1", food_name="김치찌개", data_type_code="D"),
+                FoodTag(tag_id=1, tag_name="한식"),
+                FoodTag(tag_id=2, tag_name="국물"),
+                FoodInfoTag(food_id="F1", tag_id=1),
+                FoodInfoTag(food_id="F2", tag_id=1),
+                FoodInfoTag(food_id="F2", tag_id=2),
+            ])
+            session.commit()
+        from_database = TagBitmapIndex.from_database
+        self.patch = mock.patch.object(TagBitmapIndex, "from_database", lambda bind=None: from_database(self.engine))
+        self.patch.start()
+        self.reset()
+
+    def tearDown(self):
+        self.patch.stop()
+        if tag_bitmap_index._rebuild_thread is not None:
+            tag_bitmap_index._rebuild_thread.join()
+        self.reset()
+
+    @staticmethod
+    def reset():
+        tag_bitmap_index._index = None
+        tag_bitmap_index._index_stale = False
+        tag_bitmap_index._rebuild_thread = None
+
+    def test_from_database_orders_by_food_id(self):
+        index = tag_bitmap_index.get_tag_bitmap_index()
+        self.assertEqual(index.food_ids, ["F1", "F2"])
+        self.assertEqual(index.query("한식 & !국물"), ["F1"])
+
+    def test_async_load(self):
+        index = asyncio.run(tag_bitmap_index.load_tag_bitmap_index())
+        self.assertIs(index, tag_bitmap_index.get_tag_bitmap_index())
+
+    def test_tag_change_applied_after_commit(self):
+        index = tag_bitmap_index.get_tag_bitmap_index()
+        with Session(self.engine) as session:
+            schedule_food_tags(session, "F1", ["국물"])
+            self.assertEqual(index.query("국물"), ["F2"])
+            session.commit()
+        self.assertEqual(index.query("국물"), ["F1", "F2"])
+        self.assertFalse(tag_bitmap_index._index_stale)
+
+    def test_rollback_discards_change(self):
+        index = tag_bitmap_index.get_tag_bitmap_index()
+        with Session(self.engine) as session:
+            session.execute(delete(FoodInfoTag).where(FoodInfoTag.food_id == "F2"))
+            schedule_food_tags(session, "F2", [])
+            session.rollback()
+            session.commit()
+        self.assertEqual(index.query("국물"), ["F2"])
+
+    def test_new_food_rebuilds_in_background(self):
+        old = tag_bitmap_index.get_tag_bitmap_index()
+        with Session(self.engine) as session:
+            session.add(FoodInfo(food_id="F3", food_name="육개장", data_type_code="D"))
+            session.add(FoodInfoTag(food_id="F3", tag_id=2))
+            schedule_food_tags(session, "F3", None)
+            session.commit()
+        self.assertTrue(tag_bitmap_index._index_stale)
+        # 재생성이 끝날 때까지는 기존 인덱스로 응답
+        self.assertIs(tag_bitmap_index.get_tag_bitmap_index(), old)
+        tag_bitmap_index._rebuild_thread.join()
+        new = tag_bitmap_index.get_tag_bitmap_index()
+        self.assertIsNot(new, old)
+        self.assertEqual(new.query("국물"), ["F2", "F3"])
+        self.assertFalse(tag_bitmap_index._index_stale)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+from db.db_manager import DBManager
+from db.db_mixin.food_mixin import food_cache
+from db.tag_dictionary import TagDictionary, tag_dictionary
+from db.tables.food_table import FoodInfo, FoodCategory, FoodNutrition, FoodTag, FoodInfoTag
+
+"""
+태그 사전 테스트
+    태그 이름당 한 행 재사용, 일괄 연결, 커밋 후에만 공용 사전에 반영, 음식 태그 교체/삭제 확인
+    SQLite에서 돌리기 위해 MySQL의 INSERT IGNORE를 INSERT OR IGNORE로 바꿔 실행한다.
+"""
+
+
+def mysql_insert_ignore(conn, cursor, statement, parameters, context, executemany):
+    return statement.replace("INSERT IGNORE", "INSERT OR IGNORE"), parameters
+
+
+class TagDictionaryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        event.listen(self.engine, "before_cursor_execute", mysql_insert_ignore, retval=True)
+        for table in (FoodInfo, FoodCategory, FoodNutrition, FoodTag, FoodInfoTag):
+            table.__table__.create(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.session.add_all([
+            FoodInfo(food_id="F1", food_name="김치찌개", data_type_code="D"),
+            FoodInfo(food_id="F2", food_name="된장찌개", data_type_code="D"),
+            FoodTag(tag_id=10, tag_name="한식"),
+        ])
+        self.session.commit()
+        self.tags = TagDictionary()
+
+    def tearDown(self):
+        self.session.close()
+
+    def tag_rows(self):
+        return dict(self.session.execute(select(FoodTag.tag_name, FoodTag.tag_id)).all())
+
+    def test_resolve_reuses_and_creates(self):
+        resolved = self.tags.resolve(self.session, [" 한식 ", "국물", "", "국물"])
+        self.assertEqual(resolved["한식"], 10)
+        self.assertEqual(set(resolved), {"한식", "국물"})
+        self.assertEqual(self.tag_rows(), resolved)
+
+    def test_resolve_without_create(self):
+        self.assertEqual(self.tags.resolve(self.session, ["한식", "없는 태그"], create=False), {"한식": 10})
+        self.assertIsNone(self.tags.get_id(self.session, "없는 태그"))
+        self.assertEqual(len(self.tag_rows()), 1)
+
+    def test_new_tags_published_after_commit(self):
+        # 공용 사전 tag_dictionary만 커밋 이벤트에 연결되어 있음
+        tag_dictionary.clear()
+        self.addCleanup(tag_dictionary.clear)
+        tag_id = tag_dictionary.resolve(self.session, ["국물"])["국물"]
+        self.assertEqual(len(tag_dictionary), 0)
+        self.session.commit()
+        self.assertEqual(tag_dictionary.resolve(self.session, ["국물"], create=False), {"국물": tag_id})
+        self.assertEqual(len(tag_dictionary), 1)
+
+    def test_rolled_back_tags_are_not_published(self):
+        tag_dictionary.clear()
+        self.addCleanup(tag_dictionary.clear)
+        tag_dictionary.resolve(self.session, ["국물"])
+        self.session.rollback()
+        self.assertEqual(len(tag_dictionary), 0)
+        self.assertEqual(tag_dictionary.resolve(self.session, ["국물"], create=False), {})
+
+    def test_link_skips_duplicates(self):
+        linked = self.tags.link(self.session, [("F1", "한식"), ("F1", " 한식"), ("F2", "한식"), ("F2", "국물")])
+        self.assertEqual(linked, 3)
+        self.assertEqual(self.tags.link(self.session, [("F1", "한식")]), 1)
+        self.assertEqual(self.session.scalar(select(func.count()).select_from(FoodInfoTag)), 3)
+
+    def test_replace(self):
+        self.tags.link(self.session, [("F1", "한식"), ("F1", "국물"), ("F2", "한식")])
+        self.tags.replace(self.session, "F1", ["매운맛"])
+        names = self.session.scalars(
+            select(FoodTag.tag_name).join(FoodInfoTag, FoodInfoTag.tag_id == FoodTag.tag_id).where(FoodInfoTag.food_id == "F1")
+        ).all()
+        self.assertEqual(names, ["매운맛"])
+        self.assertEqual(self.session.scalar(select(func.count()).select_from(FoodInfoTag).where(FoodInfoTag.food_id == "F2")), 1)
+
+
+class FoodTagMethodsTest(unittest.TestCase):
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        event.listen(engine, "before_cursor_execute", mysql_insert_ignore, retval=True)
+        for table in (FoodInfo, FoodCategory, FoodNutrition, FoodTag, FoodInfoTag):
+            table.__table__.create(engine)
+        self.session = sessionmaker(bind=engine)()
+        self.session.add_all([
+            FoodInfo(food_id="F1", food_name="김치찌개", data_type_code="D"),
+            FoodInfo(food_id="F2", food_name="된장찌개", data_type_code="D"),
+        ])
+        self.session.commit()
+        tag_dictionary.clear()
+        food_cache.clear()
+        self.manager = DBManager()
+        self.manager.session = self.session
+
+    def tearDown(self):
+        self.session.close()
+        tag_dictionary.clear()
+        food_cache.clear()
+
+    def test_update_and_search_by_tag(self):
+        self.assertTrue(self.manager.update_food_tags("F1", ["한식", "국물"]))
+        self.assertTrue(self.manager.update_food_tags("F2", ["한식"]))
+        self.assertFalse(self.manager.update_food_tags("없음", ["한식"]))
+        self.assertEqual(sorted(food.food_id for food in self.manager.get_food_by_tag("한식")), ["F1", "F2"])
+        self.assertEqual([food.food_id for food in self.manager.get_food_by_tag("국물")], ["F1"])
+        self.assertEqual(self.manager.get_food_by_tag("없는 태그"), [])
+        self.assertEqual(self.session.scalar(select(func.count()).select_from(FoodTag)), 2)
+
+    def test_delete_food_tags(self):
+        self.manager.update_food_tags("F1", ["한식"])
+        self.assertTrue(self.manager.delete_food_tags("F1"))
+        self.assertEqual(self.manager.get_food_by_tag("한식"), [])
+        # 태그 행은 사전에 남아 다른 음식이 재사용
+        self.assertEqual(self.session.scalar(select(func.count()).select_from(FoodTag)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
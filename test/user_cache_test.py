@@ -0,0 +1,131 @@
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from db.user_cache import AuthUserCache, MemoryAuthBackend, auth_user_cache, invalidate_user_on_commit
+from model.domain.user import User, UserAuth, UserBody
+
+"""
+인증 사용자 캐시 테스트 (db/user_cache.py)
+    (uuid, jti) 단위 저장/조회, 사용자 단위 무효화, TTL 만료, 버전 캐시 크기 제한, 커밋 후 재무효화 확인
+"""
+
+
+def make_user(uuid="U1", nickname="테스터"):
+    return User(uuid=uuid, nickname=nickname, user_auth=UserAuth(email=f"{uuid}@example.com"), user_body=UserBody())
+
+
+class MemoryAuthBackendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.backend = MemoryAuthBackend(maxsize=10, ttl=60)
+
+    def test_get_and_set(self):
+        user = make_user()
+        self.assertIsNone(self.backend.get("U1", "jti-1"))
+        self.backend.set("U1", "jti-1", user)
+        self.assertIs(self.backend.get("U1", "jti-1"), user)
+        # 토큰(jti)마다 따로 저장
+        self.assertIsNone(self.backend.get("U1", "jti-2"))
+
+    def test_invalidate_drops_every_token_of_user(self):
+        self.backend.set("U1", "jti-1", make_user())
+        self.backend.set("U1", "jti-2", make_user())
+        self.backend.set("U2", "jti-3", make_user("U2"))
+        self.backend.invalidate("U1")
+        self.assertIsNone(self.backend.get("U1", "jti-1"))
+        self.assertIsNone(self.backend.get("U1", "jti-2"))
+        self.assertIsNotNone(self.backend.get("U2", "jti-3"))
+        # 무효화 후 다시 넣은 항목은 새 버전으로 유효
+        self.backend.set("U1", "jti-1", make_user(nickname="바뀐 이름"))
+        self.assertEqual(self.backend.get("U1", "jti-1").nickname, "바뀐 이름")
+
+    def test_entries_expire(self):
+        backend = MemoryAuthBackend(maxsize=10, ttl=0.01)
+        backend.set("U1", "jti-1", make_user())
+        time.sleep(0.02)
+        self.assertIsNone(backend.get("U1", "jti-1"))
+
+    def test_versions_are_bounded(self):
+        backend = MemoryAuthBackend(maxsize=3, ttl=60)
+        for i in range(10):
+            backend.set(f"U{i}", "jti", make_user(f"U{i}"))
+        self.assertEqual(len(backend._versions._data), 3)
+        # 버전이 밀려난 사용자의 항목은 무효
+        self.assertIsNone(backend.get("U0", "jti"))
+        self.assertIsNotNone(backend.get("U9", "jti"))
+
+    def test_stats(self):
+        self.backend.set("U1", "jti-1", make_user())
+        self.backend.get("U1", "jti-1")
+        self.backend.get("U1", "jti-2")
+        stats = self.backend.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+
+class AuthUserCacheTest(unittest.TestCase):
+
+    def test_missing_jti_uses_placeholder(self):
+        cache = AuthUserCache(maxsize=10, ttl=60, redis_url=None)
+        cache.set("U1", None, make_user())
+        self.assertIsNotNone(cache.get("U1", None))
+
+    def test_backend_errors_fall_back_to_db(self):
+        cache = AuthUserCache(maxsize=10, ttl=60, redis_url=None)
+        cache.backend = mock.Mock()
+        cache.backend.get.side_effect = ConnectionError("캐시 서버 연결 실패")
+        cache.backend.set.side_effect = ConnectionError("캐시 서버 연결 실패")
+        with self.assertLogs("db.user_cache", "WARNING"):
+            self.assertIsNone(cache.get("U1", "jti"))
+            cache.set("U1", "jti", make_user())
+
+    def test_redis_without_package_uses_memory(self):
+        with mock.patch.dict(sys.modules, {"redis": None}), self.assertLogs("db.user_cache", "WARNING"):
+            cache = AuthUserCache(maxsize=10, ttl=60, redis_url="redis://localhost:6379/0")
+        self.assertIsInstance(cache.backend, MemoryAuthBackend)
+
+
+class InvalidateOnCommitTest(unittest.TestCase):
+
+    def setUp(self):
+        self.session = Session(create_engine("sqlite://"))
+        auth_user_cache.clear()
+
+    def tearDown(self):
+        self.session.close()
+        auth_user_cache.clear()
+
+    def test_invalidated_now_and_after_commit(self):
+        auth_user_cache.set("U1", "jti", make_user())
+        self.session.execute(text("SELECT 1"))
+        invalidate_user_on_commit(self.session, "U1")
+        self.assertIsNone(auth_user_cache.get("U1", "jti"))
+        # 커밋 전에 다른 요청이 옛 값을 다시 넣어도 커밋 후 지워짐
+        auth_user_cache.set("U1", "jti", make_user())
+        self.session.commit()
+        self.assertIsNone(auth_user_cache.get("U1", "jti"))
+
+    def test_rollback_discards_pending(self):
+        self.session.execute(text("SELECT 1"))
+        invalidate_user_on_commit(self.session, "U1")
+        self.session.rollback()
+        auth_user_cache.set("U1", "jti", make_user())
+        self.session.commit()
+        self.assertIsNotNone(auth_user_cache.get("U1", "jti"))
+
+
+if __name__ == "__main__":
+    unittest.main()
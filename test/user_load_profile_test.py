@@ -0,0 +1,136 @@
+import os
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from db.db_manager import DBManager, get_async_db_manager
+from db.tables.user_table import UserInfo, UserAuth, UserBody, SocialLogin, Password, Subscription
+from router.user.user_router import user_router, get_current_user
+
+"""
+유저 조회 프로필 테스트
+    프로필별로 필요한 관계만 채워지는지, 조회가 쿼리 한 번인지, /user/profile 응답 형태 확인
+"""
+
+
+class UserLoadProfileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        for table in (UserInfo, UserAuth, UserBody, SocialLogin, Password, Subscription):
+            table.__table__.create(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.manager = DBManager()
+        self.manager.session = self.session
+        self.uuid = self.manager.create_user(
+            nickname="테스터", email="tester@example.com", social_code="google", access_token="token",
+            phone="010-0000-0000", age=30, tall=170, weight=65, gender="여성",
+        )
+        self.session.add(Subscription(uuid=self.uuid, plan="basic", purchase=datetime(2026, 1, 1), expired=datetime(2027, 1, 1)))
+        self.session.commit()
+        self.session.expunge_all()
+
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._count)
+
+    def tearDown(self):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+        self.session.close()
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def test_auth_only(self):
+        user = self.manager.get_user_by_uuid(self.uuid, profile="auth-only")
+        self.assertEqual(user.user_auth.email, "tester@example.com")
+        self.assertIsNone(user.user_body.age)
+        self.assertIsNone(user.social_login)
+        self.assertIsNone(user.subscription)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_profile(self):
+        user = self.manager.get_user_by_uuid(self.uuid, profile="profile")
+        self.assertEqual(user.user_body.age, 30)
+        self.assertEqual(user.social_login.social_code, "google")
+        self.assertEqual(user.subscription.plan, "basic")
+        self.assertEqual(len(self.statements), 1)
+        self.assertNotIn("password", self.statements[0])
+
+    def test_full(self):
+        user = self.manager.get_user_by_email("tester@example.com")
+        self.assertEqual(user.uuid, self.uuid)
+        self.assertEqual(user.user_body.weight, 65)
+        self.assertEqual(len(self.statements), 1)
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            self.manager.get_user_by_uuid(self.uuid, profile="everything")
+
+    def test_missing_user(self):
+        self.assertIsNone(self.manager.get_user_by_uuid("없는 uuid", profile="profile"))
+
+
+class UserProfileRouteTest(unittest.TestCase):
+    """/user/profile은 profile 프로필로 다시 조회해 비밀번호와 소셜 토큰 없이 반환"""
+
+    class AsyncManager:
+        def __init__(self, manager):
+            self.manager = manager
+            self.profiles = []
+
+        async def get_user_by_uuid(self, uuid, profile="full"):
+            self.profiles.append(profile)
+            return self.manager.get_user_by_uuid(uuid, profile=profile)
+
+    def setUp(self):
+        # 동기 라우트 의존성은 스레드 풀에서 실행되므로 연결 하나를 공유
+        engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        for table in (UserInfo, UserAuth, UserBody, SocialLogin, Password, Subscription):
+            table.__table__.create(engine)
+        self.session = sessionmaker(bind=engine)()
+        manager = DBManager()
+        manager.session = self.session
+        self.uuid = manager.create_user(
+            nickname="테스터", email="tester@example.com", social_code="google", access_token="token", age=30,
+        )
+        self.async_manager = self.AsyncManager(manager)
+
+        app = FastAPI()
+        app.include_router(user_router)
+        app.dependency_overrides[get_current_user] = lambda: manager.get_user_by_uuid(self.uuid, profile="auth-only")
+        app.dependency_overrides[get_async_db_manager] = lambda: self.async_manager
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_profile_response(self):
+        response = self.client.get("/user/profile")
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(self.async_manager.profiles, ["profile"])
+        self.assertEqual(body["uuid"], self.uuid)
+        self.assertEqual(body["email"], "tester@example.com")
+        self.assertEqual(body["user_body"]["age"], 30)
+        self.assertEqual(body["social_code"], "google")
+        self.assertIsNone(body["subscription"])
+        self.assertNotIn("access_token", response.text)
+        self.assertNotIn("password", body)
+
+
+if __name__ == "__main__":
+    unittest.main()
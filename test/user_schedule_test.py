@@ -0,0 +1,177 @@
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from db.db_manager import DBManager, get_async_db_manager
+from db.db_mixin.user_mixin import _decode_schedule_cursor, _encode_schedule_cursor
+from db.tables.food_table import FoodInfo, FoodNutrition
+from db.tables.user_table import UserSchedule, ScheduleFood
+from model.domain.user import SchedulePage
+from router.user.user_router import user_router, get_current_user
+
+"""
+식사 일정 기간 조회 테스트 (get_user_schedule)
+    cursor 인코딩 / 잘못된 cursor, [start, end) 범위, (datetime, meal_id) 순서의 keyset 페이지,
+    음식과 영양성분을 함께 로딩해 식사 수와 관계없이 쿼리 수 일정, /user/schedule 요청 검증 확인
+"""
+
+START = datetime(2026, 3, 2)
+
+
+class ScheduleCursorTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        cursor = _encode_schedule_cursor(datetime(2026, 3, 2, 8, 30), 42)
+        self.assertNotIn("=", cursor)
+        self.assertEqual(_decode_schedule_cursor(cursor), (datetime(2026, 3, 2, 8, 30), 42))
+
+    def test_invalid_cursor(self):
+        for cursor in ("!!!", "bm90LWEtY3Vyc29y", _encode_schedule_cursor(START, 1)[:-4]):
+            with self.assertRaises(ValueError):
+                _decode_schedule_cursor(cursor)
+
+
+class GetUserScheduleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        for table in (FoodInfo, FoodNutrition, UserSchedule, ScheduleFood):
+            table.__table__.create(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.session.add_all([
+            FoodInfo(food_id="F1", food_name="현미밥", data_type_code="D"),
+            FoodNutrition(food_id="F1", energy_kcal=150, protein_g=3),
+        ])
+        # 하루 세 끼, 8시 식사는 같은 시각에 두 개
+        for day in range(3):
+            for hour in (8, 8, 12, 19):
+                schedule = UserSchedule(uuid="U1", datetime=START + timedelta(days=day, hours=hour))
+                schedule.foods = [
+                    ScheduleFood(food_id="F1", food_name="현미밥", quantity=210, unit="g", amount_text="210g"),
+                    ScheduleFood(food_name="미역국", amount_text="1인분"),
+                ]
+                self.session.add(schedule)
+        self.session.add(UserSchedule(uuid="U2", datetime=START + timedelta(hours=8)))
+        self.session.commit()
+        self.manager = DBManager()
+        self.manager.session = self.session
+
+    def tearDown(self):
+        self.session.close()
+
+    def pages(self, start, end, limit):
+        meals = []
+        cursor = None
+        while True:
+            page = self.manager.get_user_schedule("U1", start, end, cursor=cursor, limit=limit)
+            meals.extend(page.meals)
+            if page.next_cursor is None:
+                return meals
+            cursor = page.next_cursor
+
+    def test_range_is_half_open(self):
+        page = self.manager.get_user_schedule("U1", START + timedelta(days=1), START + timedelta(days=1, hours=19))
+        self.assertEqual([meal.datetime.hour for meal in page.meals], [8, 8, 12])
+        self.assertIsNone(page.next_cursor)
+
+    def test_keyset_pages(self):
+        end = START + timedelta(days=3)
+        everything = self.manager.get_user_schedule("U1", START, end).meals
+        self.assertEqual(len(everything), 12)
+        self.assertEqual(everything, sorted(everything, key=lambda meal: (meal.datetime, meal.meal_id)))
+        # 같은 시각의 식사 사이에서 끊겨도 빠지거나 겹치는 식사 없음
+        for limit in (1, 3, 5, 12):
+            self.assertEqual([meal.meal_id for meal in self.pages(START, end, limit)],
+                             [meal.meal_id for meal in everything])
+
+    def test_cursor_only_when_more_meals(self):
+        page = self.manager.get_user_schedule("U1", START, START + timedelta(days=1), limit=4)
+        self.assertEqual(len(page.meals), 4)
+        self.assertIsNone(page.next_cursor)
+        page = self.manager.get_user_schedule("U1", START, START + timedelta(days=1), limit=3)
+        self.assertEqual(_decode_schedule_cursor(page.next_cursor), (page.meals[-1].datetime, page.meals[-1].meal_id))
+
+    def test_foods_and_nutrition(self):
+        meal = self.manager.get_user_schedule("U1", START, START + timedelta(days=1), limit=1).meals[0]
+        foods = {food.food_name: food for food in meal.foods}
+        rice, soup = foods["현미밥"], foods["미역국"]
+        self.assertEqual((rice.food_id, rice.quantity, rice.unit), ("F1", 210.0, "g"))
+        self.assertEqual(rice.food_nutrition.energy_kcal, 150)
+        self.assertEqual((soup.food_id, soup.quantity, soup.amount_text), (None, None, "1인분"))
+        self.assertIsNone(soup.food_nutrition)
+
+    def test_query_count_does_not_grow_with_meals(self):
+        statements = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        self.session.expire_all()
+        self.manager.get_user_schedule("U1", START, START + timedelta(days=3), limit=1)
+        one = len(statements)
+        statements.clear()
+        self.session.expire_all()
+        self.manager.get_user_schedule("U1", START, START + timedelta(days=3), limit=100)
+        self.assertEqual(len(statements), one)
+        self.assertLessEqual(one, 3)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            self.manager.get_user_schedule("U1", START, START + timedelta(days=1), cursor="!!!")
+
+    def test_without_session(self):
+        self.manager.session = None
+        with self.assertRaises(RuntimeError):
+            self.manager.get_user_schedule("U1", START, START + timedelta(days=1))
+
+
+class UserScheduleRouteTest(unittest.TestCase):
+    """/user/schedule은 현재 유저의 uuid로 조회하고 잘못된 기간 / cursor는 400"""
+
+    class AsyncManager:
+        def __init__(self):
+            self.calls = []
+
+        async def get_user_schedule(self, uuid, start, end, cursor=None, limit=100):
+            self.calls.append((uuid, start, end, cursor, limit))
+            if cursor == "bad":
+                raise ValueError("잘못된 cursor입니다.")
+            return SchedulePage(meals=[], next_cursor=None)
+
+    def setUp(self):
+        self.async_manager = self.AsyncManager()
+        app = FastAPI()
+        app.include_router(user_router)
+        app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(uuid="U1")
+        app.dependency_overrides[get_async_db_manager] = lambda: self.async_manager
+        self.client = TestClient(app)
+
+    def get(self, **params):
+        return self.client.get("/user/schedule", params={"start": "2026-03-02T00:00:00", "end": "2026-03-09T00:00:00", **params})
+
+    def test_schedule(self):
+        response = self.get(limit=50)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"meals": [], "next_cursor": None})
+        self.assertEqual(self.async_manager.calls, [("U1", START, START + timedelta(days=7), None, 50)])
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.get(end="2026-03-02T00:00:00").status_code, 400)
+        self.assertEqual(self.get(cursor="bad").status_code, 400)
+        self.assertEqual(self.get(limit=501).status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
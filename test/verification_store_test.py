@@ -0,0 +1,161 @@
+import os
+import sys
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from db.db_manager import DBManager
+from db.tables.email_table import EmailVerification
+from service.verification_store import (
+    MemoryVerificationStore, SQLVerificationStore, VerificationStore, create_verification_store,
+)
+
+"""
+이메일 인증 코드 저장소 테스트 (service/verification_store.py)
+    저장 / 교체 / 확인(ok, missing, expired, mismatch), 만료 정리, 최대 크기, 확인 후 재사용 불가,
+    DB 저장소의 확인(DELETE 한 번)과 만료 코드 정리 확인
+"""
+
+TTL = timedelta(minutes=5)
+
+
+class MemoryVerificationStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.store = MemoryVerificationStore(maxsize=3)
+
+    def put(self, email, code, ttl=TTL):
+        asyncio.run(self.store.put(email, code, ttl))
+
+    def confirm(self, email, code):
+        return asyncio.run(self.store.confirm(email, code))
+
+    def test_confirm(self):
+        self.put("a@example.com", "123456")
+        self.assertEqual(self.confirm("a@example.com", "000000"), "mismatch")
+        self.assertEqual(self.confirm("a@example.com", "123456"), "ok")
+        # 한 번 확인한 코드는 다시 쓸 수 없음
+        self.assertEqual(self.confirm("a@example.com", "123456"), "missing")
+
+    def test_new_code_replaces_old(self):
+        self.put("a@example.com", "111111")
+        self.put("a@example.com", "222222")
+        self.assertEqual(self.confirm("a@example.com", "111111"), "mismatch")
+        self.assertEqual(self.confirm("a@example.com", "222222"), "ok")
+        self.assertEqual(len(self.store), 0)
+
+    def test_expired(self):
+        self.put("a@example.com", "123456", ttl=timedelta(seconds=-1))
+        self.assertEqual(self.confirm("a@example.com", "123456"), "expired")
+        self.assertEqual(self.confirm("a@example.com", "123456"), "missing")
+
+    def test_put_purges_expired(self):
+        self.put("a@example.com", "1", ttl=timedelta(seconds=-1))
+        self.put("b@example.com", "2", ttl=timedelta(seconds=-1))
+        self.put("c@example.com", "3")
+        self.assertEqual(len(self.store), 1)
+
+    def test_maxsize_drops_soonest_expiring(self):
+        self.put("a@example.com", "1", ttl=timedelta(minutes=10))
+        self.put("b@example.com", "2", ttl=timedelta(minutes=1))
+        self.put("c@example.com", "3", ttl=timedelta(minutes=10))
+        self.put("d@example.com", "4")
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.confirm("b@example.com", "2"), "missing")
+        # 이미 있는 이메일의 교체는 다른 항목을 밀어내지 않음
+        self.put("a@example.com", "5")
+        self.assertEqual(self.confirm("c@example.com", "3"), "ok")
+
+    def test_replaced_codes_do_not_grow_heap(self):
+        store = MemoryVerificationStore(maxsize=10)
+        for i in range(1000):
+            asyncio.run(store.put("a@example.com", str(i), TTL))
+        self.assertLessEqual(len(store._heap), 2 * len(store) + 65)
+        self.assertEqual(asyncio.run(store.confirm("a@example.com", "999")), "ok")
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            MemoryVerificationStore(maxsize=0)
+
+
+class CreateVerificationStoreTest(unittest.TestCase):
+
+    def test_kinds(self):
+        self.assertIsInstance(create_verification_store("memory"), MemoryVerificationStore)
+        self.assertIsInstance(create_verification_store("database"), SQLVerificationStore)
+        with self.assertRaises(ValueError):
+            create_verification_store("redis")
+
+    def test_interface_is_abstract(self):
+        with self.assertRaises(TypeError):
+            VerificationStore()
+
+
+class ConsumeVerificationCodeTest(unittest.TestCase):
+    """SQLVerificationStore.confirm이 쓰는 DB 메서드"""
+
+    def setUp(self):
+        engine = create_engine("sqlite://")
+        EmailVerification.__table__.create(engine)
+        self.session = sessionmaker(bind=engine)()
+        now = datetime.now()
+        self.session.add_all([
+            EmailVerification(email="a@example.com", code="123456", expires_at=now + TTL),
+            EmailVerification(email="old@example.com", code="123456", expires_at=now - TTL),
+        ])
+        self.session.commit()
+        self.manager = DBManager()
+        self.manager.session = self.session
+
+    def tearDown(self):
+        self.session.close()
+
+    def count(self):
+        return self.session.scalar(select(func.count()).select_from(EmailVerification))
+
+    def test_consume(self):
+        self.assertEqual(self.manager.consume_verification_code("a@example.com", "000000"), "mismatch")
+        self.assertEqual(self.manager.consume_verification_code("a@example.com", "123456"), "ok")
+        self.assertEqual(self.manager.consume_verification_code("a@example.com", "123456"), "missing")
+
+    def test_expired_code_is_deleted(self):
+        self.assertEqual(self.manager.consume_verification_code("old@example.com", "123456"), "expired")
+        self.assertEqual(self.count(), 1)
+
+    def test_purge_expired(self):
+        self.assertEqual(self.manager.purge_expired_verification_codes(), 1)
+        self.assertEqual(self.count(), 1)
+
+
+class SQLVerificationStoreTest(unittest.TestCase):
+    """put은 저장 후 정리 주기가 지났을 때만 만료 코드를 지움"""
+
+    def test_purge_interval(self):
+        manager = mock.AsyncMock()
+        manager.purge_expired_verification_codes.return_value = 0
+        context = mock.MagicMock()
+        context.__aenter__.return_value = manager
+        store = SQLVerificationStore(purge_interval=3600)
+        with mock.patch("service.verification_store.AsyncDBManager", return_value=context):
+            asyncio.run(store.put("a@example.com", "123456", TTL))
+            manager.purge_expired_verification_codes.assert_not_awaited()
+            store._last_purge -= 3600
+            asyncio.run(store.put("a@example.com", "654321", TTL))
+        manager.purge_expired_verification_codes.assert_awaited_once()
+        self.assertEqual(manager.save_verification_code.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+import os
+import sys
+import unittest
+from datetime import date, datetime, time
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+os.environ.setdefault("PROJECT_ROOT", project_root)
+for key, value in {"MYSQL_HOST": "localhost", "MYSQL_PORT": "3306", "MYSQL_DATABASE": "test",
+                   "MYSQL_USER": "test", "MYSQL_PASSWORD": "test", "MYSQL_ROOT_PASSWORD": "test"}.items():
+    os.environ.setdefault(key, value)
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from db.db_manager import DBManager
+from db.tables.food_table import FoodInfo
+from db.tables.user_table import UserInfo, UserAuth, UserBody, SocialLogin, Password, Subscription, UserSchedule, ScheduleFood
+from model.domain.meal_plan import DailyPlan, FoodItem, Meal, NutrientData, WeeklyMealPlan
+
+"""
+주간 식단 저장 테스트 (save_weekly_plan)
+    식단 날짜의 기존 일정 교체, food_id 일괄 조회, 같은 음식의 양 합치기(단위가 섞이면 원문만), 결과 보고,
+    식사 수와 관계없이 쿼리 수 일정, 커밋 한 번 확인
+"""
+
+ZERO = NutrientData(**{field: 0 for field in NutrientData.model_fields})
+
+
+def make_plan(days):
+    """days: {날짜: {시각: [(음식 이름, 양)]}}"""
+    return WeeklyMealPlan(days=[
+        DailyPlan(
+            day=day,
+            nutrients=ZERO,
+            meals=[Meal(time_slot=slot, food_list=[FoodItem(food_name=name, food_amount=amount) for name, amount in foods])
+                   for slot, foods in meals.items()],
+        )
+        for day, meals in days.items()
+    ])
+
+
+class SaveWeeklyPlanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        for table in (FoodInfo, UserInfo, UserAuth, UserBody, SocialLogin, Password, Subscription, UserSchedule, ScheduleFood):
+            table.__table__.create(self.engine)
+        self.session = sessionmaker(bind=self.engine)()
+        self.manager = DBManager()
+        self.manager.session = self.session
+        self.uuid = self.manager.create_user(nickname="테스터", email="tester@example.com", password="pw")
+        self.session.add_all([
+            FoodInfo(food_id="F1", food_name="현미밥", data_type_code="D"),
+            FoodInfo(food_id="F2", food_name="Chicken Breast", data_type_code="D"),
+        ])
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+
+    def stored(self):
+        rows = self.session.execute(
+            select(UserSchedule.datetime, ScheduleFood.food_name, ScheduleFood.food_id, ScheduleFood.quantity,
+                   ScheduleFood.unit, ScheduleFood.amount_text)
+            .join(ScheduleFood, ScheduleFood.meal_id == UserSchedule.meal_id)
+            .order_by(UserSchedule.datetime, ScheduleFood.food_name)
+        ).all()
+        return [tuple(row) for row in rows]
+
+    def test_saves_meals_and_foods(self):
+        result = self.manager.save_weekly_plan(self.uuid, make_plan({
+            date(2026, 3, 2): {
+                time(8): [("현미밥", "210g"), (" Chicken Breast ", "100g")],
+                time(12): [("미역국", "1인분")],
+            },
+        }))
+        self.assertEqual((result.created_meals, result.created_foods, result.deleted_meals), (2, 3, 0))
+        self.assertEqual(result.days, [date(2026, 3, 2)])
+        self.assertEqual(result.unresolved_foods, ["미역국"])
+        self.assertEqual(self.stored(), [
+            (datetime(2026, 3, 2, 8), "Chicken Breast", "F2", 100.0, "g", "100g"),
+            (datetime(2026, 3, 2, 8), "현미밥", "F1", 210.0, "g", "210g"),
+            (datetime(2026, 3, 2, 12), "미역국", None, 1.0, "serving", "1인분"),
+        ])
+
+    def test_same_food_amounts_are_merged(self):
+        result = self.manager.save_weekly_plan(self.uuid, make_plan({
+            date(2026, 3, 2): {
+                time(8): [("현미밥", "300g"), ("현미밥 ", "0.2kg"), ("사과", "1개"), ("사과", "200g")],
+            },
+        }))
+        self.assertEqual(result.created_foods, 2)
+        self.assertEqual(result.unmerged_foods, ["사과"])
+        self.assertEqual(self.stored(), [
+            (datetime(2026, 3, 2, 8), "사과", None, None, None, "1개 + 200g"),
+            (datetime(2026, 3, 2, 8), "현미밥", "F1", 500.0, "g", "300g + 0.2kg"),
+        ])
+
+    def test_replaces_only_plan_days(self):
+        self.manager.save_weekly_plan(self.uuid, make_plan({
+            date(2026, 3, 2): {time(8): [("현미밥", "210g")], time(12): [("현미밥", "210g")]},
+            date(2026, 3, 3): {time(8): [("현미밥", "210g")]},
+        }))
+        result = self.manager.save_weekly_plan(self.uuid, make_plan({
+            date(2026, 3, 2): {time(19): [("미역국", "1인분")]},
+        }))
+        self.assertEqual(result.deleted_meals, 2)
+        self.assertEqual([(row[0], row[1]) for row in self.stored()], [
+            (datetime(2026, 3, 2, 19), "미역국"),
+            (datetime(2026, 3, 3, 8), "현미밥"),
+        ])
+
+    def test_empty_day_clears_schedule(self):
+        self.manager.save_weekly_plan(self.uuid, make_plan({date(2026, 3, 2): {time(8): [("현미밥", "210g")]}}))
+        result = self.manager.save_weekly_plan(self.uuid, make_plan({date(2026, 3, 2): {}}))
+        self.assertEqual((result.deleted_meals, result.created_meals), (1, 0))
+        self.assertEqual(self.stored(), [])
+
+    def test_unknown_user(self):
+        self.assertFalse(self.manager.save_weekly_plan("없는 uuid", make_plan({date(2026, 3, 2): {}})))
+
+    def test_query_count_does_not_grow_with_meals(self):
+        statements = []
+        commits = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        event.listen(self.session, "after_commit", lambda session: commits.append(True))
+
+        self.manager.save_weekly_plan(self.uuid, make_plan({date(2026, 3, 2): {time(8): [("현미밥", "210g")]}}))
+        one = len(statements)
+        statements.clear()
+        self.manager.save_weekly_plan(self.uuid, make_plan({
+            date(2026, 3, day): {time(hour): [("현미밥", "210g"), ("미역국", "1인분")] for hour in (8, 12, 19)}
+            for day in range(2, 9)
+        }))
+        self.assertEqual(len(statements), one)
+        self.assertEqual(len(commits), 2)
+        self.assertEqual(len(self.stored()), 42)
+
+
+if __name__ == "__main__":
+    unittest.main()